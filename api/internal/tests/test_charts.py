@@ -837,7 +837,7 @@ class TestChartQueryRunnerHelperMethods(TestCase):
             ).end_date == datetime.date(timezone.now())
 
 
-@patch("api.shared.permissions.RepositoryPermissionsService.has_read_permissions")
+@patch("api.shared.permissions.RepositoryPermissionsService.readable_repoids")
 class RepositoryCoverageChartTest(InternalAPITest):
     def _retrieve(self, kwargs={}, data={}):
         return self.client.post(
@@ -871,7 +871,7 @@ class RepositoryCoverageChartTest(InternalAPITest):
 
         kwargs = {"owner_username": self.org1.username, "service": "gh"}
 
-        mocked_get_permissions.return_value = False
+        mocked_get_permissions.return_value = set()
         response = self._retrieve(kwargs=kwargs, data=data)
 
         # 404 for security to hide existence of repo
@@ -890,7 +890,7 @@ class RepositoryCoverageChartTest(InternalAPITest):
 
         kwargs = {"owner_username": self.org1.username, "service": "gh"}
 
-        mocked_get_permissions.return_value = True
+        mocked_get_permissions.return_value = {self.repo1_org1.repoid}
         response = self._retrieve(kwargs=kwargs, data=data)
 
         assert response.status_code == 200
@@ -910,7 +910,7 @@ class RepositoryCoverageChartTest(InternalAPITest):
 
         kwargs = {"owner_username": self.org1.username, "service": "gh"}
 
-        mocked_get_permissions.return_value = True
+        mocked_get_permissions.return_value = {self.repo1_org1.repoid}
         response = self._retrieve(kwargs=kwargs, data=data)
 
         assert response.status_code == 200
@@ -930,7 +930,7 @@ class RepositoryCoverageChartTest(InternalAPITest):
 
         kwargs = {"owner_username": self.org1.username, "service": "gh"}
 
-        mocked_get_permissions.return_value = True
+        mocked_get_permissions.return_value = {self.repo1_org1.repoid}
         response = self._retrieve(kwargs=kwargs, data=data)
 
         assert response.status_code == 200
@@ -86,6 +86,51 @@ class TestRepositoryPermissionsService(TestCase):
         owner.refresh_from_db()
         assert repo.repoid in owner.permission
 
+    @patch("services.repo_providers.RepoProviderService.get_adapter")
+    def test_readable_repoids(self, mocked_provider):
+        class Adapter:
+            def __init__(self, can_view):
+                self.can_view = can_view
+
+            async def get_authenticated(self):
+                return self.can_view, False
+
+        owner = OwnerFactory(permission=None)
+        own_repo = RepositoryFactory(author=owner)
+        public_repo = RepositoryFactory(private=False)
+        viewable = [RepositoryFactory(), RepositoryFactory()]
+        hidden = RepositoryFactory()
+        adapters = {repo.repoid: Adapter(True) for repo in viewable}
+        adapters[hidden.repoid] = Adapter(False)
+        mocked_provider.side_effect = lambda owner, repo: adapters[repo.repoid]
+
+        with self.assertNumQueries(1):
+            readable = self.permissions_service.readable_repoids(
+                owner, [own_repo, public_repo, *viewable, hidden]
+            )
+
+        assert readable == {
+            own_repo.repoid,
+            public_repo.repoid,
+            *(repo.repoid for repo in viewable),
+        }
+        assert mocked_provider.call_count == 3
+        owner.refresh_from_db()
+        assert sorted(owner.permission) == sorted(repo.repoid for repo in viewable)
+
+        # stored permissions are used the next time
+        mocked_provider.reset_mock()
+        self.permissions_service.readable_repoids(owner, viewable)
+        assert not mocked_provider.called
+
+    def test_readable_repoids_anonymous(self):
+        public_repo = RepositoryFactory(private=False)
+        private_repo = RepositoryFactory()
+
+        assert self.permissions_service.readable_repoids(
+            None, [public_repo, private_repo]
+        ) == {public_repo.repoid}
+
     def test_user_is_activated_returns_false_if_user_not_in_owner_org(self):
         with self.subTest("user orgs is None"):
             user = OwnerFactory()
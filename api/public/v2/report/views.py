@@ -25,6 +25,12 @@ from codecov_auth.authentication import (
 from core.models import Commit
 from services.components import commit_components
 from services.path import ReportPaths, dashboard_commit_file_url
+from services.report import (
+    build_report_file_from_commit,
+    fetch_commit_ancestors,
+    prefetch_commit_reports,
+    report_file_exists,
+)
 
 
 class ReportMixin:
@@ -310,35 +316,18 @@ class FileReportViewSet(
             raise ValidationError("walk_back must be <= 20")
 
         self.commit = self.get_commit()
-        report = self.commit.full_report
-
         oldest_sha = self.request.query_params.get("oldest_sha")
 
-        for i in range(walk_back):
-            if self._is_valid_commit(self.commit) and self._is_valid_report(
-                report, self.path
-            ):
-                break
-            else:
-                # walk commit ancestors until we find coverage info for the given path
-                if not self.commit.parent_commit_id:
-                    report = None
-                    break
-                self.commit = self.repo.commits.filter(
-                    commitid=self.commit.parent_commit_id
-                ).first()
-                if not self.commit:
-                    report = None
-                    break
-                report = self.commit.full_report
-
-                if oldest_sha and oldest_sha == self.commit.commitid:
-                    break
-
-        if not self._is_valid_report(report, self.path):
+        commit = self._find_commit_with_file(self.commit, walk_back, oldest_sha)
+        if commit is None:
             raise NotFound(f"coverage info not found for path '{self.path}'")
 
-        return report.get(self.path)
+        self.commit = commit
+        report_file = build_report_file_from_commit(self.commit, self.path)
+        if report_file is None:
+            # the report metadata lists the file but its coverage can't be loaded
+            raise NotFound(f"coverage info not found for path '{self.path}'")
+        return report_file
 
     def get_serializer_context(self, *args, **kwargs):
         context = super().get_serializer_context(*args, **kwargs)
@@ -363,15 +352,36 @@ class FileReportViewSet(
         """
         return super().retrieve(request, *args, **kwargs)
 
-    def _is_valid_commit(self, commit: Commit) -> bool:
-        return commit.state == Commit.CommitStates.COMPLETE
-
-    def _is_valid_report(self, report: Report, path: str) -> bool:
-        if report is None:
-            return False
+    def _find_commit_with_file(
+        self, commit: Commit, walk_back: int, oldest_sha: Optional[str]
+    ) -> Optional[Commit]:
+        """
+        Walks up to `walk_back` ancestors of `commit` until we find a complete commit
+        with coverage info for `self.path`. The last commit we walk to (either
+        because `walk_back` is exhausted or because it's the `oldest_sha`) only
+        needs to have coverage info for the path.
 
-        report_file = report.get(path)
-        if report_file is None:
-            return False
+        The ancestors are fetched with a single query the first time we need to
+        walk back, and file presence is checked without building the full reports.
+        """
+        ancestors = None
+        for depth in range(walk_back + 1):
+            if depth == 0:
+                current = commit
+            else:
+                if ancestors is None:
+                    ancestors = fetch_commit_ancestors(commit, walk_back)
+                    prefetch_commit_reports(ancestors)
+                if depth > len(ancestors):
+                    # no parent or parent not found
+                    return None
+                current = ancestors[depth - 1]
+
+            has_file = report_file_exists(current, self.path)
+            if depth == walk_back or (depth > 0 and current.commitid == oldest_sha):
+                return current if has_file else None
+            if self._is_valid_commit(current) and has_file:
+                return current
 
-        return True
+    def _is_valid_commit(self, commit: Commit) -> bool:
+        return commit.state == Commit.CommitStates.COMPLETE
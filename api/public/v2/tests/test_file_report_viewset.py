@@ -359,3 +359,22 @@ class FileReportViewSetTestCase(TestCase):
         assert res.status_code == 404
 
         build_report_from_commit.assert_has_calls([call(self.commit3)])
+
+    @patch("api.public.v2.report.views.build_report_file_from_commit")
+    @patch("api.public.v2.report.views.report_file_exists")
+    def test_file_report_unloadable_file(
+        self, report_file_exists, build_report_file_from_commit, get_repo_permissions
+    ):
+        get_repo_permissions.return_value = (True, True)
+        report_file_exists.return_value = True
+        build_report_file_from_commit.return_value = None
+
+        res = self._request_file_report(path="foo/file1.py")
+        assert res.status_code == 404
+        assert res.json() == {
+            "detail": "coverage info not found for path 'foo/file1.py'"
+        }
+
+        build_report_file_from_commit.assert_called_once_with(
+            self.commit3, "foo/file1.py"
+        )
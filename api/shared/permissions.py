@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Tuple
+from typing import Any, Iterable, Set, Tuple
 
 from asgiref.sync import async_to_sync
 from django.conf import settings
@@ -35,6 +35,43 @@ class RepositoryPermissionsService:
 
         return can_view, can_edit
 
+    @torngit_safe
+    def readable_repoids(self, owner: Owner, repos: Iterable[Repository]) -> Set[int]:
+        """
+        Batched `has_read_permissions`: the ids of the given repos the owner can
+        read. Repos whose permissions aren't stored are checked with the provider
+        concurrently and the new permissions are saved in a single update.
+        """
+        readable, unknown = set(), []
+        for repo in repos:
+            if (
+                not repo.private
+                or owner is not None
+                and (
+                    repo.author_id == owner.ownerid
+                    or owner.permission
+                    and repo.repoid in owner.permission
+                )
+            ):
+                readable.add(repo.repoid)
+            elif owner is not None:
+                unknown.append(repo)
+
+        if unknown:
+            permissions = RepoAccessors().get_repos_permissions(owner, unknown)
+            granted = [
+                repo.repoid
+                for repo, (can_view, _) in zip(unknown, permissions)
+                if can_view
+            ]
+            if granted:
+                owner.permission = owner.permission or []
+                owner.permission.extend(granted)
+                owner.save(update_fields=["permission"])
+                readable.update(granted)
+
+        return readable
+
     def has_read_permissions(self, owner: Owner, repo: Repository) -> bool:
         return not repo.private or (
             owner is not None
@@ -129,14 +166,12 @@ class ChartPermissions(BasePermission):
             f"Coverage chart has repositories {view.repositories}",
             extra=dict(user=request.current_owner),
         )
-        for repo in view.repositories:
-            # TODO: this can cause a provider-api request for every repo in the list,
-            # can we just rely on our stored read permissions? In fact, it seems like
-            # permissioning is built into api.internal.charts.filter.add_simple_filters
-            if not self.permissions_service.has_read_permissions(
-                request.current_owner, repo
-            ):
-                raise Http404
+        repositories = list(view.repositories)
+        readable = self.permissions_service.readable_repoids(
+            request.current_owner, repositories
+        )
+        if any(repo.repoid not in readable for repo in repositories):
+            raise Http404
         return True
 
 
@@ -34,6 +34,34 @@ class RepoAccessors:
             RepoProviderService().get_adapter(owner=user, repo=repo).get_authenticated
         )()
 
+    def get_repos_permissions(self, user, repos, max_concurrency=10):
+        """
+        Returns repo permissions information from the provider for each of the
+        given repos (in the same order), with at most `max_concurrency` requests
+        to the provider in flight at once.
+        """
+        adapters = [
+            None
+            if repo.author_id == user.ownerid
+            else RepoProviderService().get_adapter(owner=user, repo=repo)
+            for repo in repos
+        ]
+
+        async def get_all_permissions():
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def get_permissions(adapter):
+                if adapter is None:
+                    return True, True
+                async with semaphore:
+                    return await adapter.get_authenticated()
+
+            return await asyncio.gather(
+                *[get_permissions(adapter) for adapter in adapters]
+            )
+
+        return async_to_sync(get_all_permissions)()
+
     def get_repo_details(
         self, user, repo_name, repo_owner_username, repo_owner_service
     ):
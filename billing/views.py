@@ -7,6 +7,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from codecov_auth.authentication.token_cache import invalidate_token_lookups
 from codecov_auth.models import Owner
 from plan.service import PlanService
 from services.billing import BillingService
@@ -76,6 +77,7 @@ class StripeWebhookHandler(APIView):
         plan_service = PlanService(current_org=owner)
         plan_service.set_default_plan_data()
         owner.repository_set.update(active=False, activated=False)
+        invalidate_token_lookups(owner)
 
         self._log_updated(1)
 
@@ -239,6 +241,7 @@ class StripeWebhookHandler(APIView):
                 # TODO: think of how to create services for different objects/classes to delegate responsibilities that are not
                 # from the owner
                 owner.repository_set.update(active=False, activated=False)
+                invalidate_token_lookups(owner)
                 return
 
             sub_item_plan_id = subscription.plan.id
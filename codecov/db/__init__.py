@@ -4,6 +4,7 @@ from asgiref.sync import SyncToAsync
 from django.conf import settings
 from django.db import close_old_connections
 from django.db.models import Field, Lookup
+from django.db.models.lookups import IContains
 
 log = logging.getLogger(__name__)
 
@@ -71,6 +72,22 @@ class IsNot(Lookup):
         return "%s is not %s" % (lhs, rhs), params
 
 
+@Field.register_lookup
+class ILike(IContains):
+    """
+    Same as `icontains` but compiled to `ILIKE` instead of `UPPER(...) LIKE
+    UPPER(...)` so that a trigram (pg_trgm) index on the column can be used.
+    """
+
+    lookup_name = "ilike"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        params = tuple(lhs_params) + tuple(rhs_params)
+        return "%s ILIKE %s" % (lhs, rhs), params
+
+
 class DatabaseSyncToAsync(SyncToAsync):
     """
     SyncToAsync version that cleans up old database connections.
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from urllib.parse import urlparse
 
 import sentry_sdk
@@ -146,6 +147,17 @@ TIMESERIES_ENABLED = get_config("setup", "timeseries", "enabled", default=False)
 TIMESERIES_REAL_TIME_AGGREGATES = get_config(
     "setup", "timeseries", "real_time_aggregates", default=False
 )
+# closed bins of coverage charts cached in Redis
+TIMESERIES_CACHE_ENABLED = get_config(
+    "setup", "timeseries", "cache_enabled", default=False
+)
+# how long (in seconds) closed bins of coverage charts are cached for
+TIMESERIES_CACHE_TTL = get_config("setup", "timeseries", "cache_ttl", default=3600)
+# bins overlapping the last `cache_recent_window` seconds are never cached since
+# measurements of recently uploaded commits may still be written to them
+TIMESERIES_CACHE_RECENT_WINDOW = get_config(
+    "setup", "timeseries", "cache_recent_window", default=86400
+)
 
 timeseries_database_url = get_config("services", "timeseries_database_url")
 if timeseries_database_url:
@@ -539,6 +551,114 @@ SHELTER_SHARED_SECRET = get_config("setup", "shelter_shared_secret", default=Non
 # TODO: we can eventually get rid of this once it's confirmed working well for many repos
 REPORT_BUILDER_REPO_IDS = get_config("setup", "report_builder", "repo_ids", default=[])
 
+# cache of downloaded report chunks, keyed by repo/commit and chunks version
+REPORT_CACHE_ENABLED = get_config("setup", "report_cache", "enabled", default=False)
+# max size (in bytes) of the process-local tier
+REPORT_CACHE_MAX_SIZE = get_config(
+    "setup", "report_cache", "max_size", default=256 * 1024 * 1024
+)
+# optional redis tier shared between API pods
+REPORT_CACHE_REDIS_ENABLED = get_config(
+    "setup", "report_cache", "redis_enabled", default=False
+)
+REPORT_CACHE_REDIS_TTL = get_config("setup", "report_cache", "redis_ttl", default=3600)
+# max number of files across the cached directory trees of reports
+REPORT_CACHE_PATH_TREE_MAX_FILES = get_config(
+    "setup", "report_cache", "path_tree_max_files", default=1_000_000
+)
+
+# process-local cache of parsed worker-computed comparisons
+COMPARISON_REPORT_CACHE_ENABLED = get_config(
+    "setup", "comparison_report_cache", "enabled", default=False
+)
+# max size (in bytes of raw JSON) of that cache
+COMPARISON_REPORT_CACHE_MAX_SIZE = get_config(
+    "setup", "comparison_report_cache", "max_size", default=64 * 1024 * 1024
+)
+
+# redis cache of rendered badges and graphs
+GRAPH_CACHE_ENABLED = get_config("setup", "graph_cache", "enabled", default=False)
+# how long (in seconds) rendered responses are served for a given URL without
+# looking up the branch's head commit again
+GRAPH_CACHE_RESPONSE_TTL = get_config(
+    "setup", "graph_cache", "response_ttl", default=60
+)
+# how long (in seconds) things rendered from a given version of a commit's
+# report are cached for
+GRAPH_CACHE_TTL = get_config("setup", "graph_cache", "ttl", default=86400)
+
+# cache of the YAML files fetched from the provider for commits
+COMMIT_YAML_CACHE_ENABLED = get_config(
+    "setup", "commit_yaml_cache", "enabled", default=False
+)
+# max size (in bytes) of the process-local tier
+COMMIT_YAML_CACHE_MAX_SIZE = get_config(
+    "setup", "commit_yaml_cache", "max_size", default=16 * 1024 * 1024
+)
+COMMIT_YAML_CACHE_TTL = get_config("setup", "commit_yaml_cache", "ttl", default=86400)
+# optional redis tier shared between API pods
+COMMIT_YAML_CACHE_REDIS_ENABLED = get_config(
+    "setup", "commit_yaml_cache", "redis_enabled", default=False
+)
+
+# process-local cache of the repositories/owners that upload tokens resolve to
+TOKEN_LOOKUP_CACHE_ENABLED = get_config(
+    "setup", "token_lookup_cache", "enabled", default=False
+)
+TOKEN_LOOKUP_CACHE_MAX_ENTRIES = get_config(
+    "setup", "token_lookup_cache", "max_entries", default=10_000
+)
+# how long (in seconds) lookups are cached for
+TOKEN_LOOKUP_CACHE_TTL = get_config("setup", "token_lookup_cache", "ttl", default=300)
+
+# short-lived cache of tokenless upload verifications with the CI providers
+TOKENLESS_VERIFICATION_CACHE_ENABLED = get_config(
+    "setup", "tokenless_verification_cache", "enabled", default=False
+)
+# how long (in seconds) verifications, successful or not, are cached for
+TOKENLESS_VERIFICATION_CACHE_TTL = get_config(
+    "setup", "tokenless_verification_cache", "ttl", default=60
+)
+# how long (in seconds) concurrent uploads of a build wait for its verification
+TOKENLESS_VERIFICATION_CACHE_LOCK_TIMEOUT = get_config(
+    "setup", "tokenless_verification_cache", "lock_timeout", default=10
+)
+
+# disk cache of the bundle analysis SQLite reports downloaded from storage
+BUNDLE_REPORT_CACHE_ENABLED = get_config(
+    "setup", "bundle_report_cache", "enabled", default=False
+)
+BUNDLE_REPORT_CACHE_DIR = get_config(
+    "setup",
+    "bundle_report_cache",
+    "directory",
+    default=os.path.join(tempfile.gettempdir(), "bundle_report_cache"),
+)
+# max total size (in bytes) of the cached files
+BUNDLE_REPORT_CACHE_MAX_SIZE = get_config(
+    "setup", "bundle_report_cache", "max_size", default=1024 * 1024 * 1024
+)
+
+# `totalCount` of GraphQL connections
+GRAPHQL_COUNT_CACHE_ENABLED = get_config(
+    "setup", "graphql", "count_cache", "enabled", default=False
+)
+# how long (in seconds) counts are cached for
+GRAPHQL_COUNT_CACHE_TTL = get_config(
+    "setup", "graphql", "count_cache", "ttl", default=60
+)
+# connections the planner expects to have at least this many rows get the
+# planner's estimate instead of an exact count (disabled when unset)
+GRAPHQL_COUNT_ESTIMATE_THRESHOLD = get_config(
+    "setup", "graphql", "count_estimate_threshold", default=None
+)
+
+# build single-file reports from that file's chunk only instead of parsing the
+# whole report
+REPORT_CHUNKS_INDEX_ENABLED = get_config(
+    "setup", "report_chunks_index", "enabled", default=False
+)
+
 SENTRY_ENV = os.environ.get("CODECOV_ENV", False)
 SENTRY_DSN = os.environ.get("SERVICES__SENTRY__SERVER_DSN", None)
 SENTRY_DENY_LIST = DEFAULT_DENYLIST + ["_headers", "token_to_use"]
@@ -16,10 +16,14 @@ from sentry_sdk import metrics as sentry_metrics
 from shared.metrics import metrics
 from shared.torngit.exceptions import TorngitObjectNotFoundError, TorngitRateLimitError
 
+from codecov_auth.authentication.token_cache import (
+    org_level_token_by_token,
+    repository_by_upload_token,
+    repository_token_by_key,
+)
 from codecov_auth.authentication.types import RepositoryAsUser, RepositoryAuthInterface
 from codecov_auth.models import (
     OrganizationLevelToken,
-    RepositoryToken,
     Service,
     TokenTypeChoices,
 )
@@ -132,9 +136,8 @@ class RepositoryLegacyQueryTokenAuthentication(authentication.BaseAuthentication
             token = UUID(token)
         except ValueError:
             return None
-        try:
-            repository = Repository.objects.get(upload_token=token)
-        except Repository.DoesNotExist:
+        repository = repository_by_upload_token(token)
+        if repository is None:
             return None
         return (
             RepositoryAsUser(repository),
@@ -146,8 +149,10 @@ class RepositoryLegacyTokenAuthentication(authentication.TokenAuthentication):
     def authenticate_credentials(self, token):
         try:
             token = UUID(token)
-            repository = Repository.objects.get(upload_token=token)
-        except (ValueError, TypeError, Repository.DoesNotExist):
+        except (ValueError, TypeError):
+            return None  # continue to next auth class
+        repository = repository_by_upload_token(token)
+        if repository is None:
             return None  # continue to next auth class
         return (
             RepositoryAsUser(repository),
@@ -159,9 +164,8 @@ class RepositoryTokenAuthentication(authentication.TokenAuthentication):
     keyword = "Repotoken"
 
     def authenticate_credentials(self, key):
-        try:
-            token = RepositoryToken.objects.select_related("repository").get(key=key)
-        except RepositoryToken.DoesNotExist:
+        token = repository_token_by_key(key)
+        if token is None:
             raise exceptions.AuthenticationFailed("Invalid token.")
 
         if not token.repository.active:
@@ -218,7 +222,7 @@ class OrgLevelTokenAuthentication(authentication.TokenAuthentication):
     def authenticate_credentials(self, key):
         if is_uuid(key):  # else, continue to next auth class
             # Actual verification for org level tokens
-            token = OrganizationLevelToken.objects.filter(token=key).first()
+            token = org_level_token_by_token(key)
 
             if token is None:
                 return None
@@ -0,0 +1,189 @@
+import logging
+import pickle
+import threading
+import time
+from typing import Callable, Hashable, List, Optional, Type
+
+from django.conf import settings
+from django.db.models import Model
+from redis.exceptions import RedisError
+from shared.metrics import metrics
+
+from codecov_auth.models import OrganizationLevelToken, Owner, RepositoryToken
+from core.models import Repository
+from services.redis_configuration import get_redis_connection
+from services.report_cache import SizeBoundedLRUCache
+
+log = logging.getLogger(__name__)
+
+
+class TokenLookupCache:
+    """
+    Process-local TTL + LRU cache of the rows that upload tokens resolve to.
+
+    Cached rows are pickled so that every hit returns its own instances (callers
+    mutate and save the repository during uploads). Every entry is tagged with
+    the rows it was built from (see `_tags`) and remembers their versions in
+    Redis. Invalidating a row bumps its version, so every process drops the
+    entries built from it before using them again while the other entries stay
+    cached. Changes made outside of the API (by the worker) are only picked up
+    when entries expire.
+    """
+
+    version_key_prefix = "token_lookup_cache/version"
+
+    def __init__(self, max_entries: int, ttl: int):
+        self.ttl = ttl
+        self.local = SizeBoundedLRUCache(max_entries, sizeof=lambda _: 1)
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable):
+        entry = self.local.get(key)
+        if entry is not None:
+            expires_at, tags, versions, data = entry
+            if expires_at > time.monotonic():
+                current_versions = self._versions(tags)
+                if current_versions is None:
+                    # can't tell whether the entry was invalidated
+                    return fetch()
+                if current_versions == versions:
+                    metrics.incr("codecov_auth.token_lookup_cache.hit")
+                    return pickle.loads(data)
+            self.local.delete(key)
+
+        metrics.incr("codecov_auth.token_lookup_cache.miss")
+        value = fetch()
+        if value is not None:
+            tags = _tags(value)
+            versions = self._versions(tags)
+            if versions is not None:
+                self.local.set(
+                    key,
+                    (time.monotonic() + self.ttl, tags, versions, pickle.dumps(value)),
+                )
+        return value
+
+    def invalidate(self, tags: List[str]) -> None:
+        try:
+            pipeline = get_redis_connection().pipeline()
+            for tag in tags:
+                pipeline.incr(self._version_key(tag))
+                # a version may only disappear once every entry that saw it expired
+                pipeline.expire(self._version_key(tag), 2 * self.ttl)
+            pipeline.execute()
+        except RedisError:
+            log.warning("Error invalidating token lookup cache", exc_info=True)
+
+    def _version_key(self, tag: str) -> str:
+        return f"{self.version_key_prefix}/{tag}"
+
+    def _versions(self, tags: List[str]) -> Optional[List[Optional[bytes]]]:
+        try:
+            return get_redis_connection().mget([self._version_key(tag) for tag in tags])
+        except RedisError:
+            log.warning("Error fetching token lookup cache versions", exc_info=True)
+            return None
+
+
+def _tag(model: Type[Model], pk) -> str:
+    return f"{model._meta.label_lower}/{pk}"
+
+
+def _tags(value: Model) -> List[str]:
+    """
+    The rows a cached lookup result was built from.
+    """
+    if isinstance(value, Repository):
+        return [_tag(Repository, value.pk), _tag(Owner, value.author_id)]
+    if isinstance(value, RepositoryToken):
+        return [
+            _tag(RepositoryToken, value.pk),
+            _tag(Repository, value.repository_id),
+            _tag(Owner, value.repository.author_id),
+        ]
+    if isinstance(value, OrganizationLevelToken):
+        return [_tag(OrganizationLevelToken, value.pk), _tag(Owner, value.owner_id)]
+    raise TypeError(f"Unexpected token lookup result {type(value)}")
+
+
+_token_lookup_cache = None
+_token_lookup_cache_lock = threading.Lock()
+
+
+def get_token_lookup_cache() -> Optional[TokenLookupCache]:
+    """
+    Returns the process-wide token lookup cache, or `None` if it is disabled.
+    """
+    global _token_lookup_cache
+
+    if not settings.TOKEN_LOOKUP_CACHE_ENABLED:
+        return None
+
+    if _token_lookup_cache is None:
+        with _token_lookup_cache_lock:
+            if _token_lookup_cache is None:
+                _token_lookup_cache = TokenLookupCache(
+                    max_entries=settings.TOKEN_LOOKUP_CACHE_MAX_ENTRIES,
+                    ttl=settings.TOKEN_LOOKUP_CACHE_TTL,
+                )
+    return _token_lookup_cache
+
+
+def _cached(key: Hashable, fetch: Callable):
+    cache = get_token_lookup_cache()
+    if cache is None:
+        return fetch()
+    return cache.get_or_fetch(key, fetch)
+
+
+def invalidate_token_lookups(*instances: Model) -> None:
+    """
+    Drops the cached token lookups built from the given repositories, owners or
+    tokens. Called whenever one of them changes.
+    """
+    cache = get_token_lookup_cache()
+    if cache is not None:
+        cache.invalidate([_tag(type(instance), instance.pk) for instance in instances])
+
+
+def repository_by_upload_token(token) -> Optional[Repository]:
+    def fetch():
+        return (
+            Repository.objects.select_related("author")
+            .filter(upload_token=token)
+            .first()
+        )
+
+    return _cached(("upload_token", str(token)), fetch)
+
+
+def repository_by_slug(service: str, owner_username: str, name: str):
+    def fetch():
+        return (
+            Repository.objects.select_related("author")
+            .filter(author__service=service, author__username=owner_username, name=name)
+            .first()
+        )
+
+    return _cached(("slug", service, owner_username, name), fetch)
+
+
+def repository_token_by_key(key: str) -> Optional[RepositoryToken]:
+    def fetch():
+        return (
+            RepositoryToken.objects.select_related("repository__author")
+            .filter(key=key)
+            .first()
+        )
+
+    return _cached(("repository_token", key), fetch)
+
+
+def org_level_token_by_token(token: str) -> Optional[OrganizationLevelToken]:
+    def fetch():
+        return (
+            OrganizationLevelToken.objects.select_related("owner")
+            .filter(token=token)
+            .first()
+        )
+
+    return _cached(("org_level_token", str(token)), fetch)
@@ -3,11 +3,17 @@ import logging
 from datetime import datetime
 
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from google.cloud import pubsub_v1
 
-from codecov_auth.models import OrganizationLevelToken, Owner, OwnerProfile
+from codecov_auth.authentication.token_cache import invalidate_token_lookups
+from codecov_auth.models import (
+    OrganizationLevelToken,
+    Owner,
+    OwnerProfile,
+    RepositoryToken,
+)
 
 
 @receiver(post_save, sender=Owner)
@@ -47,3 +53,26 @@ def update_repository(sender, instance: OrganizationLevelToken, **kwargs):
                 }
             ).encode("utf-8"),
         )
+
+
+@receiver(post_save, sender=RepositoryToken, dispatch_uid="token_lookups_repo_token")
+@receiver(
+    post_delete, sender=RepositoryToken, dispatch_uid="token_lookups_repo_token_deleted"
+)
+@receiver(
+    post_save, sender=OrganizationLevelToken, dispatch_uid="token_lookups_org_token"
+)
+@receiver(
+    post_delete,
+    sender=OrganizationLevelToken,
+    dispatch_uid="token_lookups_org_token_deleted",
+)
+def invalidate_upload_token_lookups(sender, instance, **kwargs):
+    invalidate_token_lookups(instance)
+
+
+@receiver(post_save, sender=Owner, dispatch_uid="token_lookups_owner_saved")
+@receiver(post_delete, sender=Owner, dispatch_uid="token_lookups_owner_deleted")
+def invalidate_owner_token_lookups(sender, instance: Owner, **kwargs):
+    # the owner might have been renamed or changed plans
+    invalidate_token_lookups(instance)
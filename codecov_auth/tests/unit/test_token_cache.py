@@ -0,0 +1,126 @@
+import uuid
+
+import pytest
+from django.test import override_settings
+
+from codecov_auth.authentication import token_cache
+from codecov_auth.authentication.token_cache import (
+    TokenLookupCache,
+    invalidate_token_lookups,
+    repository_by_upload_token,
+    repository_token_by_key,
+)
+from core.models import Repository
+from core.tests.factories import RepositoryFactory, RepositoryTokenFactory
+
+
+@pytest.fixture
+def lookup_cache(mocker, mock_redis):
+    mocker.patch.object(token_cache, "_token_lookup_cache", None)
+    with override_settings(TOKEN_LOOKUP_CACHE_ENABLED=True):
+        yield token_cache.get_token_lookup_cache()
+
+
+def test_repository_by_upload_token_cached(db, lookup_cache, django_assert_num_queries):
+    repo = RepositoryFactory()
+
+    with django_assert_num_queries(1):
+        first = repository_by_upload_token(repo.upload_token)
+        second = repository_by_upload_token(repo.upload_token)
+
+    assert first == second == repo
+    # every hit gets its own instance
+    assert first is not second
+    assert second.author == repo.author
+
+
+def test_misses_are_not_cached(db, lookup_cache):
+    token = uuid.uuid4()
+    assert repository_by_upload_token(token) is None
+
+    repo = RepositoryFactory(upload_token=token)
+    assert repository_by_upload_token(token) == repo
+
+
+def test_regenerating_upload_token_invalidates(db, lookup_cache):
+    repo = RepositoryFactory()
+    old_token = repo.upload_token
+    assert repository_by_upload_token(old_token) == repo
+
+    repo.upload_token = uuid.uuid4()
+    repo.save()
+
+    assert repository_by_upload_token(old_token) is None
+    assert repository_by_upload_token(repo.upload_token) == repo
+
+
+def test_regenerating_repository_token_invalidates(db, lookup_cache):
+    token = RepositoryTokenFactory()
+    old_key = token.key
+    assert repository_token_by_key(old_key) == token
+
+    token.key = token.generate_key()
+    token.save()
+
+    assert repository_token_by_key(old_key) is None
+
+
+def test_invalidation_from_another_process(db, lookup_cache, mock_redis):
+    repo = RepositoryFactory()
+    assert repository_by_upload_token(repo.upload_token) == repo
+
+    other_process_cache = TokenLookupCache(max_entries=10, ttl=300)
+    other_process_cache.invalidate([f"core.repository/{repo.pk}"])
+    Repository.objects.filter(pk=repo.pk).update(upload_token=uuid.uuid4())
+
+    assert repository_by_upload_token(repo.upload_token) is None
+    assert len(lookup_cache.local) == 0
+
+
+def test_invalidation_is_per_repository(db, lookup_cache, django_assert_num_queries):
+    repo = RepositoryFactory()
+    other_repo = RepositoryFactory()
+    repository_by_upload_token(repo.upload_token)
+    repository_by_upload_token(other_repo.upload_token)
+
+    repo.name = "renamed"
+    repo.save()
+
+    with django_assert_num_queries(1):
+        assert repository_by_upload_token(repo.upload_token).name == "renamed"
+        assert repository_by_upload_token(other_repo.upload_token) == other_repo
+
+
+def test_owner_changes_invalidate(db, lookup_cache):
+    repo = RepositoryFactory()
+    assert (
+        repository_by_upload_token(repo.upload_token).author.plan != "users-pr-inappm"
+    )
+
+    repo.author.plan = "users-pr-inappm"
+    repo.author.save()
+
+    assert (
+        repository_by_upload_token(repo.upload_token).author.plan == "users-pr-inappm"
+    )
+
+
+def test_bulk_updates_invalidate_through_owner(db, lookup_cache):
+    repo = RepositoryFactory(using_integration=True)
+    assert repository_by_upload_token(repo.upload_token).using_integration
+
+    repo.author.repository_set.all().update(using_integration=False)
+    invalidate_token_lookups(repo.author)
+
+    assert not repository_by_upload_token(repo.upload_token).using_integration
+
+
+def test_expired_entries_are_refetched(db, lookup_cache, mocker):
+    repo = RepositoryFactory()
+    assert repository_by_upload_token(repo.upload_token) == repo
+
+    monotonic = mocker.patch("codecov_auth.authentication.token_cache.time.monotonic")
+    monotonic.return_value = 10**9
+    Repository.objects.filter(pk=repo.pk).update(name="renamed")
+
+    assert repository_by_upload_token(repo.upload_token).name == "renamed"
@@ -1,7 +1,10 @@
 from codecov.commands.base import BaseCommand
 from services.comparison import Comparison, ComparisonReport
 
-from .interactors.fetch_impacted_files import FetchImpactedFiles
+from .interactors.fetch_impacted_files import (
+    FetchImpactedFiles,
+    FetchImpactedFilesPage,
+)
 
 
 class CompareCommands(BaseCommand):
@@ -14,3 +17,15 @@ class CompareCommands(BaseCommand):
         return self.get_interactor(FetchImpactedFiles).execute(
             comparison_report, comparison, filters
         )
+
+    def fetch_impacted_files_page(
+        self,
+        comparison_report: ComparisonReport,
+        comparison: Comparison,
+        filters,
+        first=None,
+        after=None,
+    ):
+        return self.get_interactor(FetchImpactedFilesPage).execute(
+            comparison_report, comparison, filters, first=first, after=after
+        )
@@ -1,12 +1,23 @@
 import enum
+from base64 import b64decode, b64encode
+from dataclasses import dataclass
 from typing import List, Optional
 
 from shared.utils.match import match
 
 import services.components as components
 from codecov.commands.base import BaseInteractor
-from services.comparison import Comparison, ComparisonReport, ImpactedFile
-from services.report import files_belonging_to_flags, files_in_sessions
+from services.comparison import (
+    Comparison,
+    ComparisonReport,
+    ImpactedFile,
+    ImpactedFileSummary,
+)
+from services.report import (
+    file_session_bitmaps,
+    sessions_bitmap,
+    sessions_with_specific_flags,
+)
 
 
 class ImpactedFileParameter(enum.Enum):
@@ -17,22 +28,50 @@ class ImpactedFileParameter(enum.Enum):
     PATCH_COVERAGE = "patch_coverage"
 
 
+@dataclass
+class ImpactedFilesPage:
+    results: List[ImpactedFile]
+    total_count: int
+    page_info: dict
+
+
+def _encode_cursor(position: int) -> str:
+    return b64encode(str(position).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> int:
+    try:
+        return int(b64decode(cursor.encode()).decode())
+    except ValueError:
+        raise ValueError(f"invalid cursor: {cursor}")
+
+
 class FetchImpactedFiles(BaseInteractor):
+    """
+    Filters and sorts the impacted files of a comparison.
+
+    The work is done over the positions of the files in the comparison and
+    their `ImpactedFileSummary`s, so only the returned files are created.
+    """
+
     def _apply_filters(
         self,
-        impacted_files: Optional[List[ImpactedFile]],
+        comparison_report: ComparisonReport,
+        positions: List[int],
         comparison: Comparison,
         filters,
-    ):
+    ) -> List[int]:
+        summaries = comparison_report.summaries
+
         parameter = filters.get("ordering", {}).get("parameter")
         direction = filters.get("ordering", {}).get("direction")
         if parameter and direction:
-            impacted_files = self.sort_impacted_files(
-                impacted_files, parameter, direction
+            positions = self.sort_impacted_files(
+                summaries, positions, parameter, direction
             )
 
         if not comparison:
-            return impacted_files
+            return positions
 
         flags_filter = filters.get("flags", [])
         components_filter = filters.get("components", [])
@@ -63,84 +102,136 @@ class FetchImpactedFiles(BaseInteractor):
 
         if flags_filter:
             if set(flags_filter) & set(head_commit_report.flags):
-                files = files_belonging_to_flags(
-                    commit_report=head_commit_report, flags=flags_filter
+                # only the impacted files are matched against the flags' sessions
+                mask = sessions_bitmap(
+                    sessions_with_specific_flags(
+                        commit_report=head_commit_report, flags=flags_filter
+                    )
                 )
-
-                impacted_files = [
-                    file for file in impacted_files if file.head_name in files
+                bitmaps = file_session_bitmaps(
+                    head_commit_report,
+                    paths=[summaries[idx].head_name for idx in positions],
+                )
+                positions = [
+                    idx
+                    for idx in positions
+                    if bitmaps.get(summaries[idx].head_name, 0) & mask
                 ]
 
-        res = impacted_files
-
         if components_paths:
-            res = [
-                file
-                for file in impacted_files
-                if match(components_paths, file.head_name)
+            positions = [
+                idx
+                for idx in positions
+                if match(components_paths, summaries[idx].head_name)
             ]
-        return res
+        return positions
 
     def get_attribute(
-        self, impacted_file: ImpactedFile, parameter: ImpactedFileParameter
+        self, summary: ImpactedFileSummary, parameter: ImpactedFileParameter
     ):
         if parameter == ImpactedFileParameter.FILE_NAME:
-            return impacted_file.file_name
+            return summary.file_name
         elif parameter == ImpactedFileParameter.CHANGE_COVERAGE:
-            return impacted_file.change_coverage
+            return summary.change_coverage
         elif parameter == ImpactedFileParameter.HEAD_COVERAGE:
-            if impacted_file.head_coverage is not None:
-                return impacted_file.head_coverage.coverage
+            return summary.head_coverage
         elif parameter == ImpactedFileParameter.MISSES_COUNT:
-            if impacted_file.misses_count is not None:
-                return impacted_file.misses_count
+            return summary.misses_count
         elif parameter == ImpactedFileParameter.PATCH_COVERAGE:
-            if impacted_file.patch_coverage is not None:
-                return impacted_file.patch_coverage.coverage
+            return summary.patch_coverage
         else:
             raise ValueError(f"invalid impacted file parameter: {parameter}")
 
-    def sort_impacted_files(self, impacted_files, parameter, direction):
+    def sort_impacted_files(self, summaries, positions, parameter, direction):
         """
         Sorts the impacted files by any provided parameter and slides items with None values to the end
         """
+        # every sort key is computed once
+        keys = {idx: self.get_attribute(summaries[idx], parameter) for idx in positions}
+
         # Separate impacted files with None values for the specified parameter value
-        files_with_coverage = []
-        files_without_coverage = []
-        for file in impacted_files:
-            if self.get_attribute(file, parameter) is not None:
-                files_with_coverage.append(file)
-            else:
-                files_without_coverage.append(file)
+        files_with_coverage = [idx for idx in positions if keys[idx] is not None]
+        files_without_coverage = [idx for idx in positions if keys[idx] is None]
 
         # Sort impacted_files list based on parameter value
         is_reversed = direction.value == "descending"
         files_with_coverage = sorted(
-            files_with_coverage,
-            key=lambda x: self.get_attribute(x, parameter),
-            reverse=is_reversed,
+            files_with_coverage, key=keys.__getitem__, reverse=is_reversed
         )
 
         # Merge both lists together
         return files_with_coverage + files_without_coverage
 
-    def execute(
+    def filtered_positions(
         self,
         comparison_report: ComparisonReport,
         comparison: Comparison,
         filters,
-    ):
-        if filters is None:
-            return comparison_report.impacted_files
-
+    ) -> List[int]:
         has_unintended_changes = filters.get("has_unintended_changes")
         if has_unintended_changes is not None:
-            impacted_files = (
-                comparison_report.impacted_files_with_unintended_changes
+            positions = (
+                comparison_report.unintended_changes_positions
                 if has_unintended_changes
-                else comparison_report.impacted_files_with_direct_changes
+                else comparison_report.direct_changes_positions
             )
         else:
-            impacted_files = comparison_report.impacted_files
+            positions = list(range(len(comparison_report.summaries)))
+
+        return self._apply_filters(comparison_report, positions, comparison, filters)
 
-        return self._apply_filters(impacted_files, comparison, filters)
+    def execute(
+        self,
+        comparison_report: ComparisonReport,
+        comparison: Comparison,
+        filters,
+    ):
+        if filters is None:
+            return comparison_report.impacted_files
+
+        positions = self.filtered_positions(comparison_report, comparison, filters)
+        return comparison_report.impacted_files_at(positions)
+
+
+class FetchImpactedFilesPage(FetchImpactedFiles):
+    """
+    A page of the filtered and sorted impacted files, the cursors being the
+    positions of the files in the comparison.
+    """
+
+    def execute(
+        self,
+        comparison_report: ComparisonReport,
+        comparison: Comparison,
+        filters,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> ImpactedFilesPage:
+        positions = self.filtered_positions(
+            comparison_report, comparison, filters or {}
+        )
+
+        start = 0
+        if after is not None:
+            after_position = _decode_cursor(after)
+            start = next(
+                (
+                    offset + 1
+                    for offset, idx in enumerate(positions)
+                    if idx == after_position
+                ),
+                len(positions),
+            )
+        end = len(positions) if first is None else start + first
+        page = positions[start:end]
+
+        return ImpactedFilesPage(
+            results=comparison_report.impacted_files_at(page),
+            total_count=len(positions),
+            page_info={
+                "has_next_page": end < len(positions),
+                "has_previous_page": start > 0,
+                "start_cursor": _encode_cursor(page[0]) if page else None,
+                "end_cursor": _encode_cursor(page[-1]) if page else None,
+            },
+        )
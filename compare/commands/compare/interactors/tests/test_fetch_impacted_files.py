@@ -15,7 +15,7 @@ from core.tests.factories import CommitFactory, PullFactory, RepositoryFactory
 from services.comparison import Comparison, ComparisonReport, PullRequestComparison
 from services.components import Component
 
-from ..fetch_impacted_files import FetchImpactedFiles
+from ..fetch_impacted_files import FetchImpactedFiles, FetchImpactedFilesPage
 
 
 class OrderingDirection(enum.Enum):
@@ -531,6 +531,42 @@ class FetchImpactedFilesTest(TransactionTestCase):
         impacted_files = self.execute(None, self.comparison_report, comparison, filters)
         assert [file.head_name for file in impacted_files] == ["fileA", "fileB"]
 
+    @patch("services.archive.ArchiveService.read_file")
+    def test_impacted_files_page(self, read_file):
+        read_file.return_value = mocked_files_with_direct_and_indirect_changes
+        filters = {
+            "ordering": {
+                "direction": OrderingDirection.DESC,
+                "parameter": ImpactedFileParameter.FILE_NAME,
+            }
+        }
+        interactor = FetchImpactedFilesPage(None, "github")
+
+        page = interactor.execute(self.comparison_report, None, filters, first=2)
+        assert [file.head_name for file in page.results] == ["fileC", "fileB"]
+        assert page.total_count == 3
+        assert page.page_info["has_next_page"] is True
+        assert page.page_info["has_previous_page"] is False
+
+        page = interactor.execute(
+            self.comparison_report,
+            None,
+            filters,
+            first=2,
+            after=page.page_info["end_cursor"],
+        )
+        assert [file.head_name for file in page.results] == ["fileA"]
+        assert page.page_info["has_next_page"] is False
+        assert page.page_info["has_previous_page"] is True
+
+    @patch("services.archive.ArchiveService.read_file")
+    def test_impacted_files_page_invalid_cursor(self, read_file):
+        read_file.return_value = mocked_files_with_direct_and_indirect_changes
+        interactor = FetchImpactedFilesPage(None, "github")
+
+        with self.assertRaises(ValueError):
+            interactor.execute(self.comparison_report, None, {}, after="invalid")
+
     @patch("services.archive.ArchiveService.read_file")
     def test_impacted_files_filtered_by_unintended_changes(self, read_file):
         read_file.return_value = mock_data_from_archive
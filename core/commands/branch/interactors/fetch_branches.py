@@ -1,4 +1,4 @@
-from django.db.models import OuterRef, Q, Subquery
+from django.db.models import Exists, OuterRef, Q
 
 from codecov.commands.base import BaseInteractor
 from codecov.db import sync_to_async
@@ -13,19 +13,19 @@ class FetchRepoBranchesInteractor(BaseInteractor):
         filters = filters or {}
         search_value = filters.get("search_value")
         if search_value:
-            queryset = queryset.filter(name__icontains=search_value)
+            queryset = queryset.filter(name__ilike=search_value)
 
         merged = filters.get("merged_branches", False)
         if not merged:
-            queryset = queryset.annotate(
-                merged=Subquery(
-                    Commit.objects.filter(
-                        commitid=OuterRef("head"),
-                        repository_id=OuterRef("repository__repoid"),
-                    ).values("merged")[:1]
-                )
-            ).filter(
-                Q(merged__isnot=True)  # exclude merged branches
+            # a single (repoid, commitid) index probe per branch rather than a
+            # scalar subquery
+            head_merged = Commit.objects.filter(
+                repository_id=repository.repoid,
+                commitid=OuterRef("head"),
+                merged=True,
+            )
+            queryset = queryset.filter(
+                ~Exists(head_merged)  # exclude merged branches
                 | Q(name=repository.branch)  # but always include the default branch
             )
 
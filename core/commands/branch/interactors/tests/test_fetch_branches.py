@@ -49,3 +49,20 @@ class FetchRepoBranchesInteractorTest(TransactionTestCase):
             )
         ]
         assert "merged" in branches
+
+    def test_fetch_branches_search(self):
+        BranchFactory(repository=self.repo, head=self.head.commitid, name="Feat_one")
+        BranchFactory(repository=self.repo, head=self.head.commitid, name="featXone")
+
+        def search(value):
+            return sorted(
+                branch.name
+                for branch in async_to_sync(self.execute)(
+                    None, self.repo, {"search_value": value}
+                )
+            )
+
+        assert search("TEST") == ["test1", "test2"]
+        # LIKE wildcards are matched literally
+        assert search("feat_") == ["Feat_one"]
+        assert search("%") == []
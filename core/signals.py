@@ -1,10 +1,11 @@
 import json
 
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from google.cloud import pubsub_v1
 
+from codecov_auth.authentication.token_cache import invalidate_token_lookups
 from core.models import Repository
 
 _pubsub_publisher = None
@@ -37,3 +38,10 @@ def update_repository(sender, instance: Repository, **kwargs):
                     }
                 ).encode("utf-8"),
             )
+
+
+@receiver(post_save, sender=Repository, dispatch_uid="token_lookups_repo_saved")
+@receiver(post_delete, sender=Repository, dispatch_uid="token_lookups_repo_deleted")
+def invalidate_repository_token_lookups(sender, instance: Repository, **kwargs):
+    # the repository might have moved, been deactivated or had its token regenerated
+    invalidate_token_lookups(instance)
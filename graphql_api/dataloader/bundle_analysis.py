@@ -1,15 +1,16 @@
 from shared.bundle_analysis import (
-    BundleAnalysisReportLoader,
     MissingBaseReportError,
     MissingHeadReportError,
 )
-from shared.storage import get_appropriate_storage_service
 
 from core.models import Commit
 from graphql_api.types.comparison.comparison import MissingBaseReport, MissingHeadReport
 from reports.models import CommitReport
-from services.archive import ArchiveService
-from services.bundle_analysis import BundleAnalysisComparison, BundleAnalysisReport
+from services.bundle_analysis import (
+    BundleAnalysisComparison,
+    BundleAnalysisReport,
+    get_report_loader,
+)
 
 
 def load_bundle_analysis_comparison(
@@ -27,10 +28,7 @@ def load_bundle_analysis_comparison(
     if base_report is None:
         return MissingBaseReport()
 
-    loader = BundleAnalysisReportLoader(
-        storage_service=get_appropriate_storage_service(),
-        repo_key=ArchiveService.get_archive_hash(head_commit.repository),
-    )
+    loader = get_report_loader(head_commit)
 
     try:
         return BundleAnalysisComparison(
@@ -51,10 +49,7 @@ def load_bundle_analysis_report(commit: Commit) -> BundleAnalysisReport:
     if report is None:
         return MissingHeadReport()
 
-    loader = BundleAnalysisReportLoader(
-        storage_service=get_appropriate_storage_service(),
-        repo_key=ArchiveService.get_archive_hash(commit.repository),
-    )
+    loader = get_report_loader(commit)
     report = loader.load(report.external_id)
     if report is None:
         return MissingHeadReport()
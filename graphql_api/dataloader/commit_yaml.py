@@ -0,0 +1,44 @@
+import asyncio
+
+import services.components as components_service
+from codecov.db import sync_to_async
+
+from .loader import BaseLoader
+
+
+class CommitYamlLoader(BaseLoader):
+    """
+    Loads the final YAML (as a dict) of commits, fetched from the provider on
+    behalf of the current owner, at most once per request.
+
+    Loads are keyed by `Commit` instances (which compare by primary key).
+    """
+
+    @classmethod
+    def key(cls, commit):
+        return commit
+
+    async def batch_load_fn(self, commits):
+        command = self.info.context["executor"].get_command("commit")
+        return await asyncio.gather(
+            *[command.get_final_yaml(commit) for commit in commits]
+        )
+
+
+class CommitComponentsLoader(BaseLoader):
+    """
+    Loads the components configured in the final YAML of commits.
+
+    Loads are keyed by `Commit` instances (which compare by primary key).
+    """
+
+    @classmethod
+    def key(cls, commit):
+        return commit
+
+    @sync_to_async
+    def batch_load_fn(self, commits):
+        owner = self.info.context["request"].current_owner
+        return [
+            components_service.commit_components(commit, owner) for commit in commits
+        ]
@@ -0,0 +1,18 @@
+from codecov.db import sync_to_async
+
+from .loader import BaseLoader
+
+
+class FileComparisonLoader(BaseLoader):
+    """
+    Loads the file comparisons (with their sources) of the request's comparison
+    by head path. The sources of all the files requested in the same tick are
+    fetched from the provider concurrently.
+    """
+
+    @sync_to_async
+    def batch_load_fn(self, keys):
+        comparison = self.info.context["comparison"]
+        return comparison.get_file_comparisons(
+            keys, with_src=True, bypass_max_diff=True, return_exceptions=True
+        )
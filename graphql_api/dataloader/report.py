@@ -0,0 +1,43 @@
+import services.report as report_service
+from codecov.db import sync_to_async
+from services.report import ReadOnlyReport
+
+from .loader import BaseLoader
+
+
+class ReportLoader(BaseLoader):
+    """
+    Loads the full coverage report (`Commit.full_report`) of commits so that each
+    report is built at most once per request.
+
+    Loads are keyed by `Commit` instances (which compare by primary key) since
+    building a report needs more than the commit's id.
+    """
+
+    @classmethod
+    def key(cls, commit):
+        return commit
+
+    @sync_to_async
+    def batch_load_fn(self, commits):
+        return [self.build_report(commit) for commit in commits]
+
+    def build_report(self, commit):
+        return commit.full_report
+
+
+class ReadOnlyReportLoader(ReportLoader):
+    """
+    Same as `ReportLoader` but builds `ReadOnlyReport`s. The reports rows of all
+    the commits in a batch are fetched together.
+    """
+
+    @sync_to_async
+    def batch_load_fn(self, commits):
+        report_service.prefetch_full_commit_reports(commits)
+        return [self.build_report(commit) for commit in commits]
+
+    def build_report(self, commit):
+        return report_service.build_report_from_commit(
+            commit, report_class=ReadOnlyReport
+        )
@@ -59,7 +59,7 @@ class BundleAnalysisComparisonLoader(TransactionTestCase):
         )
 
     @patch("graphql_api.dataloader.bundle_analysis.BundleAnalysisComparison")
-    @patch("graphql_api.dataloader.bundle_analysis.BundleAnalysisReportLoader")
+    @patch("graphql_api.dataloader.bundle_analysis.get_report_loader")
     def test_loader(self, mock_loader, mock_comparison):
         mock_loader.return_value = None
         mock_comparison.return_value = True
@@ -136,14 +136,14 @@ class BundleAnalysisReportLoader(TransactionTestCase):
         )
 
     @patch("graphql_api.dataloader.bundle_analysis.BundleAnalysisReport")
-    @patch("graphql_api.dataloader.bundle_analysis.BundleAnalysisReportLoader")
+    @patch("graphql_api.dataloader.bundle_analysis.get_report_loader")
     def test_loader(self, mock_loader, mock_report):
         mock_loader.return_value = MockReportLoader()
         mock_report.return_value = True
         loader = load_bundle_analysis_report(self.commit)
         assert loader == True
 
-    @patch("graphql_api.dataloader.bundle_analysis.BundleAnalysisReportLoader")
+    @patch("graphql_api.dataloader.bundle_analysis.get_report_loader")
     def test_loader_missing_head_report_two(self, mock_loader):
         mock_loader.return_value = MockReportLoaderTwo()
         loader = load_bundle_analysis_report(self.commit)
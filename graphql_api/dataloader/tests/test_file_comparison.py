@@ -0,0 +1,48 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from django.test import TransactionTestCase
+from shared.torngit.exceptions import TorngitObjectNotFoundError
+
+from graphql_api.dataloader.file_comparison import FileComparisonLoader
+
+
+class GraphQLResolveInfo:
+    def __init__(self):
+        self.context = {}
+
+
+class FileComparisonLoaderTestCase(TransactionTestCase):
+    def setUp(self):
+        self.comparison = MagicMock()
+        self.info = GraphQLResolveInfo()
+        self.info.context["comparison"] = self.comparison
+
+    async def test_file_comparisons_are_batched(self):
+        error = TorngitObjectNotFoundError(None, None)
+        self.comparison.get_file_comparisons.return_value = ["a.py", error]
+
+        loader = FileComparisonLoader.loader(self.info)
+        first = loader.load("a.py")
+        second = loader.load("missing.py")
+
+        assert await first == "a.py"
+        with pytest.raises(TorngitObjectNotFoundError):
+            await second
+
+        self.comparison.get_file_comparisons.assert_called_once_with(
+            ["a.py", "missing.py"],
+            with_src=True,
+            bypass_max_diff=True,
+            return_exceptions=True,
+        )
+
+    async def test_same_path_is_loaded_once(self):
+        self.comparison.get_file_comparisons.return_value = ["a.py"]
+
+        loader = FileComparisonLoader.loader(self.info)
+        results = await asyncio.gather(loader.load("a.py"), loader.load("a.py"))
+
+        assert results == ["a.py", "a.py"]
+        self.comparison.get_file_comparisons.assert_called_once()
@@ -0,0 +1,59 @@
+import asyncio
+from unittest.mock import PropertyMock, patch
+
+from django.test import TransactionTestCase
+
+from core.models import Commit
+from core.tests.factories import CommitFactory
+from graphql_api.dataloader.report import ReadOnlyReportLoader, ReportLoader
+from services.report import ReadOnlyReport
+
+
+class GraphQLResolveInfo:
+    def __init__(self):
+        self.context = {}
+
+
+class ReportLoaderTestCase(TransactionTestCase):
+    def setUp(self):
+        self.commit = CommitFactory()
+        self.other_commit = CommitFactory(repository=self.commit.repository)
+        self.info = GraphQLResolveInfo()
+
+    @patch("core.models.Commit.full_report", new_callable=PropertyMock)
+    async def test_builds_each_report_once(self, full_report_mock):
+        full_report_mock.side_effect = ["report", "other report"]
+
+        loader = ReportLoader.loader(self.info)
+        # a different instance of the same commit
+        same_commit = await Commit.objects.aget(pk=self.commit.pk)
+        reports = await asyncio.gather(
+            loader.load(self.commit),
+            loader.load(same_commit),
+            loader.load(self.other_commit),
+        )
+        assert reports == ["report", "report", "other report"]
+
+        assert await ReportLoader.loader(self.info).load(same_commit) == "report"
+        assert full_report_mock.call_count == 2
+
+    @patch("services.report.build_report_from_commit")
+    async def test_read_only_reports_are_batched(self, build_report_mock):
+        build_report_mock.side_effect = lambda commit, report_class: commit.commitid
+
+        loader = ReadOnlyReportLoader.loader(self.info)
+        reports = await asyncio.gather(
+            loader.load(self.commit),
+            loader.load(self.other_commit),
+            loader.load(self.commit),
+        )
+        assert reports == [
+            self.commit.commitid,
+            self.other_commit.commitid,
+            self.commit.commitid,
+        ]
+        assert build_report_mock.call_count == 2
+        for call in build_report_mock.call_args_list:
+            assert call.kwargs["report_class"] == ReadOnlyReport
+            # the reports rows were prefetched for the whole batch
+            assert hasattr(call.args[0], "full_coverage_commit_reports")
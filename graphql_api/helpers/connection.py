@@ -1,12 +1,23 @@
 import enum
+import hashlib
+import json
+import logging
 from dataclasses import dataclass
 from functools import cached_property
+from typing import Optional
 
 from cursor_pagination import CursorPage, CursorPaginator
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
 from django.db.models import QuerySet
+from redis.exceptions import RedisError
 
 from codecov.db import sync_to_async
 from graphql_api.types.enums import OrderingDirection
+from services.redis_configuration import get_redis_connection
+
+log = logging.getLogger(__name__)
 
 
 def build_connection_graphql(connection_name, type_node):
@@ -33,6 +44,81 @@ def field_order(field, ordering):
     return field
 
 
+def _count_cache_key(queryset: QuerySet) -> Optional[str]:
+    # the repository (or owner) a connection is scoped to is one of the
+    # query's parameters so it's part of the fingerprint
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    fingerprint = hashlib.sha256(f"{sql}{params!r}".encode()).hexdigest()
+    return f"connection_count/{queryset.model._meta.label_lower}/{fingerprint}"
+
+
+def _estimated_count(queryset: QuerySet) -> Optional[int]:
+    """
+    Number of rows the Postgres planner expects the queryset to return, from the
+    table statistics. This is cheap but can be off, especially for queries with
+    several filters.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        # a filter that can't match anything, eg `.none()` or `__in=[]`
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_queryset(queryset: QuerySet) -> int:
+    """
+    Counts the rows of a connection's queryset. Large results are estimated from
+    the planner's statistics rather than counted when
+    `GRAPHQL_COUNT_ESTIMATE_THRESHOLD` is set, and counts are cached for a short
+    while when `GRAPHQL_COUNT_CACHE_ENABLED` is set.
+    """
+    if queryset.query.is_empty():
+        return 0
+
+    cache_key = None
+    if settings.GRAPHQL_COUNT_CACHE_ENABLED:
+        cache_key = _count_cache_key(queryset)
+    if cache_key is not None:
+        try:
+            cached = get_redis_connection().get(cache_key)
+        except RedisError:
+            log.warning("Unable to read connection count from cache", exc_info=True)
+            cache_key = None
+        else:
+            if cached is not None:
+                return int(cached)
+
+    count = None
+    threshold = settings.GRAPHQL_COUNT_ESTIMATE_THRESHOLD
+    if threshold is not None:
+        estimate = _estimated_count(queryset)
+        if estimate is not None and estimate >= threshold:
+            count = estimate
+    if count is None:
+        count = queryset.count()
+
+    if cache_key is not None:
+        try:
+            get_redis_connection().setex(
+                cache_key, settings.GRAPHQL_COUNT_CACHE_TTL, count
+            )
+        except RedisError:
+            log.warning("Unable to cache connection count", exc_info=True)
+    return count
+
+
 @dataclass
 class Connection:
     queryset: QuerySet
@@ -46,9 +132,10 @@ class Connection:
             for pos, node in enumerate(self.page)
         ]
 
+    # only resolved when `totalCount` is selected
     @sync_to_async
     def total_count(self, *args, **kwargs):
-        return self.queryset.count()
+        return count_queryset(self.queryset)
 
     @cached_property
     def start_cursor(self):
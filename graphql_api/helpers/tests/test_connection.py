@@ -1,5 +1,8 @@
+from unittest.mock import patch
+
+import fakeredis
 from asgiref.sync import async_to_sync
-from django.test import TransactionTestCase
+from django.test import TransactionTestCase, override_settings
 
 from core.models import Repository
 from core.tests.factories import RepositoryFactory
@@ -65,3 +68,82 @@ class RepositoryQuerySetTests(TransactionTestCase):
 
         count = async_to_sync(connection.total_count)()
         assert count == 3
+
+    def test_total_count_estimated_above_threshold(self):
+        from graphql_api.helpers.connection import queryset_to_connection
+
+        RepositoryFactory(name="a")
+        RepositoryFactory(name="b")
+
+        connection = async_to_sync(queryset_to_connection)(
+            Repository.objects.all(),
+            ordering=(RepositoryOrdering.NAME,),
+            ordering_direction=OrderingDirection.ASC,
+        )
+
+        with override_settings(GRAPHQL_COUNT_ESTIMATE_THRESHOLD=1000):
+            with patch(
+                "graphql_api.helpers.connection._estimated_count",
+                return_value=5000,
+            ):
+                assert async_to_sync(connection.total_count)() == 5000
+            with patch(
+                "graphql_api.helpers.connection._estimated_count",
+                return_value=10,
+            ):
+                assert async_to_sync(connection.total_count)() == 2
+
+    def test_estimated_count(self):
+        from graphql_api.helpers.connection import _estimated_count
+
+        RepositoryFactory(name="a")
+
+        assert isinstance(_estimated_count(Repository.objects.filter(name="a")), int)
+
+    @patch("services.redis_configuration._get_redis_instance_from_url")
+    def test_total_count_cached(self, get_redis):
+        from graphql_api.helpers.connection import queryset_to_connection
+
+        get_redis.return_value = fakeredis.FakeStrictRedis()
+        repo = RepositoryFactory(name="a")
+        RepositoryFactory(name="b", author=repo.author)
+
+        def total_count(queryset):
+            connection = async_to_sync(queryset_to_connection)(
+                queryset,
+                ordering=(RepositoryOrdering.NAME,),
+                ordering_direction=OrderingDirection.ASC,
+            )
+            return async_to_sync(connection.total_count)()
+
+        with override_settings(GRAPHQL_COUNT_CACHE_ENABLED=True):
+            assert total_count(Repository.objects.filter(author=repo.author)) == 2
+            RepositoryFactory(name="c", author=repo.author)
+            assert total_count(Repository.objects.filter(author=repo.author)) == 2
+            # other filters are counted separately
+            assert total_count(Repository.objects.filter(name="a")) == 1
+
+    @patch("services.redis_configuration._get_redis_instance_from_url")
+    def test_total_count_empty_querysets(self, get_redis):
+        from graphql_api.helpers.connection import (
+            _estimated_count,
+            queryset_to_connection,
+        )
+
+        get_redis.return_value = fakeredis.FakeStrictRedis()
+        RepositoryFactory(name="a")
+
+        with override_settings(
+            GRAPHQL_COUNT_CACHE_ENABLED=True, GRAPHQL_COUNT_ESTIMATE_THRESHOLD=1
+        ):
+            for queryset in [
+                Repository.objects.none(),
+                Repository.objects.filter(repoid__in=[]),
+            ]:
+                connection = async_to_sync(queryset_to_connection)(
+                    queryset,
+                    ordering=(RepositoryOrdering.NAME,),
+                    ordering_direction=OrderingDirection.ASC,
+                )
+                assert async_to_sync(connection.total_count)() == 0
+                assert _estimated_count(queryset) == 0
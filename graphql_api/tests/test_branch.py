@@ -864,7 +864,10 @@ class TestBranch(GraphQLTestHelper, TransactionTestCase):
             "path": "",
             "filters": {"components": components, "flags": flags},
         }
-        data = self.gql_request(query_files, variables=variables)
+        with patch("services.path.report_path_tree") as path_tree_mock:
+            data = self.gql_request(query_files, variables=variables)
+        # the cached tree is of the unfiltered report
+        assert not path_tree_mock.called
 
         assert data == {
             "owner": {
@@ -455,21 +455,79 @@ class TestImpactedFile(GraphQLTestHelper, TransactionTestCase):
             }
         }
 
+    @patch("services.archive.ArchiveService.read_file")
+    def test_fetch_impacted_files_paginated(self, read_file):
+        read_file.return_value = mock_data_from_archive
+        query = """
+            query ImpactedFiles(
+                $org: String!
+                $repo: String!
+                $commit: String!
+                $after: String
+            ) {
+                owner(username: $org) {
+                    repository(name: $repo) {
+                        ... on Repository {
+                            commit(id: $commit) {
+                                compareWithParent {
+                                    ... on Comparison {
+                                        impactedFiles(first: 1, after: $after) {
+                                            ... on ImpactedFiles {
+                                                results {
+                                                    fileName
+                                                }
+                                                totalCount
+                                                pageInfo {
+                                                    hasNextPage
+                                                    endCursor
+                                                }
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        """
+        variables = {
+            "org": self.org.username,
+            "repo": self.repo.name,
+            "commit": self.commit.commitid,
+        }
+
+        data = self.gql_request(query, variables=variables)
+        impacted_files = data["owner"]["repository"]["commit"]["compareWithParent"][
+            "impactedFiles"
+        ]
+        assert impacted_files["results"] == [{"fileName": "fileA"}]
+        assert impacted_files["totalCount"] == 2
+        assert impacted_files["pageInfo"]["hasNextPage"] is True
+
+        variables["after"] = impacted_files["pageInfo"]["endCursor"]
+        data = self.gql_request(query, variables=variables)
+        impacted_files = data["owner"]["repository"]["commit"]["compareWithParent"][
+            "impactedFiles"
+        ]
+        assert impacted_files["results"] == [{"fileName": "fileB"}]
+        assert impacted_files["pageInfo"]["hasNextPage"] is False
+
     @patch("services.task.TaskService.compute_comparisons")
     @patch("services.comparison.ComparisonReport.impacted_file")
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_segments_without_comparison_in_context(
         self,
         read_file,
-        mock_get_file_comparison,
+        mock_get_file_comparisons,
         mock_compare_validate,
         mock_impacted_file,
         _,
     ):
         read_file.return_value = mock_data_from_archive
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.return_value = True
         mock_impacted_file.return_value = ImpactedFile(
             **{
@@ -537,14 +595,14 @@ class TestImpactedFile(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_with_segments(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
 
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.return_value = True
         variables = {
             "org": self.org.username,
@@ -581,14 +639,14 @@ class TestImpactedFile(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_segments_with_indirect_and_direct_changes(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
 
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.return_value = True
         variables = {
             "org": self.org.username,
@@ -625,13 +683,13 @@ class TestImpactedFile(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_with_segments_unknown_path(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
-        mock_get_file_comparison.side_effect = TorngitObjectNotFoundError(None, None)
+        mock_get_file_comparisons.side_effect = TorngitObjectNotFoundError(None, None)
         mock_compare_validate.return_value = True
 
         variables = {
@@ -663,13 +721,13 @@ class TestImpactedFile(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_with_segments_provider_error(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
-        mock_get_file_comparison.side_effect = TorngitClientGeneralError(
+        mock_get_file_comparisons.side_effect = TorngitClientGeneralError(
             500, None, None
         )
         mock_compare_validate.return_value = True
@@ -705,14 +763,14 @@ class TestImpactedFile(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_with_invalid_comparison(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
 
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.side_effect = MissingComparisonReport()
         variables = {
             "org": self.org.username,
@@ -744,14 +802,14 @@ class TestImpactedFile(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_segments_with_direct_and_indirect_changes(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
 
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.return_value = True
         variables = {
             "org": self.org.username,
@@ -788,14 +846,14 @@ class TestImpactedFile(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_without_segments_filter(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
 
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.return_value = True
         variables = {
             "org": self.org.username,
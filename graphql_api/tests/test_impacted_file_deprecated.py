@@ -317,18 +317,18 @@ class TestImpactedFileDeprecated(GraphQLTestHelper, TransactionTestCase):
     @patch("services.task.TaskService.compute_comparisons")
     @patch("services.comparison.ComparisonReport.impacted_file")
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_segments_without_comparison_in_context(
         self,
         read_file,
-        mock_get_file_comparison,
+        mock_get_file_comparisons,
         mock_compare_validate,
         mock_impacted_file,
         _,
     ):
         read_file.return_value = mock_data_from_archive
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.return_value = True
         mock_impacted_file.return_value = ImpactedFile(
             **{
@@ -396,14 +396,14 @@ class TestImpactedFileDeprecated(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_with_segments(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
 
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.return_value = True
         variables = {
             "org": self.org.username,
@@ -440,14 +440,14 @@ class TestImpactedFileDeprecated(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_segments_with_indirect_and_direct_changes(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
 
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.return_value = True
         variables = {
             "org": self.org.username,
@@ -484,13 +484,13 @@ class TestImpactedFileDeprecated(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_with_segments_unknown_path(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
-        mock_get_file_comparison.side_effect = TorngitObjectNotFoundError(None, None)
+        mock_get_file_comparisons.side_effect = TorngitObjectNotFoundError(None, None)
         mock_compare_validate.return_value = True
 
         variables = {
@@ -522,13 +522,13 @@ class TestImpactedFileDeprecated(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_with_segments_provider_error(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
-        mock_get_file_comparison.side_effect = TorngitClientGeneralError(
+        mock_get_file_comparisons.side_effect = TorngitClientGeneralError(
             500, None, None
         )
         mock_compare_validate.return_value = True
@@ -564,14 +564,14 @@ class TestImpactedFileDeprecated(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_with_invalid_comparison(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
 
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.side_effect = MissingComparisonReport()
         variables = {
             "org": self.org.username,
@@ -603,14 +603,14 @@ class TestImpactedFileDeprecated(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_segments_with_direct_and_indirect_changes(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
 
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.return_value = True
         variables = {
             "org": self.org.username,
@@ -647,14 +647,14 @@ class TestImpactedFileDeprecated(GraphQLTestHelper, TransactionTestCase):
         }
 
     @patch("services.comparison.Comparison.validate")
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch("services.archive.ArchiveService.read_file")
     def test_fetch_impacted_file_without_segments_filter(
-        self, read_file, mock_get_file_comparison, mock_compare_validate
+        self, read_file, mock_get_file_comparisons, mock_compare_validate
     ):
         read_file.return_value = mock_data_from_archive
 
-        mock_get_file_comparison.return_value = MockFileComparison()
+        mock_get_file_comparisons.return_value = [MockFileComparison()]
         mock_compare_validate.return_value = True
         variables = {
             "org": self.org.username,
@@ -74,6 +74,7 @@ class TestOwnerMeasurements(TransactionTestCase, GraphQLTestHelper):
             Interval.INTERVAL_1_DAY,
             start_date=datetime(2022, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
             end_date=datetime(2022, 1, 3, 0, 0, 0, tzinfo=timezone.utc),
+            cached=True,
         )
 
     @override_settings(TIMESERIES_ENABLED=True)
@@ -102,6 +103,7 @@ class TestOwnerMeasurements(TransactionTestCase, GraphQLTestHelper):
             Interval.INTERVAL_1_DAY,
             start_date=datetime(2022, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
             end_date=datetime(2022, 1, 3, 0, 0, 0, tzinfo=timezone.utc),
+            cached=True,
         )
 
     @override_settings(TIMESERIES_ENABLED=False)
@@ -130,6 +132,7 @@ class TestOwnerMeasurements(TransactionTestCase, GraphQLTestHelper):
             Interval.INTERVAL_1_DAY,
             start_date=datetime(2022, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
             end_date=datetime(2022, 1, 3, 0, 0, 0, tzinfo=timezone.utc),
+            cached=True,
         )
 
     @override_settings(TIMESERIES_ENABLED=True)
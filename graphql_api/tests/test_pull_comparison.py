@@ -627,7 +627,7 @@ class TestPullComparison(TransactionTestCase, GraphQLTestHelper):
         }
 
     @patch(
-        "services.comparison.PullRequestComparison.get_file_comparison",
+        "services.comparison.PullRequestComparison.get_file_comparisons",
     )
     @patch(
         "services.comparison.PullRequestComparison.files",
@@ -638,7 +638,7 @@ class TestPullComparison(TransactionTestCase, GraphQLTestHelper):
         new_callable=PropertyMock,
     )
     def test_pull_comparison_line_comparisons(
-        self, comparison_files_mock, files_mock, get_file_comparison
+        self, comparison_files_mock, files_mock, get_file_comparisons
     ):
         TestFileComparison = namedtuple(
             "TestFileComparison",
@@ -719,7 +719,7 @@ class TestPullComparison(TransactionTestCase, GraphQLTestHelper):
 
         comparison_files_mock.return_value = test_files
         files_mock.return_value = test_files
-        get_file_comparison.side_effect = test_files
+        get_file_comparisons.return_value = test_files
 
         query = """
             pullId
@@ -816,7 +816,7 @@ class TestPullComparison(TransactionTestCase, GraphQLTestHelper):
             },
         }
 
-    @patch("services.comparison.PullRequestComparison.get_file_comparison")
+    @patch("services.comparison.PullRequestComparison.get_file_comparisons")
     @patch(
         "services.comparison.PullRequestComparison.files",
         new_callable=PropertyMock,
@@ -826,7 +826,7 @@ class TestPullComparison(TransactionTestCase, GraphQLTestHelper):
         new_callable=PropertyMock,
     )
     def test_pull_comparison_coverage_changes(
-        self, comparison_files_mock, files_mock, get_file_comparison_mock
+        self, comparison_files_mock, files_mock, get_file_comparisons_mock
     ):
         TestFileComparison = namedtuple(
             "TestFileComparison",
@@ -862,7 +862,7 @@ class TestPullComparison(TransactionTestCase, GraphQLTestHelper):
             ],
         )
 
-        get_file_comparison_mock.return_value = test_file_comparison
+        get_file_comparisons_mock.return_value = [test_file_comparison]
 
         comparison_files_mock.return_value = [test_file_comparison]
         files_mock.return_value = [test_file_comparison]
@@ -73,6 +73,7 @@ class TestMeasurement(TransactionTestCase, GraphQLTestHelper):
             start_date=datetime(2022, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
             end_date=datetime(2022, 1, 3, 0, 0, 0, tzinfo=timezone.utc),
             branch=None,
+            cached=True,
         )
 
     @override_settings(TIMESERIES_ENABLED=False)
@@ -101,6 +102,7 @@ class TestMeasurement(TransactionTestCase, GraphQLTestHelper):
             start_date=datetime(2022, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
             end_date=datetime(2022, 1, 3, 0, 0, 0, tzinfo=timezone.utc),
             branch=None,
+            cached=True,
         )
 
     @override_settings(TIMESERIES_ENABLED=True)
@@ -114,4 +116,5 @@ class TestMeasurement(TransactionTestCase, GraphQLTestHelper):
             start_date=datetime(2022, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
             end_date=datetime(2022, 1, 3, 0, 0, 0, tzinfo=timezone.utc),
             branch="foo",
+            cached=True,
         )
@@ -19,8 +19,10 @@ from graphql_api.dataloader.bundle_analysis import (
     load_bundle_analysis_report,
 )
 from graphql_api.dataloader.commit import CommitLoader
+from graphql_api.dataloader.commit_yaml import CommitComponentsLoader, CommitYamlLoader
 from graphql_api.dataloader.comparison import ComparisonLoader
 from graphql_api.dataloader.owner import OwnerLoader
+from graphql_api.dataloader.report import ReadOnlyReportLoader, ReportLoader
 from graphql_api.helpers.connection import (
     queryset_to_connection,
     queryset_to_connection_sync,
@@ -49,13 +51,22 @@ commit_bindable.set_alias("branchName", "branch")
 
 
 @commit_bindable.field("coverageFile")
-@sync_to_async
-def resolve_file(commit, info, path, flags=None, components=None):
+async def resolve_file(commit, info, path, flags=None, components=None):
+    if not flags and not components:
+        # only this file's chunk is needed
+        return {
+            "file_report": await sync_to_async(
+                report_service.build_report_file_from_commit
+            )(commit, path),
+            "commit": commit,
+            "path": path,
+            "flags": flags,
+            "components": components,
+        }
+
     _else, paths = None, []
     if components:
-        all_components = components_service.commit_components(
-            commit, info.context["request"].current_owner
-        )
+        all_components = await CommitComponentsLoader.loader(info).load(commit)
         filtered_components = components_service.filter_components_by_name(
             all_components, components
         )
@@ -63,8 +74,9 @@ def resolve_file(commit, info, path, flags=None, components=None):
             paths.extend(fc.paths)
         _else = FilteredReportFile(ReportFile(path), [])
 
-    commit_report = commit.full_report.filter(flags=flags, paths=paths)
-    file_report = commit_report.get(path, _else=_else)
+    report = await ReportLoader.loader(info).load(commit)
+    commit_report = report.filter(flags=flags, paths=paths)
+    file_report = await sync_to_async(commit_report.get)(path, _else=_else)
 
     return {
         "commit_report": commit_report,
@@ -98,16 +110,14 @@ def resolve_parent(commit, info):
 
 @commit_bindable.field("yaml")
 async def resolve_yaml(commit: Commit, info) -> dict:
-    command = info.context["executor"].get_command("commit")
-    final_yaml = await command.get_final_yaml(commit)
+    final_yaml = await CommitYamlLoader.loader(info).load(commit)
     return yaml.dump(final_yaml)
 
 
 @commit_bindable.field("yamlState")
 @convert_kwargs_to_snake_case
 async def resolve_yaml_state(commit: Commit, info) -> YamlStates:
-    command = info.context["executor"].get_command("commit")
-    final_yaml = await command.get_final_yaml(commit)
+    final_yaml = await CommitYamlLoader.loader(info).load(commit)
     return get_yaml_state(yaml=final_yaml)
 
 
@@ -197,9 +207,9 @@ def resolve_bundle_analysis_report(
 
 
 @commit_bindable.field("flagNames")
-@sync_to_async
-def resolve_flags(commit, info, **kwargs):
-    return commit.full_report.flags.keys()
+async def resolve_flags(commit, info, **kwargs):
+    report = await ReportLoader.loader(info).load(commit)
+    return report.flags.keys()
 
 
 @commit_bindable.field("criticalFiles")
@@ -218,8 +228,7 @@ def resolve_critical_files(commit: Commit, info, **kwargs) -> List[CriticalFile]
 @sentry_sdk.trace
 @commit_bindable.field("pathContents")
 @convert_kwargs_to_snake_case
-@sync_to_async
-def resolve_path_contents(commit: Commit, info, path: str = None, filters=None):
+async def resolve_path_contents(commit: Commit, info, path: str = None, filters=None):
     """
     The file directory tree is a list of all the files and directories
     extracted from the commit report of the latest, head commit.
@@ -229,9 +238,7 @@ def resolve_path_contents(commit: Commit, info, path: str = None, filters=None):
     current_owner = info.context["request"].current_owner
 
     # TODO: Might need to add reports here filtered by flags in the future
-    commit_report = report_service.build_report_from_commit(
-        commit, report_class=ReadOnlyReport
-    )
+    commit_report = await ReadOnlyReportLoader.loader(info).load(commit)
     if not commit_report:
         return MissingHeadReport()
 
@@ -247,7 +254,7 @@ def resolve_path_contents(commit: Commit, info, path: str = None, filters=None):
     component_flags = []
 
     if component_filter:
-        all_components = components_service.commit_components(commit, current_owner)
+        all_components = await CommitComponentsLoader.loader(info).load(commit)
         filtered_components = components_service.filter_components_by_name(
             all_components, component_filter
         )
@@ -273,12 +280,42 @@ def resolve_path_contents(commit: Commit, info, path: str = None, filters=None):
     if flags_filter and not commit_report.flags:
         return UnknownFlags(f"No coverage with chosen flags: {flags_filter}")
 
+    return await sync_to_async(_path_contents)(
+        commit,
+        commit_report,
+        current_owner,
+        path=path,
+        search_value=search_value,
+        display_type=display_type,
+        flags_filter=flags_filter,
+        component_paths=component_paths,
+        filters=filters,
+    )
+
+
+def _path_contents(
+    commit: Commit,
+    commit_report: ReadOnlyReport,
+    current_owner,
+    path,
+    search_value,
+    display_type,
+    flags_filter,
+    component_paths,
+    filters,
+):
+    tree = None
+    if not flags_filter and not component_paths:
+        # the cached tree is of the unfiltered report
+        tree = path_service.report_path_tree(commit, commit_report)
+
     report_paths = ReportPaths(
         report=commit_report,
         path=path,
         search_term=search_value,
         filter_flags=flags_filter,
         filter_paths=component_paths,
+        tree=tree,
     )
 
     if len(report_paths.paths) == 0:
@@ -316,11 +353,9 @@ async def resolve_total_uploads(commit, info):
 
 
 @commit_bindable.field("components")
-@sync_to_async
-def resolve_components(commit: Commit, info, filters=None) -> List[Component]:
-    request = info.context["request"]
+async def resolve_components(commit: Commit, info, filters=None) -> List[Component]:
     info.context["component_commit"] = commit
-    all_components = components_service.commit_components(commit, request.user)
+    all_components = await CommitComponentsLoader.loader(info).load(commit)
 
     if filters and filters.get("components"):
         return components_service.filter_components_by_name(
@@ -51,8 +51,12 @@ def resolve_impacted_files_deprecated(
 @convert_kwargs_to_snake_case
 @sync_to_async
 def resolve_impacted_files(
-    comparison_report: ComparisonReport, info: GraphQLResolveInfo, filters=None
-) -> List[ImpactedFile]:
+    comparison_report: ComparisonReport,
+    info: GraphQLResolveInfo,
+    filters=None,
+    first=None,
+    after=None,
+) -> dict:
     command: CompareCommands = info.context["executor"].get_command("compare")
     comparison: Comparison = info.context.get("comparison", None)
 
@@ -61,8 +65,13 @@ def resolve_impacted_files(
         if flags and set(flags).isdisjoint(set(comparison.head_report.flags)):
             return UnknownFlags()
 
+    page = command.fetch_impacted_files_page(
+        comparison_report, comparison, filters, first=first, after=after
+    )
     return {
-        "results": command.fetch_impacted_files(comparison_report, comparison, filters)
+        "results": page.results,
+        "total_count": page.total_count,
+        "page_info": page.page_info,
     }
 
 
@@ -71,7 +80,7 @@ def resolve_impacted_files(
 def resolve_impacted_files_count(
     comparison: ComparisonReport, info: GraphQLResolveInfo
 ):
-    return len(comparison.impacted_files)
+    return len(comparison.summaries)
 
 
 @comparison_bindable.field("directChangedFilesCount")
@@ -79,7 +88,7 @@ def resolve_impacted_files_count(
 def resolve_direct_changed_files_count(
     comparison: ComparisonReport, info: GraphQLResolveInfo
 ):
-    return len(comparison.impacted_files_with_direct_changes)
+    return len(comparison.direct_changes_positions)
 
 
 @comparison_bindable.field("indirectChangedFilesCount")
@@ -87,7 +96,7 @@ def resolve_direct_changed_files_count(
 def resolve_indirect_changed_files_count(
     comparison: ComparisonReport, info: GraphQLResolveInfo
 ):
-    return len(comparison.impacted_files_with_unintended_changes)
+    return len(comparison.unintended_changes_positions)
 
 
 @comparison_bindable.field("impactedFile")
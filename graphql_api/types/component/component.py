@@ -1,10 +1,12 @@
 from typing import Optional
 
 from ariadne import ObjectType
+from shared.reports.resources import Report
 from shared.reports.types import ReportTotals
 
 from codecov.db import sync_to_async
 from core.models import Commit
+from graphql_api.dataloader.report import ReportLoader
 from services.components import Component, component_filtered_report
 
 component_bindable = ObjectType("Component")
@@ -21,9 +23,12 @@ def resolve_name(component: Component, info) -> str:
 
 
 @component_bindable.field("totals")
-@sync_to_async
-def resolve_totals(component: Component, info) -> Optional[ReportTotals]:
+async def resolve_totals(component: Component, info) -> Optional[ReportTotals]:
     commit: Commit = info.context["component_commit"]
-    report = commit.full_report
+    report = await ReportLoader.loader(info).load(commit)
+    return await sync_to_async(_component_totals)(report, component)
+
+
+def _component_totals(report: Report, component: Component) -> ReportTotals:
     filtered_report = component_filtered_report(report, [component])
     return filtered_report.totals
@@ -6,6 +6,7 @@ from shared.reports.types import ReportTotals
 from shared.torngit.exceptions import TorngitClientError
 
 from codecov.db import sync_to_async
+from graphql_api.dataloader.file_comparison import FileComparisonLoader
 from graphql_api.types.errors import ProviderError, UnknownPath
 from graphql_api.types.errors.errors import UnknownFlags
 from graphql_api.types.segment_comparison.segment_comparison import SegmentComparisons
@@ -61,9 +62,8 @@ def resolve_hashed_path(impacted_file: ImpactedFile, info) -> str:
 
 
 @impacted_file_bindable.field("segments")
-@sync_to_async
 @convert_kwargs_to_snake_case
-def resolve_segments(
+async def resolve_segments(
     impacted_file: ImpactedFile, info, filters=None
 ) -> Union[UnknownPath, ProviderError, SegmentComparisons]:
     if filters is None:
@@ -73,15 +73,14 @@ def resolve_segments(
 
     comparison: Comparison = info.context["comparison"]
     try:
-        comparison.validate()
+        await sync_to_async(comparison.validate)()
     except MissingComparisonReport:
         return SegmentComparisons(results=[])
     path = impacted_file.head_name
 
     try:
-        file_comparison = comparison.get_file_comparison(
-            path, with_src=True, bypass_max_diff=True
-        )
+        # the sources of all the impacted files are fetched together
+        file_comparison = await FileComparisonLoader.loader(info).load(path)
     except TorngitClientError as e:
         if e.code == 404:
             return UnknownPath(f"path does not exist: {path}")
@@ -212,6 +212,7 @@ def resolve_measurements(
             interval,
             start_date=after,
             end_date=before,
+            cached=True,
         ),
         interval,
         start_date=after,
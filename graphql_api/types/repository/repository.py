@@ -381,6 +381,7 @@ def resolve_measurements(
             start_date=after,
             end_date=before,
             branch=branch,
+            cached=True,
         ),
         interval,
         start_date=after,
@@ -19,6 +19,7 @@ from codecov.commands.exceptions import BaseException
 from codecov.commands.executor import get_executor_from_request
 from codecov.db import sync_to_async
 from services import ServiceException
+from services.bundle_report_cache import get_bundle_report_cache
 
 from .schema import schema
 
@@ -44,9 +45,17 @@ class RequestFinalizer:
         Some requests causes temporary files to be created in /tmp (eg BundleAnalysis)
         This cleanup step clears all contents of the /tmp directory after each request
         """
+        bundle_report_cache = get_bundle_report_cache()
         for key in RequestFinalizer.TO_BE_DELETED_FILES:
             if hasattr(self.request, key):
                 file_path = getattr(self.request, key)
+                if (
+                    file_path
+                    and bundle_report_cache is not None
+                    and file_path in bundle_report_cache
+                ):
+                    # cached reports are shared with other requests
+                    continue
                 if file_path:
                     try:
                         if os.path.isfile(file_path) or os.path.islink(file_path):
@@ -0,0 +1,63 @@
+import hashlib
+import json
+import logging
+from typing import Callable, Optional
+
+from django.conf import settings
+from redis.exceptions import RedisError
+
+from core.models import Commit
+from services.redis_configuration import get_redis_connection
+from services.report_cache import chunks_version
+
+log = logging.getLogger(__name__)
+
+
+def etag(content: str) -> str:
+    return '"{}"'.format(hashlib.md5(str(content).encode()).hexdigest())
+
+
+def response_cache_key(path: str) -> str:
+    """
+    Key of the rendered response for a request path (including the query string).
+    """
+    return f"graphs/response/{hashlib.md5(path.encode()).hexdigest()}"
+
+
+def commit_cache_key(commit: Commit, *parts) -> Optional[str]:
+    """
+    Key of something rendered from the report of `commit`. It includes the version
+    of the commit's report so that new uploads to the commit aren't hidden.
+    Returns `None` (don't cache) if the commit has no version we can rely on.
+    """
+    version = chunks_version(commit)
+    if version is None:
+        return None
+    suffix = "/".join(str(part) for part in parts)
+    return f"graphs/commit/{commit.repository_id}/{commit.commitid}/{version}/{suffix}"
+
+
+def get_or_render(key: Optional[str], render: Callable, ttl: int):
+    """
+    Returns the value cached in Redis for `key`, rendering and caching it first if
+    needed. Values must be JSON serializable. Does nothing if the graph cache is
+    disabled, `key` is `None` or `ttl` is 0.
+    """
+    if not settings.GRAPH_CACHE_ENABLED or key is None or not ttl:
+        return render()
+
+    redis = get_redis_connection()
+    try:
+        data = redis.get(key)
+    except RedisError:
+        log.warning("Error fetching rendered graph from redis", exc_info=True)
+        return render()
+    if data is not None:
+        return json.loads(data)
+
+    value = render()
+    try:
+        redis.set(key, json.dumps(value), ex=ttl)
+    except RedisError:
+        log.warning("Error storing rendered graph in redis", exc_info=True)
+    return value
@@ -1,3 +1,4 @@
+from io import StringIO
 from math import cos, pi, sin
 
 from shared.helpers.color import coverage_to_color
@@ -16,24 +17,32 @@ style_n_defs = """
 
 
 def _squarify(values, left, top, width, height, **kwargs):
-    # values should add up to width * height
-    if len(values) == 0:
-        return []
-
-    if len(values) == 1:
-        return _layout(values, left, top, width, height)[0]
-
-    i = 1
-    while i < len(values) and _worst_ratio(
-        values[:i], left, top, width, height
-    ) >= _worst_ratio(values[: (i + 1)], left, top, width, height):
-        i += 1
-
-    current = values[:i]
-    remaining = values[i:]
-
-    rectangles, leftover_space = _layout(current, left, top, width, height)
-    return rectangles + _squarify(remaining, *leftover_space)
+    # values should be sorted in descending order and add up to width * height
+    rectangles = []
+    start, count = 0, len(values)
+    while start < count:
+        # grow the row while doing so doesn't make its worst aspect ratio worse
+        side = min(width, height)
+        largest = smallest = row_area = values[start]
+        worst = _worst_ratio(row_area, largest, smallest, side)
+        end = start + 1
+        while end < count:
+            if values[end] > 0:
+                candidate = _worst_ratio(
+                    row_area + values[end], largest, values[end], side
+                )
+                if worst < candidate:
+                    break
+                smallest, worst = values[end], candidate
+            row_area += values[end]
+            end += 1
+
+        row, (left, top, width, height) = _layout(
+            values[start:end], left, top, width, height
+        )
+        rectangles.extend(row)
+        start = end
+    return rectangles
 
 
 def _layout(areas, left, top, width, height, **kwargs):
@@ -59,9 +68,14 @@ def _layout(areas, left, top, width, height, **kwargs):
     return rectangles, leftover_space
 
 
-def _worst_ratio(areas, left, top, width, height, **kwargs):
-    rectangles, leftover = _layout(areas, left, top, width, height)
-    return max(map(_max_aspect_ratio, rectangles))
+def _worst_ratio(row_area, largest, smallest, side):
+    # the rectangles of a row share their thickness, so the worst aspect ratio
+    # is always found at either its largest or its smallest rectangle
+    thickness = row_area / side
+    return max(
+        _max_aspect_ratio((0, 0, thickness, largest / thickness)),
+        _max_aspect_ratio((0, 0, thickness, smallest / thickness)),
+    )
 
 
 def _max_aspect_ratio(rect):
@@ -99,37 +113,82 @@ def _svg_rect(x, y, width, height, fill, stroke, stroke_width, _class=None, titl
     )
 
 
-def _make_svg(width, height, elements, viewPortWidth=None, viewPortHeight=None):
-    return (
-        '<svg baseProfile="full" width="{0}" height="{1}" viewBox="0 0 {4} {5}" version="1.1"\n'
-        'xmlns="http://www.w3.org/2000/svg" xmlns:ev="http://www.w3.org/2001/xml-events"\n'
-        'xmlns:xlink="http://www.w3.org/1999/xlink">\n'
-        "{2}\n"
-        "{3}\n"
-        "</svg>".format(
-            width,
-            height,
-            style_n_defs,
-            "\n".join(elements),
-            viewPortWidth or width,
-            viewPortHeight or height,
+class _SvgWriter:
+    """
+    Writes an SVG document into a single buffer as its elements are drawn,
+    instead of collecting every element before joining them.
+    """
+
+    def __init__(self, width, height, viewPortWidth=None, viewPortHeight=None):
+        self.buffer = StringIO()
+        self.buffer.write(
+            '<svg baseProfile="full" width="{0}" height="{1}" viewBox="0 0 {2} {3}" version="1.1"\n'
+            'xmlns="http://www.w3.org/2000/svg" xmlns:ev="http://www.w3.org/2001/xml-events"\n'
+            'xmlns:xlink="http://www.w3.org/1999/xlink">\n'
+            "{4}\n".format(
+                width,
+                height,
+                viewPortWidth or width,
+                viewPortHeight or height,
+                style_n_defs,
+            )
         )
-    )
+        self.elements = 0
 
+    def write(self, element):
+        if self.elements:
+            self.buffer.write("\n")
+        self.buffer.write(element)
+        self.elements += 1
 
-def _tree_height(tree):
-    if not tree:
-        return 0
+    def rect(self, *args, **kwargs):
+        self.write(_svg_rect(*args, **kwargs))
 
-    subtrees = filter(None, (item.get("children", None) for item in tree))
+    def polar_rect(self, *args, **kwargs):
+        self.write(_svg_polar_rect(*args, **kwargs))
 
-    if not subtrees:
-        return 1
-    children_map = list(map(_tree_height, subtrees))
-    if len(children_map) < 1:
-        return 1
+    def getvalue(self):
+        return self.buffer.getvalue() + "\n</svg>"
 
-    return 1 + max(children_map)
+
+def _expanded_nodes(tree, max_nodes, max_depth):
+    """
+    Decides which nodes of the tree have their children drawn, so that at most
+    `max_nodes` nodes and `max_depth` levels are drawn. Levels are walked
+    breadth first: when the budget runs out the deepest directories are drawn
+    as a single node instead of their contents.
+    """
+    expanded = set()
+    budget = max_nodes - len(tree)
+    level, depth = tree, 1
+    while level and depth < max_depth:
+        next_level = []
+        for item in level:
+            children = item.get("children")
+            if children and len(children) <= budget:
+                budget -= len(children)
+                expanded.add(id(item))
+                next_level.extend(children)
+        level, depth = next_level, depth + 1
+    return expanded
+
+
+def _tree_height(tree, expanded=None):
+    """
+    Number of levels of the tree, only counting the children of `expanded`
+    nodes if given.
+    """
+    height = 0
+    level = tree
+    while level:
+        height += 1
+        level = [
+            child
+            for item in level
+            if expanded is None or id(item) in expanded
+            for child in item.get("children") or ()
+        ]
+    return height
 
 
 def _svg_polar_rect(
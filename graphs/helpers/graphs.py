@@ -1,16 +1,10 @@
-from operator import itemgetter
-
 from graphs.settings import settings
 
 from .graph_utils import (
-    _layout,
-    _make_svg,
-    _max_aspect_ratio,
+    _expanded_nodes,
     _squarify,
-    _svg_polar_rect,
-    _svg_rect,
+    _SvgWriter,
     _tree_height,
-    _worst_ratio,
 )
 
 
@@ -28,65 +22,62 @@ def tree(parsed_data, href=None, classes=None, **kwargs):
     options = settings["sunburst"]["options"].copy()
     options.update(kwargs)
 
-    svg_elements = []
-
-    def recursively_draw(items, step, left, top, width, height):
-        values = [item["lines"] for item in items]
-        _sum_values = sum(values)
-        if _sum_values > 0:
-            correction = width * height / _sum_values
-            sorted_values = sorted(
-                enumerate(value * correction for value in values),
-                key=itemgetter(1),
-                reverse=True,
-            )
-            indices = [x[0] for x in sorted_values]
-            values = [x[1] for x in sorted_values]
-            rectangles = _squarify(values, left, top, width, height)
-            for rect, color, _class, children, name in zip(
-                rectangles,
-                (items[index]["color"] for index in indices),
-                (items[index]["_class"] for index in indices),
-                (items[index].get("children", None) for index in indices),
-                (items[index]["name"] for index in indices),
-            ):
-                step.append(name)
-                if children:
-                    recursively_draw(children, step, *rect)
-                    step.pop(-1)
-                else:
-                    path = "/".join(step[1:])
-                    rect = _svg_rect(
-                        rect[0],
-                        rect[1],
-                        rect[2],
-                        rect[3],
-                        fill=color,
-                        stroke=options["border_color"],
-                        stroke_width=options["border_size"],
-                        _class=_class,
-                        title=path,
-                    )
-                    svg_elements.append(rect)
-                    step.pop(-1)
-
-    recursively_draw(
-        parsed_data,
-        [],
-        0,
-        0,
-        options.get("viewPortWidth") or options["width"],
-        options.get("viewPortHeight") or options["height"],
-    )
-
-    return _make_svg(
+    expanded = _expanded_nodes(parsed_data, options["max_nodes"], options["max_depth"])
+    svg = _SvgWriter(
         options["width"],
         options["height"],
-        svg_elements,
         options.get("viewPortWidth"),
         options.get("viewPortHeight"),
     )
 
+    def layout(items, left, top, width, height):
+        values = [item["lines"] for item in items]
+        _sum_values = sum(values)
+        if _sum_values <= 0:
+            return []
+        correction = width * height / _sum_values
+        values = [value * correction for value in values]
+        indices = sorted(range(len(items)), key=values.__getitem__, reverse=True)
+        rectangles = _squarify(
+            [values[index] for index in indices], left, top, width, height
+        )
+        return [(items[index], rect) for index, rect in zip(indices, rectangles)]
+
+    # depth first so that the rectangles are drawn in the order of the layout,
+    # the path of the top level item isn't part of the titles
+    stack = [
+        (item, rect, "", 1)
+        for item, rect in reversed(
+            layout(
+                parsed_data,
+                0,
+                0,
+                options.get("viewPortWidth") or options["width"],
+                options.get("viewPortHeight") or options["height"],
+            )
+        )
+    ]
+    while stack:
+        item, rect, path, depth = stack.pop()
+        if id(item) in expanded:
+            for child, child_rect in reversed(layout(item["children"], *rect)):
+                child_path = f"{path}/{child['name']}" if depth > 1 else child["name"]
+                stack.append((child, child_rect, child_path, depth + 1))
+        else:
+            svg.rect(
+                rect[0],
+                rect[1],
+                rect[2],
+                rect[3],
+                fill=item["color"],
+                stroke=options["border_color"],
+                stroke_width=options["border_size"],
+                _class=item.get("_class"),
+                title=path,
+            )
+
+    return svg.getvalue()
+
 
 def icicle(parsed_data, **kwargs):
     options = settings["icicle"]["options"].copy()
@@ -99,39 +90,45 @@ def icicle(parsed_data, **kwargs):
     plot_width = drawing_width * 0.9
     plot_height = drawing_height * 0.9
 
+    expanded = _expanded_nodes(parsed_data, options["max_nodes"], options["max_depth"])
+
     # starting point
     sx, sy = drawing_width * 0.05, drawing_height * 0.05
-    strip_height = plot_height / _tree_height(parsed_data)
+    strip_height = plot_height / _tree_height(parsed_data, expanded)
 
-    svg_elements = []
+    svg = _SvgWriter(drawing_width, drawing_height)
 
-    def recursively_draw(items, x, y, max_width, prefix_name):
+    def layout(items, x, y, max_width, prefix_name):
         total = sum((item["lines"] for item in items))
+        placed = []
         if total > 0:
             for item in items:
                 item_width = item["lines"] / total * max_width
-                title = prefix_name + "/" + item["name"]
-                svg_elements.append(
-                    _svg_rect(
-                        x,
-                        y,
-                        item_width,
-                        strip_height,
-                        fill=item["color"],
-                        stroke=options["border_color"],
-                        title=title,
-                        stroke_width=options["border_size"],
-                    )
+                placed.append(
+                    (item, x, y, item_width, prefix_name + "/" + item["name"])
                 )
-                if "children" in item.keys():
-                    recursively_draw(
-                        item["children"], x, y + strip_height, item_width, title
-                    )
                 x += item_width
+        return placed
+
+    stack = layout(parsed_data, sx, sy, plot_width, "")[::-1]
+    while stack:
+        item, x, y, item_width, title = stack.pop()
+        svg.rect(
+            x,
+            y,
+            item_width,
+            strip_height,
+            fill=item["color"],
+            stroke=options["border_color"],
+            title=title,
+            stroke_width=options["border_size"],
+        )
+        if id(item) in expanded:
+            stack.extend(
+                layout(item["children"], x, y + strip_height, item_width, title)[::-1]
+            )
 
-    recursively_draw(parsed_data, sx, sy, plot_width, "")
-
-    return _make_svg(drawing_width, drawing_height, svg_elements)
+    return svg.getvalue()
 
 
 def sunburst(parsed_data, **kwargs):
@@ -147,38 +144,41 @@ def sunburst(parsed_data, **kwargs):
     max_diameter = min(drawing_width, drawing_height) * 0.95
     max_radius = max_diameter / 2.0
 
-    offset_increment = max_radius / _tree_height(parsed_data)
+    expanded = _expanded_nodes(parsed_data, options["max_nodes"], options["max_depth"])
+    offset_increment = max_radius / _tree_height(parsed_data, expanded)
 
-    svg_elements = []
+    svg = _SvgWriter(drawing_width, drawing_height)
 
-    def recursively_draw(items, inner_radius, start, end):
+    def layout(items, inner_radius, start, end):
         total = sum((item["lines"] for item in items))
+        placed = []
         if total > 0:
             s = start
             for item in items:
                 arc_size = item["lines"] / total * (end - start)
-                svg_elements.append(
-                    _svg_polar_rect(
-                        cx,
-                        cy,
-                        inner_radius,
-                        inner_radius + offset_increment,
-                        s,
-                        s + arc_size,
-                        item["color"],
-                        options["border_color"],
-                        options["border_size"],
-                    )
-                )
-                if "children" in item.keys():
-                    recursively_draw(
-                        item["children"],
-                        inner_radius + offset_increment,
-                        s,
-                        s + arc_size,
-                    )
+                placed.append((item, inner_radius, s, s + arc_size))
                 s += arc_size
+        return placed
+
+    stack = layout(parsed_data, 0, 0, 1)[::-1]
+    while stack:
+        item, inner_radius, start, end = stack.pop()
+        svg.polar_rect(
+            cx,
+            cy,
+            inner_radius,
+            inner_radius + offset_increment,
+            start,
+            end,
+            item["color"],
+            options["border_color"],
+            options["border_size"],
+        )
+        if id(item) in expanded:
+            stack.extend(
+                layout(item["children"], inner_radius + offset_increment, start, end)[
+                    ::-1
+                ]
+            )
 
-    recursively_draw(parsed_data, 0, 0, 1)
-
-    return _make_svg(drawing_width, drawing_height, svg_elements)
+    return svg.getvalue()
@@ -1,7 +1,11 @@
-from django.http import HttpResponse
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import parse_etags
 from rest_framework import status
 from rest_framework.response import Response
 
+from graphs.cache import etag, get_or_render, response_cache_key
+
 
 class GraphBadgeAPIMixin(object):
     def get(self, request, *args, **kwargs):
@@ -14,12 +18,22 @@ class GraphBadgeAPIMixin(object):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        graph = self.get_object(
-            request, *args, **kwargs
-        )  # for badge handler this will get the badge, for graph it will get the graph
-        # do all the header stuff and return the response
+        # for badge handler this will get the badge, for graph it will get the graph.
+        # Rendered responses are briefly cached by path so that hot badges don't
+        # touch the database at all
+        graph = get_or_render(
+            response_cache_key(request.get_full_path()),
+            lambda: self.get_object(request, *args, **kwargs),
+            ttl=settings.GRAPH_CACHE_RESPONSE_TTL,
+        )
+        graph_etag = etag(graph)
 
-        response = HttpResponse(graph)
+        # do all the header stuff and return the response
+        if graph_etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(graph)
+        response["ETag"] = graph_etag
         if self.kwargs.get("ext") == "svg":
             response["Content-Disposition"] = ' inline; filename="{}.svg"'.format(
                 self.filename
@@ -30,5 +44,6 @@ class GraphBadgeAPIMixin(object):
             response["Access-Control-Expose-Headers"] = (
                 "Content-Type, Cache-Control, Expires, Etag, Last-Modified"
             )
-            response["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
+            # clients may store the badge but must revalidate it (with the ETag)
+            response["Cache-Control"] = "no-cache, must-revalidate, max-age=0"
         return response
@@ -6,6 +6,9 @@ settings = {
             "height": 150,
             "border_size": 1,
             "border_color": "white",
+            # larger trees are drawn with their deepest directories collapsed
+            "max_nodes": 2000,
+            "max_depth": 10,
         },
         "exports": ["svg"],
         "types": ["commit", "pull", "branch"],
@@ -17,6 +20,8 @@ settings = {
             "height": 500,
             "border_size": 1,
             "border_color": "white",
+            "max_nodes": 2000,
+            "max_depth": 10,
         },
         "exports": ["svg", "json"],
         "types": ["commit", "pull", "branch"],
@@ -28,6 +33,8 @@ settings = {
             "height": 300,
             "border_size": 1,
             "border_color": "white",
+            "max_nodes": 2000,
+            "max_depth": 10,
         },
         "exports": ["svg", "html"],
         "types": ["commit", "pull", "branch"],
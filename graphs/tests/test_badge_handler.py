@@ -1,5 +1,8 @@
 from unittest.mock import PropertyMock, patch
 
+import fakeredis
+from django.test import override_settings
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 from shared.reports.resources import Report, ReportFile, Session, SessionType
@@ -1352,3 +1355,56 @@ class TestBadgeHandler(APITestCase):
         expected_badge = [line.strip() for line in expected_badge.split("\n")]
         assert expected_badge == badge
         assert response.status_code == status.HTTP_200_OK
+
+    def test_badge_not_modified(self):
+        gh_owner = OwnerFactory(service="github")
+        repo = RepositoryFactory(
+            author=gh_owner, active=True, private=False, name="repo1"
+        )
+        CommitFactory(repository=repo, author=gh_owner)
+        path = f"/gh/{gh_owner.username}/repo1/graphs/badge.svg"
+
+        response = self.client.get(path)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response["ETag"]
+
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert response.content == b""
+
+        response = self.client.get(path, HTTP_IF_NONE_MATCH='"outdated"')
+        assert response.status_code == status.HTTP_200_OK
+
+    @override_settings(GRAPH_CACHE_ENABLED=True)
+    @patch("core.models.Commit.full_report", new_callable=PropertyMock)
+    def test_cached_flag_badge(self, full_report_mock):
+        gh_owner = OwnerFactory(service="github")
+        repo = RepositoryFactory(
+            author=gh_owner, active=True, private=False, name="repo1"
+        )
+        CommitFactory(repository=repo, author=gh_owner, updatestamp=timezone.now())
+        full_report_mock.return_value = sample_report()
+        kwargs = {
+            "service": "gh",
+            "owner_username": gh_owner.username,
+            "repo_name": "repo1",
+            "ext": "txt",
+        }
+
+        with patch(
+            "services.redis_configuration._get_redis_instance_from_url",
+            return_value=fakeredis.FakeStrictRedis(),
+        ):
+            response = self._get(kwargs=kwargs, data={"flag": "unittests"})
+            assert response.content.decode("utf-8") == "100"
+
+            # served from the cache without looking up the branch and commit
+            with self.assertNumQueries(0):
+                cached_response = self._get(kwargs=kwargs, data={"flag": "unittests"})
+            assert cached_response.content == response.content
+            assert cached_response["ETag"] == response["ETag"]
+
+            # the flag coverage is cached for the commit's report
+            self._get(kwargs=kwargs, data={"flag": "unittests", "precision": "1"})
+        assert full_report_mock.call_count == 1
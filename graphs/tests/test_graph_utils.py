@@ -1,4 +1,4 @@
-from graphs.helpers.graph_utils import _tree_height
+from graphs.helpers.graph_utils import _expanded_nodes, _squarify, _tree_height
 
 
 class TestGraphsUtils(object):
@@ -41,3 +41,41 @@ class TestGraphsUtils(object):
         ]
         height = _tree_height(tree)
         assert height == 4
+
+    def test_tree_height_expanded(self):
+        leaf = {"name": "name_2"}
+        child = {"name": "name_1", "children": [leaf]}
+        root = {"name": "name_0", "children": [child]}
+
+        assert _tree_height([root], expanded=set()) == 1
+        assert _tree_height([root], expanded={id(root)}) == 2
+        assert _tree_height([root], expanded={id(root), id(child)}) == 3
+
+    def test_expanded_nodes_budget(self):
+        small = {"name": "small", "children": [{"name": "a"}]}
+        large = {"name": "large", "children": [{"name": "b"}, {"name": "c"}]}
+        root = {"name": "root", "children": [small, large]}
+
+        assert _expanded_nodes([root], max_nodes=10, max_depth=10) == {
+            id(root),
+            id(small),
+            id(large),
+        }
+        # the large directory doesn't fit, it's drawn as a single node
+        assert _expanded_nodes([root], max_nodes=4, max_depth=10) == {
+            id(root),
+            id(small),
+        }
+        assert _expanded_nodes([root], max_nodes=10, max_depth=2) == {id(root)}
+
+    def test_squarify(self):
+        rectangles = _squarify([6, 6, 4, 3, 2, 2, 1], 0, 0, 6, 4)
+        assert rectangles == [
+            (0, 0, 3.0, 2.0),
+            (0, 2.0, 3.0, 2.0),
+            (3.0, 0, 1.7142857142857142, 2.3333333333333335),
+            (4.714285714285714, 0, 1.2857142857142856, 2.3333333333333335),
+            (3.0, 2.3333333333333335, 1.2000000000000002, 1.6666666666666665),
+            (4.2, 2.3333333333333335, 1.2000000000000002, 1.6666666666666665),
+            (5.4, 2.3333333333333335, 0.5999999999999996, 1.6666666666666676),
+        ]
@@ -1,5 +1,6 @@
 import logging
 
+from django.conf import settings as django_settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import connection
 from django.http import Http404
@@ -15,6 +16,7 @@ from api.shared.mixins import RepoPropertyMixin
 from core.models import Branch, Pull
 from graphs.settings import settings
 
+from .cache import commit_cache_key, get_or_render
 from .helpers.badge import format_coverage_precision, get_badge
 from .helpers.graphs import icicle, sunburst, tree
 from .mixins import GraphBadgeAPIMixin
@@ -111,7 +113,12 @@ class BadgeHandler(APIView, RepoPropertyMixin, GraphBadgeAPIMixin):
 
         flag = self.request.query_params.get("flag")
         if flag:
-            return self.flag_coverage(flag, commit), coverage_range
+            coverage = get_or_render(
+                commit_cache_key(commit, "flag", flag) if commit else None,
+                lambda: self.flag_coverage(flag, commit),
+                ttl=django_settings.GRAPH_CACHE_TTL,
+            )
+            return coverage, coverage_range
 
         coverage = (
             commit.totals.get("c")
@@ -129,18 +136,10 @@ class BadgeHandler(APIView, RepoPropertyMixin, GraphBadgeAPIMixin):
         flag_name (string): name of flag
         commit (obj): commit object containing report
         """
-        if commit.full_report is None:
-            log.warning(
-                "Commit's report not found", extra=dict(commit=commit, flag=flag_name)
-            )
+        totals = report_service.fetch_flag_totals(commit, flag_name)
+        if totals is None or totals.coverage is None:
             return None
-        flags = commit.full_report.flags
-        if flags is None:
-            return None
-        flag = flags.get(flag_name)
-        if flag:
-            return flag.totals.coverage
-        return None
+        return str(totals.coverage)
 
 
 class GraphHandler(APIView, RepoPropertyMixin, GraphBadgeAPIMixin):
@@ -150,11 +149,32 @@ class GraphHandler(APIView, RepoPropertyMixin, GraphBadgeAPIMixin):
     filename = "graph"
 
     def get_object(self, request, *args, **kwargs):
+        if self.kwargs.get("pullid"):
+            return self.render_graph(self.get_flare())
+
+        commit = self.get_commit()
+        if commit is None:
+            raise NotFound(
+                "Not found. Note: private repositories require ?token arguments"
+            )
+
+        # the rendered graph only depends on the commit's report and the options
+        key = commit_cache_key(
+            commit,
+            self.kwargs.get("graph"),
+            self.request.query_params.get("width"),
+            self.request.query_params.get("height"),
+        )
+        return get_or_render(
+            key,
+            lambda: self.render_graph(self.get_commit_flare(commit)),
+            ttl=django_settings.GRAPH_CACHE_TTL,
+        )
+
+    def render_graph(self, flare):
         options = dict()
         graph = self.kwargs.get("graph")
 
-        flare = self.get_flare()
-
         if graph == "tree":
             options["width"] = int(
                 self.request.query_params.get(
@@ -205,8 +225,9 @@ class GraphHandler(APIView, RepoPropertyMixin, GraphBadgeAPIMixin):
                 )
             return pull_flare
 
-    def get_commit_flare(self):
-        commit = self.get_commit()
+    def get_commit_flare(self, commit=None):
+        if commit is None:
+            commit = self.get_commit()
 
         if commit is None:
             raise NotFound(
@@ -248,6 +248,9 @@ class ArchiveService(object):
     def create_presigned_put(self, path):
         return self.storage.create_presigned_put(self.root, path, self.ttl)
 
+    def create_presigned_puts(self, paths):
+        return self.storage.create_presigned_puts(self.root, paths, self.ttl)
+
     def create_raw_upload_presigned_put(
         self, commit_sha, repo_hash=None, filename=None, expires=None
     ):
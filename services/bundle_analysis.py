@@ -1,7 +1,13 @@
+import logging
 import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional
 
+from django.db import close_old_connections
 from django.utils.functional import cached_property
 from shared.bundle_analysis import AssetReport as SharedAssetReport
 from shared.bundle_analysis import (
@@ -17,13 +23,98 @@ from shared.storage import get_appropriate_storage_service
 from core.models import Commit
 from reports.models import CommitReport
 from services.archive import ArchiveService
+from services.bundle_report_cache import bundle_report_version, get_bundle_report_cache
+
+log = logging.getLogger(__name__)
+
+
+class CachedBundleAnalysisReportLoader(BundleAnalysisReportLoader):
+    """
+    Loads bundle analysis reports through this pod's disk cache (when enabled)
+    instead of downloading the SQLite file from storage for every request.
+    Reports loaded from the cache must not be written to and their files are
+    left in place when the request finishes.
+    """
+
+    def load(self, external_id: str) -> Optional[SharedBundleAnalysisReport]:
+        cache = get_bundle_report_cache()
+        if cache is None:
+            return super().load(external_id)
+
+        version = bundle_report_version(external_id)
+        db_path = cache.get(external_id, version)
+        if db_path is None:
+            report = super().load(external_id)
+            if report is None:
+                return None
+            report.db_session.close()
+            db_path = cache.put(external_id, version, report.db_path)
+        return SharedBundleAnalysisReport(db_path)
+
+
+def get_report_loader(commit: Commit) -> CachedBundleAnalysisReportLoader:
+    return CachedBundleAnalysisReportLoader(
+        storage_service=get_appropriate_storage_service(),
+        repo_key=ArchiveService.get_archive_hash(commit.repository),
+    )
+
+
+_prefetch_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def _prefetch(loader: CachedBundleAnalysisReportLoader, external_id: str) -> None:
+    try:
+        report = loader.load(external_id)
+        if report is not None:
+            report.db_session.close()
+    except Exception:
+        log.warning(
+            "Failed to prefetch bundle analysis report",
+            extra=dict(external_id=external_id),
+            exc_info=True,
+        )
+    finally:
+        close_old_connections()
+
+
+def prefetch_report(commit: Commit, report_code: Optional[str] = None) -> None:
+    """
+    Downloads the commit's bundle analysis report into this pod's cache in the
+    background, if caching is enabled.
+    """
+    if get_bundle_report_cache() is None:
+        return
+
+    commit_report = commit.reports.filter(
+        report_type=CommitReport.ReportType.BUNDLE_ANALYSIS,
+        code=report_code,
+    ).first()
+    if commit_report is None:
+        return
+
+    _prefetch_executor.submit(
+        _prefetch, get_report_loader(commit), str(commit_report.external_id)
+    )
+
+
+def prefetch_parent_report(commit: Commit) -> None:
+    """
+    Prefetches the bundle analysis report of the commit's parent (if known), the
+    base that the commit's new report will be compared against.
+    """
+    if get_bundle_report_cache() is None or commit.parent_commit_id is None:
+        return
+
+    parent = Commit.objects.filter(
+        repository_id=commit.repository_id, commitid=commit.parent_commit_id
+    ).first()
+    if parent is not None:
+        prefetch_report(parent)
 
 
 def load_report(
     commit: Commit, report_code: Optional[str] = None
 ) -> Optional[SharedBundleAnalysisReport]:
-    storage = get_appropriate_storage_service()
-
     commit_report = commit.reports.filter(
         report_type=CommitReport.ReportType.BUNDLE_ANALYSIS,
         code=report_code,
@@ -31,11 +122,7 @@ def load_report(
     if commit_report is None:
         return None
 
-    loader = BundleAnalysisReportLoader(
-        storage_service=storage,
-        repo_key=ArchiveService.get_archive_hash(commit.repository),
-    )
-    return loader.load(commit_report.external_id)
+    return get_report_loader(commit).load(commit_report.external_id)
 
 
 # TODO: depreacted with Issue 1199
@@ -66,6 +153,18 @@ def get_extension(filename: str) -> str:
     return file_extension
 
 
+def query_report(db_path: str, sql: str, params: tuple = ()) -> List[tuple]:
+    """
+    Runs a (read only) query directly against a bundle report SQLite file so that
+    aggregates are computed without loading every row into shared's models. The
+    `extension(name)` SQL function is available and matches `get_extension`.
+    """
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    with closing(sqlite3.connect(uri, uri=True)) as connection:
+        connection.create_function("extension", 1, get_extension, deterministic=True)
+        return connection.execute(sql, params).fetchall()
+
+
 @dataclass
 class BundleLoadTime:
     """
@@ -165,7 +264,18 @@ class AssetReport(object):
 
     @cached_property
     def module_extensions(self) -> List[str]:
-        return list(set([module.extension for module in self.modules]))
+        rows = query_report(
+            self.asset.db_path,
+            """
+            select distinct extension(modules.name)
+            from modules
+            join chunks_modules on chunks_modules.module_id = modules.id
+            join assets_chunks on assets_chunks.chunk_id = chunks_modules.chunk_id
+            where assets_chunks.asset_id = ?
+            """,
+            (self.asset.asset.id,),
+        )
+        return [extension for (extension,) in rows]
 
 
 @dataclass
@@ -189,10 +299,15 @@ class BundleReport(object):
 
         return filtered_assets
 
-    def asset(self, name: str) -> AssetReport:
+    @cached_property
+    def _assets_by_name(self) -> Dict[str, AssetReport]:
+        index = {}
         for asset_report in self.all_assets:
-            if asset_report.name == name:
-                return asset_report
+            index.setdefault(asset_report.name, asset_report)
+        return index
+
+    def asset(self, name: str) -> AssetReport:
+        return self._assets_by_name.get(name)
 
     @cached_property
     def size_total(self) -> int:
@@ -205,10 +320,20 @@ class BundleReport(object):
 
     @cached_property
     def module_extensions(self) -> List[str]:
-        extensions = set()
-        for asset in self.assets():
-            extensions.update(asset.module_extensions)
-        return list(extensions)
+        rows = query_report(
+            self.report.db_path,
+            """
+            select distinct extension(modules.name)
+            from modules
+            join chunks_modules on chunks_modules.module_id = modules.id
+            join assets_chunks on assets_chunks.chunk_id = chunks_modules.chunk_id
+            join assets on assets.id = assets_chunks.asset_id
+            join sessions on sessions.id = assets.session_id
+            where sessions.bundle_id = ?
+            """,
+            (self.report.bundle.id,),
+        )
+        return [extension for (extension,) in rows]
 
     @cached_property
     def module_count(self) -> int:
@@ -236,7 +361,17 @@ class BundleAnalysisReport(object):
 
     @cached_property
     def size_total(self) -> int:
-        return sum([bundle.size_total for bundle in self.bundles])
+        # every bundle's total in a single query
+        ((size_total,),) = query_report(
+            self.report.db_path,
+            """
+            select coalesce(sum(assets.size), 0)
+            from assets
+            join sessions on sessions.id = assets.session_id
+            join bundles on bundles.id = sessions.bundle_id
+            """,
+        )
+        return size_total
 
     @cached_property
     def load_time_total(self) -> int:
@@ -0,0 +1,141 @@
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import Count, Max
+from shared.metrics import metrics
+
+from reports.models import ReportSession
+
+log = logging.getLogger(__name__)
+
+
+def bundle_report_version(external_id: str) -> str:
+    """
+    Version of the bundle report SQLite file in storage for the given commit
+    report. The worker rewrites the file in place (same `external_id`) for each
+    upload it processes and updates the upload afterwards, so we derive the
+    version from the report's uploads instead of stat'ing the object in storage.
+    """
+    uploads = ReportSession.objects.filter(report__external_id=external_id).aggregate(
+        count=Count("id"), updated_at=Max("updated_at")
+    )
+    updated_at = uploads["updated_at"]
+    if updated_at is None:
+        return "0"
+    return f"{uploads['count']}-{int(updated_at.timestamp() * 1_000_000)}"
+
+
+class BundleReportCache:
+    """
+    Disk cache of bundle analysis SQLite files, bounded by their total size.
+
+    Files are named after the report's `external_id` and version, written once
+    (downloaded next to their final path and renamed into place) and never
+    modified afterwards, so any number of requests and processes on the pod can
+    open them concurrently. Reads bump a file's mtime and the least recently
+    used files are deleted when the cache is over its size. Files used within
+    `grace_period` seconds are never evicted since requests may still be
+    reading them.
+    """
+
+    suffix = ".sqlite"
+
+    def __init__(self, directory: str, max_size: int, grace_period: int = 60):
+        self.directory = directory
+        self.max_size = max_size
+        self.grace_period = grace_period
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, external_id: str, version: str) -> str:
+        return os.path.join(self.directory, f"{external_id}-{version}{self.suffix}")
+
+    def __contains__(self, file_path: str) -> bool:
+        return os.path.dirname(os.path.abspath(file_path)) == os.path.abspath(
+            self.directory
+        )
+
+    def get(self, external_id: str, version: str) -> Optional[str]:
+        file_path = self.path(external_id, version)
+        try:
+            os.utime(file_path)
+        except FileNotFoundError:
+            metrics.incr("services.bundle_report_cache.miss")
+            return None
+        metrics.incr("services.bundle_report_cache.hit")
+        return file_path
+
+    def put(self, external_id: str, version: str, source_path: str) -> str:
+        """
+        Moves the downloaded SQLite file at `source_path` into the cache and
+        returns its new path.
+        """
+        file_path = self.path(external_id, version)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.move(source_path, tmp_path)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self.evict()
+        return file_path
+
+    def evict(self) -> None:
+        entries = []
+        size = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(self.suffix):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # evicted by another process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                size += stat.st_size
+
+        if size <= self.max_size:
+            return
+
+        in_use_since = time.time() - self.grace_period
+        for mtime, file_size, file_path in sorted(entries):
+            if size <= self.max_size or mtime >= in_use_since:
+                break
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                pass
+            size -= file_size
+            metrics.incr("services.bundle_report_cache.eviction")
+
+
+_bundle_report_cache = None
+_bundle_report_cache_lock = threading.Lock()
+
+
+def get_bundle_report_cache() -> Optional[BundleReportCache]:
+    """
+    Returns the process-wide bundle report cache, or `None` if it is disabled.
+    """
+    global _bundle_report_cache
+
+    if not settings.BUNDLE_REPORT_CACHE_ENABLED:
+        return None
+
+    if _bundle_report_cache is None:
+        with _bundle_report_cache_lock:
+            if _bundle_report_cache is None:
+                _bundle_report_cache = BundleReportCache(
+                    directory=settings.BUNDLE_REPORT_CACHE_DIR,
+                    max_size=settings.BUNDLE_REPORT_CACHE_MAX_SIZE,
+                )
+    return _bundle_report_cache
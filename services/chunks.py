@@ -0,0 +1,68 @@
+from typing import List, Optional, Tuple
+
+from core.models import Commit
+from services.archive import ArchiveService
+from services.report_cache import get_chunks_cache
+
+# separators used in the `chunks.txt` format (see `shared.reports.resources`)
+END_OF_CHUNK = b"\n<<<<< end_of_chunk >>>>>\n"
+END_OF_HEADER = b"\n<<<<< end_of_header >>>>>\n"
+
+
+def fetch_chunks(commit: Commit) -> str:
+    """
+    Fetch the chunks for the given commit from archive storage, going through the
+    chunks cache when report caching is enabled.
+    """
+    archive_service = ArchiveService(commit.repository)
+    chunks_cache = get_chunks_cache()
+    if chunks_cache is None:
+        return archive_service.read_chunks(commit.commitid)
+
+    return chunks_cache.get_or_fetch(
+        chunks_cache.key(commit),
+        lambda: archive_service.read_chunks(commit.commitid),
+    )
+
+
+def chunk_offsets(chunks: bytes) -> List[Tuple[int, int]]:
+    """
+    Byte offsets `(start, end)` of every chunk in an encoded chunks file, indexed
+    by `file_index`. The optional report header is skipped.
+    """
+    start = 0
+    header_end = chunks.find(END_OF_HEADER)
+    if header_end >= 0:
+        start = header_end + len(END_OF_HEADER)
+
+    offsets = []
+    while True:
+        end = chunks.find(END_OF_CHUNK, start)
+        if end < 0:
+            offsets.append((start, len(chunks)))
+            return offsets
+        offsets.append((start, end))
+        start = end + len(END_OF_CHUNK)
+
+
+class ChunksReader:
+    """
+    Reads the chunk of a single file out of a commit's `chunks.txt`.
+
+    The chunks are fetched through the chunks cache and only the requested chunk
+    is sliced out and decoded, so building a single `ReportFile` doesn't parse
+    every file of the report. Reading just the file's byte range from storage
+    would need an offsets index written by the worker along with the chunks;
+    nothing produces one yet, so it isn't probed for.
+    """
+
+    def __init__(self, commit: Commit):
+        self.commit = commit
+
+    def read_chunk(self, file_index: int) -> Optional[str]:
+        chunks = fetch_chunks(self.commit).encode()
+        offsets = chunk_offsets(chunks)
+        if file_index >= len(offsets):
+            return None
+        start, end = offsets[file_index]
+        return chunks[start:end].decode()
@@ -1,16 +1,17 @@
 import asyncio
-import copy
 import functools
 import json
 import logging
 from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 
 import minio
 import pytz
 from asgiref.sync import async_to_sync
+from django.conf import settings
 from django.db.models import Prefetch, QuerySet
 from django.utils.functional import cached_property
 from shared.helpers.yaml import walk
@@ -26,6 +27,7 @@ from services import ServiceException
 from services.archive import ArchiveService
 from services.redis_configuration import get_redis_connection
 from services.repo_providers import RepoProviderService
+from services.report_cache import SizeBoundedLRUCache
 from utils.config import get_config
 
 log = logging.getLogger(__name__)
@@ -36,6 +38,9 @@ redis = get_redis_connection()
 
 MAX_DIFF_SIZE = 170
 
+# max number of file sources fetched from the provider at once
+MAX_CONCURRENT_SOURCE_FETCHES = 10
+
 
 def _is_added(line_value):
     return line_value and line_value[0] == "+"
@@ -101,14 +106,15 @@ class FileComparisonTraverseManager:
             }
 
             The segment["header"], also known as the hunk-header (https://en.wikipedia.org/wiki/Diff#Unified_format),
-            is an array of strings, which is why we have to use the int() builtin function
-            to compare with self.head_ln and self.base_ln. It is used by this algorithm to
+            is an array of strings, which are parsed into integers once when the manager is
+            created. It is used by this algorithm to
               1. Set initial values for the self.base_ln and self.head_ln line-counters, and
               2. Detect if self.base and/or self.head refer to lines in the diff at any given time
 
             This algorithm relies on the fact that segments are returned in ascending
             order for each file, which means that the "nearest" segment to the current line
-            being traversed is located at segments[0].
+            being traversed is the one at the segment cursor. Segments are not copied or
+            mutated during traversal.
 
         src -- this is the source code of the file at the head-reference, where each line
             is a cell in the array. If we are not traversing a segment, and src is provided,
@@ -116,47 +122,54 @@ class FileComparisonTraverseManager:
         """
         self.head_file_eof = head_file_eof
         self.base_file_eof = base_file_eof
-        self.segments = copy.deepcopy(segments)
         self.src = src
 
-        if self.segments:
+        # Hunk headers are parsed once up front into parallel integer arrays of
+        # half-open [start, end) ranges, and segments are walked with cursors
+        # instead of being copied and mutated. Segment lines are never modified.
+        self._segment_lines = []
+        self._base_starts, self._base_ends = [], []
+        self._head_starts, self._head_ends = [], []
+        for segment in segments:
+            header = segment["header"]
+            base_start, head_start = int(header[0]), int(header[2])
+            self._base_starts.append(base_start)
+            self._base_ends.append(base_start + int(header[1] or 1))
+            self._head_starts.append(head_start)
+            self._head_ends.append(head_start + int(header[3] or 1))
+            self._segment_lines.append(segment.get("lines", []))
+
+        # index of the segment currently "nearest" to the traversal, and index
+        # of the next line to visit within that segment
+        self._segment_idx = 0
+        self._line_idx = 0
+
+        if self._segment_lines:
             # Base offsets can be 0 if files are added or removed
-            self.base_ln = min(1, int(self.segments[0]["header"][0]))
-            self.head_ln = min(1, int(self.segments[0]["header"][2]))
+            self.base_ln = min(1, self._base_starts[0])
+            self.head_ln = min(1, self._head_starts[0])
         else:
             self.base_ln, self.head_ln = 1, 1
 
+    def _has_segments(self):
+        return self._segment_idx < len(self._segment_lines)
+
     def traverse_finished(self):
-        if self.segments:
+        if self._has_segments():
             return False
         if self.src:
             return self.head_ln > len(self.src)
         return self.head_ln >= self.head_file_eof and self.base_ln >= self.base_file_eof
 
     def traversing_diff(self):
-        if self.segments == []:
+        if not self._has_segments():
             return False
 
-        base_ln_within_offset = (
-            int(self.segments[0]["header"][0])
-            <= self.base_ln
-            < int(self.segments[0]["header"][0])
-            + int(self.segments[0]["header"][1] or 1)
-        )
-        head_ln_within_offset = (
-            int(self.segments[0]["header"][2])
-            <= self.head_ln
-            < int(self.segments[0]["header"][2])
-            + int(self.segments[0]["header"][3] or 1)
+        idx = self._segment_idx
+        return (
+            self._base_starts[idx] <= self.base_ln < self._base_ends[idx]
+            or self._head_starts[idx] <= self.head_ln < self._head_ends[idx]
         )
-        return base_ln_within_offset or head_ln_within_offset
-
-    def pop_line(self):
-        if self.traversing_diff():
-            return self.segments[0]["lines"].pop(0)
-
-        if self.src:
-            return self.src[self.head_ln - 1]
 
     def apply(self, visitors):
         """
@@ -169,30 +182,44 @@ class FileComparisonTraverseManager:
         visitors -- A list of visitors applied to each line.
         """
         while not self.traverse_finished():
-            line_value = self.pop_line()
             is_diff = self.traversing_diff()
+            if is_diff:
+                line_value = self._segment_lines[self._segment_idx][self._line_idx]
+                self._line_idx += 1
+            elif self.src:
+                line_value = self.src[self.head_ln - 1]
+            else:
+                line_value = None
+
+            added = is_diff and _is_added(line_value)
+            removed = is_diff and not added and _is_removed(line_value)
+            base_ln = None if added else self.base_ln
+            head_ln = None if removed else self.head_ln
 
             for visitor in visitors:
                 visitor(
-                    None if is_diff and _is_added(line_value) else self.base_ln,
-                    None if is_diff and _is_removed(line_value) else self.head_ln,
+                    base_ln,
+                    head_ln,
                     line_value,
                     is_diff,  # TODO(pierce): remove when upon combining diff + changes tabs in UI
                 )
 
-            if is_diff and _is_added(line_value):
+            if added:
                 self.head_ln += 1
-            elif is_diff and _is_removed(line_value):
+            elif removed:
                 self.base_ln += 1
             else:
                 self.head_ln += 1
                 self.base_ln += 1
 
-            if self.segments and not self.segments[0]["lines"]:
+            if self._has_segments() and self._line_idx >= len(
+                self._segment_lines[self._segment_idx]
+            ):
                 # Either the segment has no lines (and is therefore of no use)
-                # or all lines have been popped and visited, which means we are
+                # or all lines have been visited, which means we are
                 # done traversing it
-                self.segments.pop(0)
+                self._segment_idx += 1
+                self._line_idx = 0
 
 
 class FileComparisonVisitor:
@@ -247,11 +274,13 @@ class CreateLineComparisonVisitor(FileComparisonVisitor):
     A visitor that creates LineComparisons, and stores the
     result in self.lines. Only operates on lines that have
     code-values derived from segments or src in FileComparisonTraverseManager.
+    The lines are stored column-wise (see LineComparisons), so no per-line
+    objects are created here.
     """
 
     def __init__(self, base_file, head_file):
         self.base_file, self.head_file = base_file, head_file
-        self.lines = []
+        self.lines = LineComparisons()
 
     def __call__(self, base_ln, head_ln, value, is_diff):
         if value is None:
@@ -260,14 +289,12 @@ class CreateLineComparisonVisitor(FileComparisonVisitor):
         base_line, head_line = self._get_lines(base_ln, head_ln)
 
         self.lines.append(
-            LineComparison(
-                base_line=base_line,
-                head_line=head_line,
-                base_ln=base_ln,
-                head_ln=head_ln,
-                value=value,
-                is_diff=is_diff,
-            )
+            base_line=base_line,
+            head_line=head_line,
+            base_ln=base_ln,
+            head_ln=head_ln,
+            value=value,
+            is_diff=is_diff,
         )
 
 
@@ -382,6 +409,114 @@ class LineComparison:
             return ids
 
 
+class LineComparisons(Sequence):
+    """
+    Columnar representation of the lines in a FileComparison. The data for each
+    line is kept in parallel lists (line numbers, values, coverage types, ...) and
+    a LineComparison is only materialized when an individual line is accessed,
+    which usually means a serializer or resolver is rendering it.
+
+    `base_line` and `head_line` are references to the underlying report line
+    arrays, so storing them doesn't allocate anything per line.
+    """
+
+    __slots__ = (
+        "base_lines",
+        "head_lines",
+        "base_lns",
+        "head_lns",
+        "values",
+        "is_diffs",
+        "added",
+        "removed",
+        "base_coverages",
+        "head_coverages",
+    )
+
+    def __init__(self):
+        self.base_lines = []
+        self.head_lines = []
+        self.base_lns = []
+        self.head_lns = []
+        self.values = []
+        self.is_diffs = []
+        self.added = []
+        self.removed = []
+        self.base_coverages = []
+        self.head_coverages = []
+
+    @classmethod
+    def from_lines(cls, lines):
+        """
+        Builds the columnar representation from an iterable of LineComparisons.
+        Returns `lines` unchanged if it is already columnar.
+        """
+        if isinstance(lines, cls):
+            return lines
+
+        line_comparisons = cls()
+        for line in lines:
+            line_comparisons.append(
+                base_line=line.base_line,
+                head_line=line.head_line,
+                base_ln=line.base_ln,
+                head_ln=line.head_ln,
+                value=line.value,
+                is_diff=line.is_diff,
+            )
+        return line_comparisons
+
+    def append(self, base_line, head_line, base_ln, head_ln, value, is_diff):
+        added = bool(is_diff and _is_added(value))
+        removed = bool(is_diff and _is_removed(value))
+
+        self.base_lines.append(base_line)
+        self.head_lines.append(head_line)
+        self.base_lns.append(base_ln)
+        self.head_lns.append(head_ln)
+        self.values.append(value)
+        self.is_diffs.append(is_diff)
+        self.added.append(added)
+        self.removed.append(removed)
+        self.base_coverages.append(
+            None if added or not base_line else line_type(base_line[0])
+        )
+        self.head_coverages.append(
+            None if removed or not head_line else line_type(head_line[0])
+        )
+
+    def changed_indexes(self) -> List[int]:
+        """
+        Indexes of the lines where either the coverage or the code has changed
+        """
+        return [
+            idx
+            for idx, (base_coverage, head_coverage, added, removed) in enumerate(
+                zip(self.base_coverages, self.head_coverages, self.added, self.removed)
+            )
+            if base_coverage != head_coverage or added or removed
+        ]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            line_comparisons = LineComparisons()
+            for name in self.__slots__:
+                setattr(line_comparisons, name, getattr(self, name)[idx])
+            return line_comparisons
+
+        return LineComparison(
+            base_line=self.base_lines[idx],
+            head_line=self.head_lines[idx],
+            base_ln=self.base_lns[idx],
+            head_ln=self.head_lns[idx],
+            value=self.values[idx],
+            is_diff=self.is_diffs[idx],
+        )
+
+
 class Segment:
     """
     A segment represents a contiguous subset of lines in a file where either
@@ -396,17 +531,10 @@ class Segment:
 
     @classmethod
     def segments(cls, file_comparison):
-        lines = file_comparison.lines
+        lines = LineComparisons.from_lines(file_comparison.lines)
 
         # line numbers of interest (i.e. coverage changed or code changed)
-        line_numbers = []
-        for idx, line in enumerate(lines):
-            if (
-                line.coverage["base"] != line.coverage["head"]
-                or line.added
-                or line.removed
-            ):
-                line_numbers.append(idx)
+        line_numbers = lines.changed_indexes()
 
         segmented_lines = []
         if len(line_numbers) > 0:
@@ -433,27 +561,30 @@ class Segment:
         return segments
 
     def __init__(self, lines):
-        self._lines = lines
+        self._lines = LineComparisons.from_lines(lines)
 
     @property
     def header(self):
-        base_start = None
-        head_start = None
-        num_removed = 0
-        num_added = 0
-        num_context = 0
-
-        for line in self.lines:
-            if base_start is None and line.number["base"] is not None:
-                base_start = int(line.number["base"])
-            if head_start is None and line.number["head"] is not None:
-                head_start = int(line.number["head"])
-            if line.added:
-                num_added += 1
-            elif line.removed:
-                num_removed += 1
-            else:
-                num_context += 1
+        lines = self._lines
+        base_start = next(
+            (
+                int(base_ln)
+                for base_ln, added in zip(lines.base_lns, lines.added)
+                if base_ln is not None and not added
+            ),
+            None,
+        )
+        head_start = next(
+            (
+                int(head_ln)
+                for head_ln, removed in zip(lines.head_lns, lines.removed)
+                if head_ln is not None and not removed
+            ),
+            None,
+        )
+        num_added = sum(lines.added)
+        num_removed = sum(lines.removed)
+        num_context = len(lines) - num_added - num_removed
 
         return (
             base_start or 0,
@@ -468,17 +599,15 @@ class Segment:
 
     @property
     def has_diff_changes(self):
-        for line in self.lines:
-            if line.added or line.removed:
-                return True
-        return False
+        return any(self._lines.added) or any(self._lines.removed)
 
     @property
     def has_unintended_changes(self):
-        for line in self.lines:
-            head_coverage = line.coverage["base"]
-            base_coverage = line.coverage["head"]
-            if not (line.added or line.removed) and (base_coverage != head_coverage):
+        lines = self._lines
+        for base_coverage, head_coverage, added, removed in zip(
+            lines.base_coverages, lines.head_coverages, lines.added, lines.removed
+        ):
+            if not (added or removed) and base_coverage != head_coverage:
                 return True
         return False
 
@@ -653,10 +782,39 @@ class Comparison(object):
 
     @cached_property
     def files(self):
-        for file_name in self.head_report.files:
-            yield self.get_file_comparison(file_name)
+        yield from self.get_file_comparisons(self.head_report.files)
 
     def get_file_comparison(self, file_name, with_src=False, bypass_max_diff=False):
+        src = self._fetch_sources([file_name])[file_name] if with_src else []
+        return self._build_file_comparison(file_name, src, bypass_max_diff)
+
+    def get_file_comparisons(
+        self, file_names, with_src=False, bypass_max_diff=False, return_exceptions=False
+    ) -> List[FileComparison]:
+        """
+        Batch version of `get_file_comparison`. When `with_src` is set the sources
+        of all the files are fetched from the provider concurrently.
+
+        With `return_exceptions` a file whose source couldn't be fetched gets the
+        exception in place of its comparison instead of failing the whole batch.
+        """
+        sources = (
+            self._fetch_sources(file_names, return_exceptions=return_exceptions)
+            if with_src
+            else {}
+        )
+        results = []
+        for file_name in file_names:
+            src = sources.get(file_name, [])
+            if isinstance(src, Exception):
+                results.append(src)
+            else:
+                results.append(
+                    self._build_file_comparison(file_name, src, bypass_max_diff)
+                )
+        return results
+
+    def _build_file_comparison(self, file_name, src, bypass_max_diff):
         head_file = self.head_report.get(file_name)
         diff_data = self.git_comparison["diff"]["files"].get(file_name)
 
@@ -667,20 +825,6 @@ class Comparison(object):
         else:
             base_file = None
 
-        if with_src:
-            adapter = RepoProviderService().get_adapter(
-                owner=self.user, repo=self.base_commit.repository
-            )
-            file_content = async_to_sync(adapter.get_source)(
-                file_name, self.head_commit.commitid
-            )["content"]
-            # make sure the file is str utf-8
-            if type(file_content) is not str:
-                file_content = str(file_content, "utf-8")
-            src = file_content.splitlines()
-        else:
-            src = []
-
         return FileComparison(
             base_file=base_file,
             head_file=head_file,
@@ -689,6 +833,37 @@ class Comparison(object):
             bypass_max_diff=bypass_max_diff,
         )
 
+    def _fetch_sources(
+        self, file_names, return_exceptions=False
+    ) -> dict[str, List[str]]:
+        """
+        Fetches the sources of the given files at the head commit, at most
+        `MAX_CONCURRENT_SOURCE_FETCHES` at a time. Returns the lines of each file
+        (or the error fetching it with `return_exceptions`).
+        """
+        adapter = RepoProviderService().get_adapter(
+            owner=self.user, repo=self.base_commit.repository
+        )
+
+        async def fetch_source(semaphore, file_name):
+            async with semaphore:
+                file_content = (
+                    await adapter.get_source(file_name, self.head_commit.commitid)
+                )["content"]
+            # make sure the file is str utf-8
+            if type(file_content) is not str:
+                file_content = str(file_content, "utf-8")
+            return file_content.splitlines()
+
+        async def runnable():
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCE_FETCHES)
+            return await asyncio.gather(
+                *[fetch_source(semaphore, file_name) for file_name in file_names],
+                return_exceptions=return_exceptions,
+            )
+
+        return dict(zip(file_names, async_to_sync(runnable)()))
+
     @property
     def git_comparison(self):
         return self._fetch_comparison_and_reverse_comparison[0]
@@ -826,6 +1001,26 @@ class FlagComparison(object):
         return self.head_report.apply_diff(git_comparison["diff"])
 
 
+def _count_misses(line_coverages: List[tuple[int, str]]) -> int:
+    return sum(1 for _, coverage in line_coverages if coverage == "m")
+
+
+def _change_coverage(base_coverage, head_coverage) -> Optional[float]:
+    if (
+        base_coverage
+        and base_coverage.coverage
+        and head_coverage
+        and head_coverage.coverage
+    ):
+        return float(head_coverage.coverage - base_coverage.coverage)
+
+
+def _file_name(head_name: Optional[str]) -> Optional[str]:
+    if head_name:
+        parts = head_name.split("/")
+        return parts[-1]
+
+
 @dataclass
 class ImpactedFile:
     @dataclass
@@ -834,6 +1029,14 @@ class ImpactedFile:
             nb_branches = self.hits + self.misses + self.partials
             self.coverage = (100 * self.hits / nb_branches) if nb_branches > 0 else None
 
+        @classmethod
+        def from_lines(cls, line_coverages: List[tuple[int, str]]):
+            """
+            Sums of hits, misses and partials of (line number, coverage) tuples
+            """
+            counts = Counter(coverage for _, coverage in line_coverages)
+            return cls(hits=counts["h"], misses=counts["m"], partials=counts["p"])
+
     base_name: Optional[str] = None  # will be `None` for created files
     head_name: Optional[str] = None  # will be `None` for deleted files
     file_was_added_by_diff: bool = False
@@ -901,32 +1104,14 @@ class ImpactedFile:
         """
         Returns the misses count for a unintended impacted file
         """
-        misses = 0
-
-        unexpected_line_changes = self.unexpected_line_changes or []
-        for [
-            base,
-            [head_line_number, head_coverage_value],
-        ] in unexpected_line_changes:
-            if head_coverage_value == "m":
-                misses += 1
-
-        return misses
+        return _count_misses(head for _, head in self.unexpected_line_changes or [])
 
     @cached_property
     def _direct_misses_count(self) -> int:
         """
         Returns the misses count for a direct impacted file
         """
-
-        misses = 0
-
-        diff_coverage = self.added_diff_coverage or []
-        for line_number, line_coverage_value in diff_coverage:
-            if line_coverage_value == "m":
-                misses += 1
-
-        return misses
+        return _count_misses(self.added_diff_coverage or [])
 
     @cached_property
     def patch_coverage(self) -> Optional[Totals]:
@@ -934,33 +1119,110 @@ class ImpactedFile:
         Sums of hits, misses and partials in the diff
         """
         if self.added_diff_coverage and len(self.added_diff_coverage) > 0:
-            hits, misses, partials = (0, 0, 0)
-            for added_coverage in self.added_diff_coverage:
-                [_, type_coverage] = added_coverage
-                if type_coverage == "h":
-                    hits += 1
-                if type_coverage == "m":
-                    misses += 1
-                if type_coverage == "p":
-                    partials += 1
-
-            return ImpactedFile.Totals(hits=hits, misses=misses, partials=partials)
+            return ImpactedFile.Totals.from_lines(self.added_diff_coverage)
 
     @cached_property
     def change_coverage(self) -> Optional[float]:
-        if (
-            self.base_coverage
-            and self.base_coverage.coverage
-            and self.head_coverage
-            and self.head_coverage.coverage
-        ):
-            return float(self.head_coverage.coverage - self.base_coverage.coverage)
+        return _change_coverage(self.base_coverage, self.head_coverage)
 
     @cached_property
     def file_name(self) -> Optional[str]:
-        if self.head_name:
-            parts = self.head_name.split("/")
-            return parts[-1]
+        return _file_name(self.head_name)
+
+
+class ImpactedFileSummary(NamedTuple):
+    """
+    The attributes impacted files are filtered and sorted by, computed from the
+    raw comparison data without creating the `ImpactedFile`.
+    """
+
+    head_name: Optional[str]
+    file_name: Optional[str]
+    has_diff: bool
+    has_changes: bool
+    head_coverage: Optional[float]
+    change_coverage: Optional[float]
+    misses_count: int
+    patch_coverage: Optional[float]
+
+    @classmethod
+    def from_data(cls, data: dict) -> "ImpactedFileSummary":
+        added_diff_coverage = data.get("added_diff_coverage") or []
+        unexpected_line_changes = data.get("unexpected_line_changes") or []
+        base_coverage = (
+            ImpactedFile.Totals(**data["base_coverage"])
+            if data.get("base_coverage")
+            else None
+        )
+        head_coverage = (
+            ImpactedFile.Totals(**data["head_coverage"])
+            if data.get("head_coverage")
+            else None
+        )
+        # same as `ImpactedFile.has_diff` and `ImpactedFile.has_changes`
+        has_diff = bool(
+            added_diff_coverage
+            or data.get("removed_diff_coverage")
+            or data.get("file_was_added_by_diff")
+            or data.get("file_was_removed_by_diff")
+        )
+        return cls(
+            head_name=data.get("head_name"),
+            file_name=_file_name(data.get("head_name")),
+            has_diff=has_diff,
+            has_changes=len(unexpected_line_changes) > 0,
+            head_coverage=head_coverage.coverage if head_coverage else None,
+            change_coverage=_change_coverage(base_coverage, head_coverage),
+            misses_count=_count_misses(added_diff_coverage)
+            + _count_misses(head for _, head in unexpected_line_changes),
+            patch_coverage=ImpactedFile.Totals.from_lines(added_diff_coverage).coverage
+            if added_diff_coverage
+            else None,
+        )
+
+
+class ImpactedFilesIndex(Sequence):
+    """
+    The files of a worker-computed comparison, indexed by head path.
+
+    `ImpactedFile`s are only created when accessed so that looking up a single
+    file out of a large comparison doesn't build all of them. Filtering and
+    sorting is done over the files' `summaries` instead.
+    """
+
+    def __init__(self, files_data: List[dict]):
+        self._data = files_data
+        self._files: List[Optional[ImpactedFile]] = [None] * len(files_data)
+        self._positions = {}
+        for idx, data in enumerate(files_data):
+            self._positions.setdefault(data.get("head_name"), idx)
+
+    def find(self, head_name: str) -> Optional[ImpactedFile]:
+        idx = self._positions.get(head_name)
+        if idx is not None:
+            return self[idx]
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        file = self._files[idx]
+        if file is None:
+            file = self._files[idx] = ImpactedFile.create(**self._data[idx])
+        return file
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @cached_property
+    def summaries(self) -> List[ImpactedFileSummary]:
+        return [ImpactedFileSummary.from_data(data) for data in self._data]
+
+
+# parsed comparison data shared by the `ComparisonReport`s of the same comparison,
+# bounded by the size of the raw JSON
+_comparison_data_cache = SizeBoundedLRUCache(
+    settings.COMPARISON_REPORT_CACHE_MAX_SIZE, sizeof=lambda entry: entry[0]
+)
 
 
 @dataclass
@@ -974,19 +1236,19 @@ class ComparisonReport(object):
     commit_comparison: CommitComparison = None
 
     @cached_property
-    def files(self) -> List[ImpactedFile]:
+    def _index(self) -> ImpactedFilesIndex:
         if not self.commit_comparison.report_storage_path:
-            return []
+            return ImpactedFilesIndex([])
 
         comparison_data = self._fetch_raw_comparison_data()
-        return [
-            ImpactedFile.create(**data) for data in comparison_data.get("files", [])
-        ]
+        return ImpactedFilesIndex(comparison_data.get("files", []))
+
+    @cached_property
+    def files(self) -> List[ImpactedFile]:
+        return list(self._index)
 
     def impacted_file(self, path: str) -> Optional[ImpactedFile]:
-        for file in self.files:
-            if file.head_name == path:
-                return file
+        return self._index.find(path)
 
     @cached_property
     def impacted_files(self) -> List[ImpactedFile]:
@@ -994,27 +1256,68 @@ class ComparisonReport(object):
 
     @cached_property
     def impacted_files_with_unintended_changes(self) -> List[ImpactedFile]:
-        return [file for file in self.files if file.has_changes]
+        return self.impacted_files_at(self.unintended_changes_positions)
 
     @cached_property
     def impacted_files_with_direct_changes(self) -> List[ImpactedFile]:
-        return [file for file in self.files if file.has_diff or not file.has_changes]
+        return self.impacted_files_at(self.direct_changes_positions)
+
+    @property
+    def summaries(self) -> List[ImpactedFileSummary]:
+        """
+        Summaries of the impacted files, in the same order as `impacted_files`
+        """
+        return self._index.summaries
+
+    @cached_property
+    def unintended_changes_positions(self) -> List[int]:
+        return [
+            idx for idx, summary in enumerate(self.summaries) if summary.has_changes
+        ]
+
+    @cached_property
+    def direct_changes_positions(self) -> List[int]:
+        return [
+            idx
+            for idx, summary in enumerate(self.summaries)
+            if summary.has_diff or not summary.has_changes
+        ]
+
+    def impacted_files_at(self, positions: List[int]) -> List[ImpactedFile]:
+        return [self._index[idx] for idx in positions]
 
     def _fetch_raw_comparison_data(self) -> dict:
         """
-        Fetches the raw comparison data from storage
+        Fetches the raw comparison data from storage. When enabled, the parsed data
+        is cached per version of the comparison since it's requested by several
+        resolvers.
         """
+        key = None
+        if settings.COMPARISON_REPORT_CACHE_ENABLED:
+            key = (
+                self.commit_comparison.pk,
+                self.commit_comparison.report_storage_path,
+                self.commit_comparison.updated_at,
+            )
+            entry = _comparison_data_cache.get(key)
+            if entry is not None:
+                return entry[1]
+
         repository = self.commit_comparison.compare_commit.repository
         archive_service = ArchiveService(repository)
         try:
             data = archive_service.read_file(self.commit_comparison.report_storage_path)
-            return json.loads(data)
+            comparison_data = json.loads(data)
         except:
             log.error(
                 "ComparisonReport - couldn't fetch data from storage", exc_info=True
             )
             return {}
 
+        if key is not None:
+            _comparison_data_cache.set(key, (len(data), comparison_data))
+        return comparison_data
+
 
 class PullRequestComparison(Comparison):
     """
@@ -1107,13 +1410,13 @@ class PullRequestComparison(Comparison):
             yield file_comparison
         self._set_files_with_changes_in_cache(files_with_changes)
 
-    def get_file_comparison(self, file_name, with_src=False, bypass_max_diff=False):
+    def _build_file_comparison(self, file_name, src, bypass_max_diff):
         """
-        Overrides the 'get_file_comparison' method to set the "should_search_for_changes"
+        Overrides the '_build_file_comparison' method to set the "should_search_for_changes"
         field.
         """
-        file_comparison = super().get_file_comparison(
-            file_name, with_src=with_src, bypass_max_diff=bypass_max_diff
+        file_comparison = super()._build_file_comparison(
+            file_name, src, bypass_max_diff
         )
         file_comparison.should_search_for_changes = (
             file_name in self._files_with_changes
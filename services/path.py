@@ -1,8 +1,9 @@
 import re
+from bisect import bisect_right
 from collections import defaultdict
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Iterable, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 import sentry_sdk
 from asgiref.sync import async_to_sync
@@ -16,6 +17,7 @@ import services.report as report_service
 from codecov_auth.models import Owner
 from core.models import Commit
 from services.repo_providers import RepoProviderService
+from services.report_cache import ChunksCache, SizeBoundedLRUCache
 
 
 class PathNode:
@@ -138,9 +140,144 @@ def dashboard_commit_file_url(
     return f"{settings.CODECOV_DASHBOARD_URL}/{service}/{owner}/{repo}/commit/{commit.commitid}/{commit_path}"
 
 
+class PathTree:
+    """
+    Directory tree of the files in a report, built once so that it can be shared
+    by every request for the same report.
+
+    Every directory is a `Dir` node whose rolled-up totals are computed when the
+    tree is built. Any file or directory can be looked up by its full path, and
+    substring searches run against a prebuilt lowercase index of all the paths.
+    """
+
+    def __init__(self, files: List[str], totals: Callable[[str], ReportTotals]):
+        self.files = list(files)
+        self.root = Dir(full_path="", children=[])
+        self._nodes: Dict[str, PathNode] = {"": self.root}
+        self._positions = {full_path: idx for idx, full_path in enumerate(self.files)}
+
+        for full_path in self.files:
+            self._insert(full_path, totals(full_path))
+
+        # roll up the totals of every directory
+        self.root.totals
+
+        # all the lowercased paths joined into a single string so that a search
+        # is a few `str.find` calls instead of a `lower()` + `in` per path
+        self._search_index = "\n".join(self.files).lower()
+        self._search_starts = []
+        start = 0
+        for full_path in self.files:
+            self._search_starts.append(start)
+            start += len(full_path) + 1
+
+    def _insert(self, full_path: str, totals: ReportTotals) -> None:
+        parent = self.root
+        parts = full_path.split("/")
+        for depth in range(1, len(parts)):
+            dir_path = "/".join(parts[:depth])
+            node = self._nodes.get(dir_path)
+            if not isinstance(node, Dir):
+                if node is not None:
+                    # a file with the same path as a directory
+                    parent.children.remove(node)
+                node = Dir(full_path=dir_path, children=[])
+                self._nodes[dir_path] = node
+                parent.children.append(node)
+            parent = node
+
+        if full_path not in self._nodes:
+            node = File(full_path=full_path, totals=totals)
+            self._nodes[full_path] = node
+            parent.children.append(node)
+
+    def get(self, full_path: Optional[str]) -> Optional[PathNode]:
+        return self._nodes.get(full_path or "")
+
+    def file_indexes(self, prefix: Optional[str] = None) -> List[int]:
+        """
+        Indexes (into `files`) of all the files under the given `prefix`, in the
+        order in which they appear in the report.
+        """
+        node = self.get(prefix)
+        if node is None:
+            return []
+
+        indexes = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Dir):
+                stack.extend(node.children)
+            else:
+                indexes.append(self._positions[node.full_path])
+        return sorted(indexes)
+
+    def search(self, term: str, prefix: Optional[str] = None) -> List[int]:
+        """
+        Indexes of the files under `prefix` whose path relative to `prefix`
+        contains `term` (case-insensitive).
+        """
+        indexes = self.file_indexes(prefix)
+        term = term.lower()
+        if not term:
+            return indexes
+        if "\n" in term:
+            return []
+
+        candidates = set(indexes)
+        offset = len(prefix) + 1 if prefix else 0
+        matches = []
+        pos = self._search_index.find(term)
+        while pos >= 0:
+            idx = bisect_right(self._search_starts, pos) - 1
+            start = self._search_starts[idx]
+            full_path = self.files[idx]
+            if idx in candidates and full_path != prefix:
+                start += offset
+            end = self._search_starts[idx] + len(full_path)
+
+            if pos >= start and pos + len(term) <= end:
+                if idx in candidates:
+                    matches.append(idx)
+                # move on to the next path
+                pos = self._search_index.find(term, end + 1)
+            else:
+                pos = self._search_index.find(term, pos + 1)
+        return matches
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+
+_path_tree_cache = SizeBoundedLRUCache(settings.REPORT_CACHE_PATH_TREE_MAX_FILES)
+
+
+def report_path_tree(commit: Commit, report: Report) -> Optional[PathTree]:
+    """
+    Returns the (cached) directory tree of the given commit's unfiltered report,
+    or `None` if report caching is disabled.
+    """
+    if not settings.REPORT_CACHE_ENABLED:
+        return None
+
+    key = ChunksCache.key(commit)
+    if key is None:
+        return None
+
+    tree = _path_tree_cache.get(key)
+    if tree is None:
+        tree = PathTree(report.files, report.get_file_totals)
+        _path_tree_cache.set(key, tree)
+    return tree
+
+
 class ReportPaths:
     """
     Contains methods for getting path information out of a single report.
+
+    A prebuilt `tree` of the unfiltered report can be passed in to be reused,
+    it is ignored when filtering by flags or paths.
     """
 
     @sentry_sdk.trace
@@ -151,6 +288,7 @@ class ReportPaths:
         search_term: str = None,
         filter_flags: List[str] = [],
         filter_paths: List[str] = [],
+        tree: Optional[PathTree] = None,
     ):
         self.report = report
         self.unfiltered_report = report
@@ -164,18 +302,28 @@ class ReportPaths:
                 paths=self.filter_paths, flags=self.filter_flags
             )
 
-        self._paths = [
-            PrefixedPath(full_path=full_path, prefix=self.prefix)
-            for full_path in self.files
-            if is_subpath(full_path, self.prefix)
-        ]
+        if tree is not None and not self.filter_flags and not self.filter_paths:
+            self.tree = tree
+        else:
+            self.tree = PathTree(
+                [
+                    full_path
+                    for full_path in self.files
+                    if is_subpath(full_path, self.prefix)
+                ],
+                self._totals,
+            )
 
+        self.search_term = search_term
         if search_term:
-            self._paths = [
-                path
-                for path in self.paths
-                if search_term.lower() in path.relative_path.lower()
-            ]
+            indexes = self.tree.search(search_term, prefix=self.prefix)
+        else:
+            indexes = self.tree.file_indexes(prefix=self.prefix)
+
+        self._paths = [
+            PrefixedPath(full_path=self.tree.files[idx], prefix=self.prefix)
+            for idx in indexes
+        ]
 
     @cached_property
     def files(self) -> List[str]:
@@ -212,30 +360,35 @@ class ReportPaths:
         """
         Return a flat file list of all files under the specified `path` prefix/directory.
         """
-        return [
-            File(full_path=path.full_path, totals=self._totals(path))
-            for path in self.paths
-        ]
+        return [self.tree.get(path.full_path) for path in self.paths]
 
     @sentry_sdk.trace
     def single_directory(self) -> Iterable[Union[File, Dir]]:
         """
         Return a single directory (specified by `path`) of mixed file/directory results.
         """
-        return self._single_directory_recursive(self.paths)
+        if self.search_term:
+            return self._single_directory_recursive(self.paths)
 
-    def _totals(self, path: PrefixedPath) -> ReportTotals:
+        node = self.tree.get(self.prefix)
+        if node is None:
+            return []
+        if isinstance(node, File):
+            return [node]
+        return list(node.children)
+
+    def _totals(self, full_path: str) -> ReportTotals:
         """
-        Returns the report totals for a given prefixed path.
+        Returns the report totals for a given path.
         """
         # Fixes an issue when filtering by flags does not work in the case where
         # one flag covers half of the file and another flag covers another half.
         # Using get_file_totals will return the totals for coverage of all flags
         # applied to the file instead of just the filter flags being queried
         if self.filter_flags:
-            return self.report.get(path.full_path).totals
+            return self.report.get(full_path).totals
         else:
-            return self.report.get_file_totals(path.full_path)
+            return self.report.get_file_totals(full_path)
 
     def _single_directory_recursive(
         self, paths: Iterable[PrefixedPath]
@@ -249,10 +402,7 @@ class ReportPaths:
         for basename, paths in grouped.items():
             paths = list(paths)
             if len(paths) == 1 and paths[0].is_file:
-                path = paths[0]
-                results.append(
-                    File(full_path=path.full_path, totals=self._totals(path))
-                )
+                results.append(self.tree.get(paths[0].full_path))
             else:
                 children = self._single_directory_recursive(
                     [
@@ -1,20 +1,20 @@
 import logging
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 import sentry_sdk
 from django.conf import settings
-from django.db.models import Prefetch, Q
+from django.db.models import Prefetch, Q, QuerySet, prefetch_related_objects
 from django.utils.functional import cached_property
 from shared.helpers.flag import Flag
 from shared.reports.readonly import ReadOnlyReport as SharedReadOnlyReport
-from shared.reports.resources import Report
+from shared.reports.resources import Report, ReportFile
 from shared.reports.types import ReportFileSummary, ReportTotals
 from shared.storage.exceptions import FileNotInStorageError
 from shared.utils.sessions import Session, SessionType
 
 from core.models import Commit
 from reports.models import AbstractTotals, CommitReport, ReportDetails, ReportSession
-from services.archive import ArchiveService
+from services.chunks import ChunksReader, fetch_chunks
 from utils.config import RUN_ENV
 
 log = logging.getLogger(__name__)
@@ -69,17 +69,9 @@ def build_report_from_commit(commit: Commit, report_class=None):
     from various `reports_*` tables in the database.
     """
 
-    # TODO: this can be removed once confirmed working well on prod
-    new_report_builder_enabled = (
-        RUN_ENV == "DEV"
-        or RUN_ENV == "STAGING"
-        or RUN_ENV == "TESTING"
-        or commit.repository_id in settings.REPORT_BUILDER_REPO_IDS
-    )
-
     with sentry_sdk.start_span(description="Fetch files/sessions/totals"):
         commit_report = fetch_commit_report(commit)
-        if commit_report and new_report_builder_enabled:
+        if commit_report and _new_report_builder_enabled(commit):
             files = build_files(commit_report)
             sessions = build_sessions(commit_report)
             try:
@@ -96,7 +88,7 @@ def build_report_from_commit(commit: Commit, report_class=None):
 
     try:
         with sentry_sdk.start_span(description="Fetch chunks"):
-            chunks = ArchiveService(commit.repository).read_chunks(commit.commitid)
+            chunks = fetch_chunks(commit)
         return build_report(chunks, files, sessions, totals, report_class=report_class)
     except FileNotInStorageError:
         log.warning(
@@ -109,13 +101,147 @@ def build_report_from_commit(commit: Commit, report_class=None):
         return None
 
 
-def fetch_commit_report(commit: Commit) -> Optional[CommitReport]:
+@sentry_sdk.trace
+def build_report_file_from_commit(commit: Commit, path: str) -> Optional[ReportFile]:
     """
-    Fetch a single `CommitReport` for the given commit.
-    All the necessary report relations are prefetched.
+    Builds the `shared.reports.resources.ReportFile` for a single path of the
+    given commit's report.
+
+    When `REPORT_CHUNKS_INDEX_ENABLED` is set only the chunk belonging to that file
+    is decoded (see `services.chunks.ChunksReader`) instead of the whole report.
+    """
+    if not settings.REPORT_CHUNKS_INDEX_ENABLED:
+        report = commit.full_report
+        return report.get(path) if report is not None else None
+
+    with sentry_sdk.start_span(description="Fetch file summary"):
+        file_summary = fetch_file_summary(commit, path)
+        if file_summary is None:
+            return None
+        file_index, file_totals = file_summary
+
+    try:
+        with sentry_sdk.start_span(description="Fetch chunk"):
+            lines = ChunksReader(commit).read_chunk(file_index)
+    except FileNotInStorageError:
+        log.warning(
+            "File for chunks not found in storage",
+            extra=dict(
+                commit=commit.commitid,
+                repo=commit.repository_id,
+            ),
+        )
+        return None
+
+    return ReportFile(name=path, totals=file_totals, lines=lines)
+
+
+def report_file_exists(commit: Commit, path: str) -> bool:
+    """
+    Whether the given commit's report includes the given path. This only looks
+    at the report's file metadata and doesn't fetch any chunks.
+    """
+    return fetch_file_summary(commit, path) is not None
+
+
+def fetch_file_summary(
+    commit: Commit, path: str
+) -> Optional[Tuple[int, Optional[ReportTotals]]]:
     """
+    Returns the `(file_index, file_totals)` of the given path in the commit's report
+    from the `reports_reportdetails.files_array` column (or the legacy
+    `commits.report` column), or `None` if the file isn't in the report.
+    """
+    commit_report = _coverage_commit_report(commit)
+    if commit_report and _new_report_builder_enabled(commit):
+        try:
+            files_array = commit_report.reportdetails.files_array
+        except CommitReport.reportdetails.RelatedObjectDoesNotExist:
+            return None
+        for file in files_array:
+            if file["filename"] == path:
+                return file["file_index"], ReportTotals(*file["file_totals"])
+        return None
+
+    if not commit.report:
+        return None
+    file_summary = commit.report["files"].get(path)
+    if file_summary is None:
+        return None
+    file_totals = file_summary[1]
+    return file_summary[0], ReportTotals(*file_totals) if file_totals else None
+
+
+def fetch_commit_ancestors(commit: Commit, limit: int) -> List[Commit]:
+    """
+    Fetches up to `limit` ancestors of the given commit, parent first, with a single
+    recursive query. The list ends early if the chain of parents is broken.
+    """
+    if limit <= 0 or not commit.parent_commit_id:
+        return []
+
+    commit_table = Commit._meta.db_table
+    repoid = Commit._meta.get_field("repository").column
+    commitid = Commit._meta.get_field("commitid").column
+    parent = Commit._meta.get_field("parent_commit_id").column
+    queryset = Commit.objects.raw(
+        f"""
+        with recursive ancestors as (
+            select {commit_table}.*, 1 as depth
+            from {commit_table}
+            where {repoid} = %s and {commitid} = %s
+            union all
+            select parent_commit.*, ancestors.depth + 1
+            from {commit_table} parent_commit
+            inner join ancestors
+                on parent_commit.{repoid} = ancestors.{repoid}
+                and parent_commit.{commitid} = ancestors.{parent}
+            where ancestors.depth < %s
+        )
+        select * from ancestors order by depth
+        """,
+        [commit.repository_id, commit.parent_commit_id, limit],
+    )
+    return list(queryset)
+
+
+def prefetch_commit_reports(commits: List[Commit]) -> None:
+    """
+    Prefetches the coverage `CommitReport` (with its `ReportDetails`) of all the
+    given commits in a single query, for use by `fetch_file_summary`.
+    """
+    prefetch_related_objects(
+        commits,
+        Prefetch(
+            "reports",
+            queryset=CommitReport.objects.coverage_reports()
+            .filter(code=None)
+            .select_related("reportdetails")
+            .order_by("id"),
+            to_attr="coverage_commit_reports",
+        ),
+    )
+
+
+def _coverage_commit_report(commit: Commit) -> Optional[CommitReport]:
+    if not hasattr(commit, "coverage_commit_reports"):
+        prefetch_commit_reports([commit])
+    return next(iter(commit.coverage_commit_reports), None)
+
+
+def _new_report_builder_enabled(commit: Commit) -> bool:
+    # TODO: this can be removed once confirmed working well on prod
     return (
-        commit.reports.coverage_reports()
+        RUN_ENV == "DEV"
+        or RUN_ENV == "STAGING"
+        or RUN_ENV == "TESTING"
+        or commit.repository_id in settings.REPORT_BUILDER_REPO_IDS
+    )
+
+
+def _full_commit_reports() -> QuerySet:
+    return (
+        CommitReport.objects.coverage_reports()
         .filter(code=None)
         .prefetch_related(
             Prefetch(
@@ -126,10 +252,35 @@ def fetch_commit_report(commit: Commit) -> Optional[CommitReport]:
             ),
         )
         .select_related("reportdetails", "reportleveltotals")
-        .first()
     )
 
 
+def prefetch_full_commit_reports(commits: List[Commit]) -> None:
+    """
+    Prefetches the coverage `CommitReport` of all the given commits, with all
+    the relations needed to build their reports, in a fixed number of queries.
+    `fetch_commit_report` uses the prefetched reports.
+    """
+    prefetch_related_objects(
+        commits,
+        Prefetch(
+            "reports",
+            queryset=_full_commit_reports().order_by("id"),
+            to_attr="full_coverage_commit_reports",
+        ),
+    )
+
+
+def fetch_commit_report(commit: Commit) -> Optional[CommitReport]:
+    """
+    Fetch a single `CommitReport` for the given commit.
+    All the necessary report relations are prefetched.
+    """
+    if hasattr(commit, "full_coverage_commit_reports"):
+        return next(iter(commit.full_coverage_commit_reports), None)
+    return _full_commit_reports().filter(commit=commit).first()
+
+
 def build_totals(totals: AbstractTotals) -> ReportTotals:
     """
     Build a `shared.reports.types.ReportTotals` instance from one of the
@@ -210,6 +361,53 @@ def build_sessions(commit_report: CommitReport) -> dict[int, Session]:
     return sessions
 
 
+def fetch_flag_totals(commit: Commit, flag_name: str) -> Optional[ReportTotals]:
+    """
+    Totals of a single flag of the commit's report.
+
+    When the flag's coverage comes from a single upload, the totals of that
+    upload are the totals of the flag, so they are read from the database with a
+    single query. Otherwise (multiple uploads need to be merged, or the uploads
+    aren't in the database) the full report is built.
+    """
+    uploads = [
+        upload
+        for upload in ReportSession.objects.filter(
+            report__in=CommitReport.objects.coverage_reports().filter(
+                commit=commit, code=None
+            ),
+            flags__flag_name=flag_name,
+        )
+        .filter(Q(state="complete") | Q(state="processed"))
+        .select_related("uploadleveltotals")
+    ]
+
+    # carried forward uploads are replaced by direct uploads of the same flag
+    # (see `build_sessions`)
+    uploaded = [
+        upload
+        for upload in uploads
+        if SessionType.get_from_string(upload.upload_type) != SessionType.carriedforward
+    ]
+    if uploaded:
+        uploads = uploaded
+
+    if len(uploads) == 1:
+        try:
+            return build_totals(uploads[0].uploadleveltotals)
+        except ReportSession.uploadleveltotals.RelatedObjectDoesNotExist:
+            pass
+
+    report = commit.full_report
+    if report is None:
+        log.warning(
+            "Commit's report not found", extra=dict(commit=commit, flag=flag_name)
+        )
+        return None
+    flag = report.flags.get(flag_name) if report.flags is not None else None
+    return flag.totals if flag else None
+
+
 def build_files(commit_report: CommitReport) -> dict[str, ReportFileSummary]:
     """
     Construct a files dictionary in a format compatible with `shared.reports.resources.Report`
@@ -255,18 +453,81 @@ def sessions_with_specific_flags(
     return dict(sessions)
 
 
+def sessions_bitmap(session_ids: Iterable[int]) -> int:
+    """
+    The bitmap of the given session ids, to be matched against the bitmaps of
+    `file_session_bitmaps`.
+    """
+    mask = 0
+    for session_id in set(session_ids):
+        if session_id is not None:
+            mask |= 1 << int(session_id)
+    return mask
+
+
 def files_in_sessions(commit_report: Report, session_ids: List[int]) -> List[str]:
-    files, session_ids = [], set(session_ids)
+    mask = sessions_bitmap(session_ids)
+    bitmaps = _session_bitmaps(commit_report)
+    files = []
     for file in commit_report:
-        found = False
-        for line in file:
-            if line:
-                for session in line.sessions:
-                    if session.id in session_ids:
-                        found = True
-                        break
-            if found:
-                break
+        bitmap = bitmaps.get(file.name)
+        if bitmap is not None:
+            found = bitmap & mask
+        else:
+            # no need to compute the whole bitmap, stop at the first line found
+            found = any(
+                (1 << int(session.id)) & mask
+                for line in file
+                if line
+                for session in line.sessions
+                if session.id is not None
+            )
         if found:
             files.append(file.name)
     return files
+
+
+def file_session_bitmaps(
+    commit_report: Report, paths: Optional[Iterable[str]] = None
+) -> dict[str, int]:
+    """
+    Maps the given files of the report (all of them by default) to a bitmap (an
+    `int` with bit `n` set for session id `n`) of the sessions that have coverage
+    in that file. Files that aren't in the report are left out.
+
+    A bitmap requires a scan of every line of the file so they're only computed
+    for the requested files, and kept on the report to be reused by later lookups.
+    """
+    bitmaps = _session_bitmaps(commit_report)
+    if paths is None:
+        paths = commit_report.files
+
+    result = {}
+    for path in paths:
+        bitmap = bitmaps.get(path)
+        if bitmap is None:
+            file = commit_report.get(path)
+            if file is None:
+                continue
+            bitmap = 0
+            for line in file:
+                if line:
+                    for session in line.sessions:
+                        if session.id is not None:
+                            bitmap |= 1 << int(session.id)
+            bitmaps[path] = bitmap
+        result[path] = bitmap
+    return result
+
+
+def _session_bitmaps(commit_report: Report) -> dict[str, int]:
+    """
+    The bitmaps computed so far for the report. They are dropped if files or
+    sessions have been added to the report since.
+    """
+    fingerprint = (len(commit_report.files), len(commit_report.sessions))
+    cached = getattr(commit_report, "_file_session_bitmaps", None)
+    if cached is None or cached[0] != fingerprint:
+        cached = (fingerprint, {})
+        commit_report._file_session_bitmaps = cached
+    return cached[1]
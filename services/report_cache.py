@@ -0,0 +1,181 @@
+import logging
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+from django.conf import settings
+from redis.exceptions import RedisError
+from shared.metrics import metrics
+
+from core.models import Commit
+from services.redis_configuration import get_redis_connection
+
+log = logging.getLogger(__name__)
+
+
+def chunks_version(commit: Commit) -> Optional[int]:
+    """
+    Version of the chunks object in storage for the given commit. The commit's
+    `updatestamp` is bumped by the worker whenever it writes new chunks, so we use
+    it (in microseconds) instead of stat'ing the object in storage.
+    """
+    if commit.updatestamp is None:
+        return None
+    return int(commit.updatestamp.timestamp() * 1_000_000)
+
+
+class SizeBoundedLRUCache:
+    """
+    Thread-safe LRU mapping bounded by the total size of its values rather than
+    by the number of entries. `sizeof` is used to measure each value.
+    """
+
+    def __init__(self, max_size: int, sizeof: Callable = len):
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value) -> None:
+        size = self.sizeof(value)
+        if size > self.max_size:
+            # would evict everything else and still not fit
+            return
+
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _pop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ChunksCache:
+    """
+    Two-tier cache of the decoded `chunks.txt` contents of commit reports: a
+    process-local LRU bounded by `max_size` bytes and an optional Redis tier
+    shared by all API pods.
+
+    The parsed `Report` itself is not cached since callers mutate it (applying
+    diffs, shifting lines) - building a report from chunks is cheap compared to
+    downloading them.
+    """
+
+    redis_key_prefix = "report_chunks"
+
+    def __init__(self, max_size: int, redis_ttl: Optional[int] = None):
+        self.local = SizeBoundedLRUCache(max_size)
+        self.redis_ttl = redis_ttl
+
+    @classmethod
+    def key(cls, commit: Commit) -> Optional[str]:
+        """
+        Cache key for the chunks of the given commit. Returns `None` (don't cache)
+        if the commit has no version we can rely on.
+        """
+        version = chunks_version(commit)
+        if version is None:
+            return None
+        return (
+            f"{cls.redis_key_prefix}/{commit.repository_id}/{commit.commitid}/{version}"
+        )
+
+    def get_or_fetch(self, key: Optional[str], fetch: Callable[[], str]) -> str:
+        if key is None:
+            return fetch()
+
+        chunks = self.local.get(key)
+        if chunks is not None:
+            metrics.incr("services.report.chunks_cache.local_hit")
+            return chunks
+
+        if self.redis_ttl:
+            chunks = self._redis_get(key)
+            if chunks is not None:
+                metrics.incr("services.report.chunks_cache.redis_hit")
+                self.local.set(key, chunks)
+                return chunks
+
+        metrics.incr("services.report.chunks_cache.miss")
+        chunks = fetch()
+        self.local.set(key, chunks)
+        if self.redis_ttl:
+            self._redis_set(key, chunks)
+        return chunks
+
+    def _redis_get(self, key: str) -> Optional[str]:
+        try:
+            data = get_redis_connection().get(key)
+        except RedisError:
+            log.warning("Error fetching report chunks from redis", exc_info=True)
+            return None
+        if data is not None:
+            return zlib.decompress(data).decode()
+
+    def _redis_set(self, key: str, chunks: str) -> None:
+        try:
+            get_redis_connection().set(
+                key, zlib.compress(chunks.encode()), ex=self.redis_ttl
+            )
+        except RedisError:
+            log.warning("Error storing report chunks in redis", exc_info=True)
+
+
+_chunks_cache = None
+_chunks_cache_lock = threading.Lock()
+
+
+def get_chunks_cache() -> Optional[ChunksCache]:
+    """
+    Returns the process-wide chunks cache, or `None` if report caching is disabled.
+    """
+    global _chunks_cache
+
+    if not settings.REPORT_CACHE_ENABLED:
+        return None
+
+    if _chunks_cache is None:
+        with _chunks_cache_lock:
+            if _chunks_cache is None:
+                _chunks_cache = ChunksCache(
+                    max_size=settings.REPORT_CACHE_MAX_SIZE,
+                    redis_ttl=settings.REPORT_CACHE_REDIS_TTL
+                    if settings.REPORT_CACHE_REDIS_ENABLED
+                    else None,
+                )
+    return _chunks_cache
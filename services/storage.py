@@ -1,5 +1,5 @@
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 
 from shared.storage.minio import MinioStorageService
 
@@ -51,6 +51,21 @@ class StorageService(MinioStorageService):
         expires = timedelta(seconds=expires)
         return self.minio_client.presigned_put_object(bucket, path, expires)
 
+    def create_presigned_puts(self, bucket, paths, expires):
+        """
+        Presigns PUTs for many paths of the same bucket. URLs are signed locally
+        by the client, all with the same request date, so this doesn't make a
+        request per path.
+        """
+        expires = timedelta(seconds=expires)
+        request_date = datetime.now(timezone.utc)
+        return [
+            self.minio_client.get_presigned_url(
+                "PUT", bucket, path, expires, request_date=request_date
+            )
+            for path in paths
+        ]
+
     def create_presigned_get(self, bucket, path, expires):
         expires = timedelta(seconds=expires)
         return self.minio_client.presigned_get_object(bucket, path, expires)
@@ -1,7 +1,7 @@
 from unittest.mock import patch
 
 import pytest
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from shared.bundle_analysis import BundleAnalysisReport as SharedBundleAnalysisReport
 from shared.bundle_analysis import (
     BundleAnalysisReportLoader,
@@ -13,7 +13,8 @@ from shared.storage.memory import MemoryStorageService
 
 from core.tests.factories import CommitFactory, RepositoryFactory
 from reports.models import CommitReport
-from reports.tests.factories import CommitReportFactory
+from reports.tests.factories import CommitReportFactory, UploadFactory
+from services import bundle_report_cache
 from services.archive import ArchiveService
 from services.bundle_analysis import (
     BundleAnalysisComparison,
@@ -21,6 +22,8 @@ from services.bundle_analysis import (
     BundleComparison,
     BundleReport,
     load_report,
+    prefetch_parent_report,
+    prefetch_report,
 )
 
 
@@ -56,6 +59,103 @@ def test_load_report(get_storage_service):
     assert isinstance(report, SharedBundleAnalysisReport)
 
 
+@pytest.fixture
+def report_cache(mocker, tmp_path):
+    mocker.patch.object(bundle_report_cache, "_bundle_report_cache", None)
+    with override_settings(
+        BUNDLE_REPORT_CACHE_ENABLED=True,
+        BUNDLE_REPORT_CACHE_DIR=str(tmp_path),
+    ):
+        yield bundle_report_cache.get_bundle_report_cache()
+
+
+@pytest.mark.django_db
+@patch("services.bundle_analysis.get_appropriate_storage_service")
+def test_load_report_cached(get_storage_service, report_cache, mocker):
+    storage = MemoryStorageService({})
+    get_storage_service.return_value = storage
+
+    repo = RepositoryFactory()
+    commit = CommitFactory(repository=repo)
+    commit_report = CommitReportFactory(
+        commit=commit, report_type=CommitReport.ReportType.BUNDLE_ANALYSIS
+    )
+    storage_path = StoragePaths.bundle_report.path(
+        repo_key=ArchiveService.get_archive_hash(repo),
+        report_key=commit_report.external_id,
+    )
+    with open("./services/tests/samples/bundle_report.sqlite", "rb") as f:
+        storage.write_file(get_bucket_name(), storage_path, f)
+
+    read_file = mocker.spy(storage, "read_file")
+    first = load_report(commit)
+    second = load_report(commit)
+
+    assert read_file.call_count == 1
+    assert first.db_path == second.db_path
+    assert first.db_path in report_cache
+    assert len(first.bundle_reports()) == len(second.bundle_reports())
+
+    # new uploads are processed into the same file in storage
+    UploadFactory(report=commit_report)
+    assert load_report(commit).db_path != first.db_path
+    assert read_file.call_count == 2
+
+
+@pytest.mark.django_db
+@patch("services.bundle_analysis.get_appropriate_storage_service")
+def test_prefetch_report(get_storage_service, report_cache, mocker):
+    storage = MemoryStorageService({})
+    get_storage_service.return_value = storage
+    mocker.patch(
+        "services.bundle_analysis._prefetch_executor.submit",
+        side_effect=lambda fn, *args: fn(*args),
+    )
+    mocker.patch("services.bundle_analysis.close_old_connections")
+
+    commit = CommitFactory()
+    commit_report = CommitReportFactory(
+        commit=commit, report_type=CommitReport.ReportType.BUNDLE_ANALYSIS
+    )
+    storage_path = StoragePaths.bundle_report.path(
+        repo_key=ArchiveService.get_archive_hash(commit.repository),
+        report_key=commit_report.external_id,
+    )
+    with open("./services/tests/samples/bundle_report.sqlite", "rb") as f:
+        storage.write_file(get_bucket_name(), storage_path, f)
+
+    prefetch_report(commit)
+
+    read_file = mocker.spy(storage, "read_file")
+    assert load_report(commit) is not None
+    assert not read_file.called
+
+
+@pytest.mark.django_db
+def test_prefetch_parent_report_disabled(mocker, django_assert_num_queries):
+    prefetch = mocker.patch("services.bundle_analysis.prefetch_report")
+    parent = CommitFactory()
+    commit = CommitFactory(
+        repository=parent.repository, parent_commit_id=parent.commitid
+    )
+
+    with django_assert_num_queries(0):
+        prefetch_parent_report(commit)
+    assert not prefetch.called
+
+
+@pytest.mark.django_db
+def test_prefetch_parent_report(report_cache, mocker):
+    prefetch = mocker.patch("services.bundle_analysis.prefetch_report")
+    parent = CommitFactory()
+    commit = CommitFactory(
+        repository=parent.repository, parent_commit_id=parent.commitid
+    )
+
+    prefetch_parent_report(commit)
+    prefetch.assert_called_once_with(parent)
+
+
 class TestBundleComparison(TestCase):
     @patch("services.bundle_analysis.SharedBundleChange")
     def test_bundle_comparison(self, mock_shared_bundle_change):
@@ -180,3 +280,38 @@ class TestBundleAnalysisReport(TestCase):
         assert len(bar.bundles) == 4
         assert bar.size_total == 201720
         assert bar.load_time_total == 0.5
+
+    @patch("services.bundle_analysis.ModuleReport")
+    @patch("services.bundle_analysis.get_appropriate_storage_service")
+    def test_bundle_report_summary(self, get_storage_service, module_report):
+        storage = MemoryStorageService({})
+        get_storage_service.return_value = storage
+
+        with open(
+            "./services/tests/samples/bundle_with_assets_and_modules.sqlite", "rb"
+        ) as f:
+            storage_path = StoragePaths.bundle_report.path(
+                repo_key=ArchiveService.get_archive_hash(self.repo),
+                report_key=self.commit_report.external_id,
+            )
+            storage.write_file(get_bucket_name(), storage_path, f)
+
+        bar = BundleAnalysisReport(load_report(self.commit))
+        bundle = bar.bundle("b5")
+
+        assert bar.size_total == 150000
+        assert sorted(bundle.module_extensions) == [
+            "",
+            "css",
+            "html",
+            "js",
+            "svg",
+            "ts",
+            "tsx",
+        ]
+        asset = bundle.asset("assets/LazyComponent-fcbb0922.js")
+        assert asset.normalized_name == "assets/LazyComponent-*.js"
+        assert sorted(asset.module_extensions) == ["", "tsx"]
+        assert bundle.asset("missing.js") is None
+        # summaries are computed in SQLite without loading the modules
+        assert not module_report.called
@@ -0,0 +1,68 @@
+import os
+import time
+
+import pytest
+
+from reports.tests.factories import CommitReportFactory, UploadFactory
+from services.bundle_report_cache import BundleReportCache, bundle_report_version
+
+
+def write_download(directory, content):
+    path = directory / "download"
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_put_and_get(tmp_path):
+    cache = BundleReportCache(str(tmp_path / "cache"), max_size=1000)
+    assert cache.get("report", "1") is None
+
+    download = write_download(tmp_path, b"sqlite")
+    db_path = cache.put("report", "1", download)
+
+    assert not os.path.exists(download)
+    assert cache.get("report", "1") == db_path
+    assert open(db_path, "rb").read() == b"sqlite"
+    assert db_path in cache
+    assert download not in cache
+    # a new version of the report is a different file
+    assert cache.get("report", "2") is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = BundleReportCache(str(tmp_path / "cache"), max_size=250, grace_period=0)
+    first = cache.put("first", "1", write_download(tmp_path, b"a" * 100))
+    second = cache.put("second", "1", write_download(tmp_path, b"b" * 100))
+    os.utime(first, (time.time() - 20, time.time() - 20))
+    os.utime(second, (time.time() - 30, time.time() - 30))
+
+    # reading bumps the file
+    assert cache.get("first", "1") == first
+    cache.put("third", "1", write_download(tmp_path, b"c" * 100))
+
+    assert os.path.exists(first)
+    assert not os.path.exists(second)
+    assert cache.get("third", "1") is not None
+
+
+def test_does_not_evict_files_in_use(tmp_path):
+    cache = BundleReportCache(str(tmp_path / "cache"), max_size=150, grace_period=60)
+    first = cache.put("first", "1", write_download(tmp_path, b"a" * 100))
+    second = cache.put("second", "1", write_download(tmp_path, b"b" * 100))
+
+    assert os.path.exists(first)
+    assert os.path.exists(second)
+
+
+@pytest.mark.django_db
+def test_bundle_report_version():
+    commit_report = CommitReportFactory()
+    external_id = commit_report.external_id
+    assert bundle_report_version(external_id) == "0"
+
+    upload = UploadFactory(report=commit_report)
+    version = bundle_report_version(external_id)
+    assert version != "0"
+
+    upload.save()
+    assert bundle_report_version(external_id) != version
@@ -0,0 +1,50 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from core.tests.factories import CommitFactory
+from services.chunks import ChunksReader, chunk_offsets
+
+chunks = (
+    "{}\n[1]\n<<<<< end_of_chunk >>>>>\n{}\n[0]\n[1]\n<<<<< end_of_chunk >>>>>\n{}\n[1]"
+)
+
+
+class ChunkOffsetsTests(TestCase):
+    def test_chunk_offsets(self):
+        encoded = chunks.encode()
+        offsets = chunk_offsets(encoded)
+        assert [encoded[start:end].decode() for start, end in offsets] == chunks.split(
+            "\n<<<<< end_of_chunk >>>>>\n"
+        )
+
+    def test_chunk_offsets_with_header(self):
+        encoded = (
+            '{"labels_index": {}}\n<<<<< end_of_header >>>>>\n' + chunks
+        ).encode()
+        offsets = chunk_offsets(encoded)
+        assert len(offsets) == 3
+        start, end = offsets[0]
+        assert encoded[start:end].decode() == "{}\n[1]"
+
+    def test_chunk_offsets_multibyte(self):
+        encoded = '{"name": "héllo"}\n[1]\n<<<<< end_of_chunk >>>>>\n{}\n[0]'.encode()
+        start, end = chunk_offsets(encoded)[1]
+        assert encoded[start:end].decode() == "{}\n[0]"
+
+
+@patch("services.archive.ArchiveService.read_chunks")
+class ChunksReaderTests(TestCase):
+    def setUp(self):
+        self.commit = CommitFactory()
+
+    def test_read_chunk(self, read_chunks):
+        read_chunks.return_value = chunks
+
+        assert ChunksReader(self.commit).read_chunk(1) == "{}\n[0]\n[1]"
+        read_chunks.assert_called_once_with(self.commit.commitid)
+
+    def test_read_chunk_out_of_range(self, read_chunks):
+        read_chunks.return_value = chunks
+
+        assert ChunksReader(self.commit).read_chunk(3) is None
@@ -8,9 +8,10 @@ from unittest.mock import PropertyMock, patch
 import minio
 import pytest
 import pytz
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from shared.reports.resources import ReportFile
 from shared.reports.types import ReportTotals
+from shared.torngit.exceptions import TorngitObjectNotFoundError
 from shared.utils.merge import LineType
 
 from codecov_auth.tests.factories import OwnerFactory
@@ -21,6 +22,7 @@ from core.tests.factories import CommitFactory, PullFactory, RepositoryFactory
 from reports.models import ReportDetails
 from reports.tests.factories import CommitReportFactory
 from services.comparison import (
+    MAX_CONCURRENT_SOURCE_FETCHES,
     CommitComparisonService,
     Comparison,
     ComparisonReport,
@@ -30,6 +32,7 @@ from services.comparison import (
     FileComparisonTraverseManager,
     ImpactedFile,
     LineComparison,
+    LineComparisons,
     MissingComparisonReport,
     PullRequestComparison,
 )
@@ -47,6 +50,20 @@ file_data = [
 ]
 
 
+def line_fields(lines):
+    return [
+        (
+            line.base_line,
+            line.head_line,
+            line.base_ln,
+            line.head_ln,
+            line.value,
+            line.is_diff,
+        )
+        for line in lines
+    ]
+
+
 class MockOrderValue(object):
     def __init__(self, value):
         self.value = value
@@ -67,9 +84,11 @@ class LineNumberCollector:
 
     def __init__(self):
         self.line_numbers = []
+        self.values = []
 
     def __call__(self, base_ln, head_ln, value, is_diff):
         self.line_numbers.append((base_ln, head_ln))
+        self.values.append(value)
 
 
 class FileComparisonTraverseManagerTests(TestCase):
@@ -139,11 +158,13 @@ class FileComparisonTraverseManagerTests(TestCase):
 
         assert visitor.line_numbers == expected_result
 
-    def test_pop_line_returns_none_if_no_diff_or_src(self):
-        manager = FileComparisonTraverseManager()
-        assert manager.pop_line() == None
+    def test_visits_none_if_no_diff_or_src(self):
+        manager = FileComparisonTraverseManager(head_file_eof=2, base_file_eof=2)
+        visitor = LineNumberCollector()
+        manager.apply(visitors=[visitor])
+        assert visitor.values == [None]
 
-    def test_pop_line_pops_first_line_in_segment_if_traversing_that_segment(self):
+    def test_visits_lines_in_segment_if_traversing_that_segment(self):
         expected_line_value = "+this is a line!"
         segments = [
             {
@@ -152,14 +173,27 @@ class FileComparisonTraverseManagerTests(TestCase):
             }
         ]
         manager = FileComparisonTraverseManager(segments=segments)
-        assert manager.pop_line() == expected_line_value
+        visitor = LineNumberCollector()
+        manager.apply(visitors=[visitor])
+        assert visitor.values == [expected_line_value, "this is another line"]
 
-    def test_pop_line_returns_line_at_head_ln_index_in_src_if_not_in_segment(self):
+    def test_visits_line_at_head_ln_index_in_src_if_not_in_segment(self):
         expected_line_value = "a line from src!"
         manager = FileComparisonTraverseManager(
             head_file_eof=2, src=[expected_line_value]
         )
-        assert manager.pop_line() == expected_line_value
+        visitor = LineNumberCollector()
+        manager.apply(visitors=[visitor])
+        assert visitor.values == [expected_line_value]
+
+    def test_header_with_extra_fields(self):
+        segments = [{"header": ["1", "1", "1", "2", "def foo():"], "lines": ["+"]}]
+        manager = FileComparisonTraverseManager(
+            head_file_eof=3, base_file_eof=2, segments=segments
+        )
+        visitor = LineNumberCollector()
+        manager.apply(visitors=[visitor])
+        assert visitor.line_numbers == [(None, 1), (1, 2)]
 
     def test_traversing_diff_returns_true_if_head_ln_within_segment_at_position_0(self):
         manager = FileComparisonTraverseManager(
@@ -266,6 +300,24 @@ class FileComparisonTraverseManagerTests(TestCase):
         manager.apply([visitor])
         assert visitor.line_numbers == [(1, 1), (2, 2), (3, None), (None, 3)]
 
+    def test_apply_does_not_mutate_segments(self):
+        segments = [
+            {"header": ["1", "2", "1", "2"], "lines": ["-line 1", "+line 1", "line 2"]},
+            {"header": ["8", "1", "8", "2"], "lines": ["line 8", "+line 9"]},
+        ]
+        expected_segments = json.loads(json.dumps(segments))
+        manager = FileComparisonTraverseManager(
+            head_file_eof=11, base_file_eof=10, segments=segments
+        )
+
+        visitor = LineNumberCollector()
+        manager.apply([visitor])
+
+        assert segments == expected_segments
+        assert visitor.line_numbers[:3] == [(1, None), (None, 1), (2, 2)]
+        assert visitor.line_numbers[7:9] == [(8, 8), (None, 9)]
+        assert manager.traverse_finished() is True
+
 
 class CreateLineComparisonVisitorTests(TestCase):
     def setUp(self):
@@ -279,7 +331,7 @@ class CreateLineComparisonVisitorTests(TestCase):
     def test_skips_if_line_value_is_none(self):
         visitor = CreateLineComparisonVisitor(self.base_file, self.head_file)
         visitor(0, 0, None, False)
-        assert visitor.lines == []
+        assert len(visitor.lines) == 0
 
     def test_appends_line_comparison_with_relevant_fields_if_line_value_not_none(self):
         base_ln = 2
@@ -458,6 +510,59 @@ class LineComparisonTests(TestCase):
         assert lc.hit_session_ids == None
 
 
+class LineComparisonsTests(TestCase):
+    def setUp(self):
+        self.lines = LineComparisons()
+        self.lines.append([1, "", [], 0, 0], [1, "", [], 0, 0], 1, 1, "line1", False)
+        self.lines.append(None, [0, "", [], 0, 0], None, 2, "+line2", True)
+        self.lines.append([1, "", [], 0, 0], None, 2, None, "-line2", True)
+        self.lines.append([0, "", [], 0, 0], [1, "", [], 0, 0], 3, 3, "line3", False)
+
+    def test_materializes_line_comparisons(self):
+        assert len(self.lines) == 4
+
+        line = self.lines[1]
+        assert isinstance(line, LineComparison)
+        assert line.value == "+line2"
+        assert line.number == {"base": None, "head": 2}
+        assert line.coverage == {"base": None, "head": LineType.miss}
+        assert line.added is True
+
+        assert self.lines[-1].value == "line3"
+
+    def test_coverage_columns(self):
+        assert self.lines.base_coverages == [
+            LineType.hit,
+            None,
+            LineType.hit,
+            LineType.miss,
+        ]
+        assert self.lines.head_coverages == [
+            LineType.hit,
+            LineType.miss,
+            None,
+            LineType.hit,
+        ]
+        assert self.lines.changed_indexes() == [1, 2, 3]
+
+    def test_slice_is_columnar(self):
+        lines = self.lines[1:3]
+        assert isinstance(lines, LineComparisons)
+        assert [line.value for line in lines] == ["+line2", "-line2"]
+        assert lines.added == [True, False]
+        assert lines.removed == [False, True]
+
+    def test_from_lines(self):
+        line_comparisons = [
+            LineComparison([1], [1], 1, 1, "first line", False),
+            LineComparison(None, [1], None, 2, "+added line", True),
+        ]
+        lines = LineComparisons.from_lines(line_comparisons)
+        assert isinstance(lines, LineComparisons)
+        assert line_fields(lines) == line_fields(line_comparisons)
+        assert LineComparisons.from_lines(lines) is lines
+
+
 class FileComparisonConstructorTests(TestCase):
     def test_constructor_no_keyError_if_diff_data_segements_is_missing(self):
         file_comp = FileComparison(
@@ -543,7 +648,7 @@ class FileComparisonTests(TestCase):
         assert self.file_comparison.stats == expected_stats
 
     def test_lines_returns_emptylist_if_no_diff_or_src(self):
-        assert self.file_comparison.lines == []
+        assert len(self.file_comparison.lines) == 0
 
     # essentially a smoke/integration test
     def test_lines(self):
@@ -610,7 +715,7 @@ class FileComparisonTests(TestCase):
         segments = self.file_comparison.segments
 
         assert len(segments) == 1
-        assert segments[0].lines == self.file_comparison.lines
+        assert line_fields(segments[0].lines) == line_fields(self.file_comparison.lines)
         assert segments[0].header == (1, 3, 1, 3)
         assert segments[0].has_diff_changes == True
         assert segments[0].has_unintended_changes == False
@@ -626,7 +731,7 @@ class FileComparisonTests(TestCase):
         segments = self.file_comparison.segments
 
         assert len(segments) == 1
-        assert segments[0].lines == self.file_comparison.lines
+        assert line_fields(segments[0].lines) == line_fields(self.file_comparison.lines)
         assert segments[0].header == (1, 3, 1, 3)
         assert segments[0].has_diff_changes == False
         assert segments[0].has_unintended_changes
@@ -843,6 +948,88 @@ class ComparisonTests(TestCase):
         fc = self.comparison.get_file_comparison(file_name, with_src=True)
         assert fc.src == ["two", "lines"]
 
+    @patch("services.repo_providers.RepoProviderService.get_adapter")
+    def test_get_file_comparisons_fetches_sources_concurrently(
+        self,
+        mocked_comparison_adapter,
+        base_report_mock,
+        head_report_mock,
+        git_comparison_mock,
+    ):
+        class ConcurrencyTrackingAdapter:
+            def __init__(self):
+                self.in_flight = 0
+                self.max_in_flight = 0
+
+            async def get_source(self, file_name, commitid):
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                return {"content": f"{file_name}\nsource".encode()}
+
+        adapter = ConcurrencyTrackingAdapter()
+        mocked_comparison_adapter.return_value = adapter
+        git_comparison_mock.return_value = {"diff": {"files": {}}}
+
+        file_names = [f"file{i}.py" for i in range(15)]
+        base_report_mock.return_value = SerializableReport(files={})
+        head_report_mock.return_value = SerializableReport(
+            files={file_name: file_data for file_name in file_names}
+        )
+
+        fcs = self.comparison.get_file_comparisons(file_names, with_src=True)
+        assert [fc.head_file.name for fc in fcs] == file_names
+        assert [fc.src for fc in fcs] == [
+            [file_name, "source"] for file_name in file_names
+        ]
+        assert 1 < adapter.max_in_flight <= MAX_CONCURRENT_SOURCE_FETCHES
+        mocked_comparison_adapter.assert_called_once()
+
+    @patch("services.repo_providers.RepoProviderService.get_adapter")
+    def test_get_file_comparisons_return_exceptions(
+        self,
+        mocked_comparison_adapter,
+        base_report_mock,
+        head_report_mock,
+        git_comparison_mock,
+    ):
+        error = TorngitObjectNotFoundError(None, None)
+
+        async def get_source(file_name, commitid):
+            if file_name == "missing.py":
+                raise error
+            return {"content": "source"}
+
+        mocked_comparison_adapter.return_value.get_source = get_source
+        git_comparison_mock.return_value = {"diff": {"files": {}}}
+
+        files = {"a.py": file_data, "missing.py": file_data}
+        base_report_mock.return_value = SerializableReport(files=files)
+        head_report_mock.return_value = SerializableReport(files=files)
+
+        fcs = self.comparison.get_file_comparisons(
+            ["missing.py", "a.py"], with_src=True, return_exceptions=True
+        )
+        assert fcs[0] is error
+        assert fcs[1].src == ["source"]
+
+        with pytest.raises(TorngitObjectNotFoundError):
+            self.comparison.get_file_comparisons(["missing.py", "a.py"], with_src=True)
+
+    def test_get_file_comparisons_without_src(
+        self, base_report_mock, head_report_mock, git_comparison_mock
+    ):
+        git_comparison_mock.return_value = {"diff": {"files": {}}}
+
+        files = {"a.py": file_data, "b.py": file_data}
+        base_report_mock.return_value = SerializableReport(files=files)
+        head_report_mock.return_value = SerializableReport(files=files)
+
+        fcs = self.comparison.get_file_comparisons(["b.py", "a.py"])
+        assert [fc.head_file.name for fc in fcs] == ["b.py", "a.py"]
+        assert [fc.src for fc in fcs] == [[], []]
+
     def test_get_file_comparison_with_no_base_report_doesnt_crash(
         self, base_report_mock, head_report_mock, git_comparison_mock
     ):
@@ -1345,7 +1532,7 @@ class SegmentTests(TestCase):
         ]
 
     def _src(self, n):
-        return [f"line{i+1}" for i in range(n)]
+        return [f"line{i + 1}" for i in range(n)]
 
     def setUp(self):
         self.file_comparison = FileComparison(
@@ -1699,6 +1886,65 @@ class ComparisonReportTest(TestCase):
         impacted_file = self.comparison_report.impacted_file("fileB")
         assert impacted_file.head_name == "fileB"
 
+    @patch("services.archive.ArchiveService.read_file")
+    def test_impacted_file_builds_only_requested_file(self, read_file):
+        read_file.return_value = mock_data_from_archive
+        with patch.object(
+            ImpactedFile, "create", wraps=ImpactedFile.create
+        ) as create_mock:
+            impacted_file = self.comparison_report.impacted_file("fileB")
+            assert impacted_file.head_name == "fileB"
+            assert create_mock.call_count == 1
+
+            assert self.comparison_report.impacted_file("fileB") is impacted_file
+            assert self.comparison_report.impacted_file("unknown") is None
+            assert create_mock.call_count == 1
+
+    @patch("services.archive.ArchiveService.read_file")
+    def test_summaries_match_impacted_files(self, read_file):
+        read_file.return_value = mocked_files_with_direct_and_indirect_changes
+        with patch.object(
+            ImpactedFile, "create", wraps=ImpactedFile.create
+        ) as create_mock:
+            summaries = self.comparison_report.summaries
+            assert create_mock.call_count == 0
+
+        for summary, file in zip(summaries, self.comparison_report.impacted_files):
+            assert summary.head_name == file.head_name
+            assert summary.file_name == file.file_name
+            assert summary.has_diff == bool(file.has_diff)
+            assert summary.has_changes == file.has_changes
+            assert summary.change_coverage == file.change_coverage
+            assert summary.misses_count == file.misses_count
+            assert summary.head_coverage == (
+                file.head_coverage.coverage if file.head_coverage else None
+            )
+            assert summary.patch_coverage == (
+                file.patch_coverage.coverage if file.patch_coverage else None
+            )
+
+    @patch("services.archive.ArchiveService.read_file")
+    def test_comparison_data_not_cached_by_default(self, read_file):
+        read_file.return_value = mock_data_from_archive
+        ComparisonReport(self.comparison).impacted_files
+        ComparisonReport(self.comparison).impacted_files
+        assert read_file.call_count == 2
+
+    @override_settings(COMPARISON_REPORT_CACHE_ENABLED=True)
+    @patch("services.archive.ArchiveService.read_file")
+    def test_comparison_data_cached_between_reports(self, read_file):
+        read_file.return_value = mock_data_from_archive
+        first = ComparisonReport(self.comparison).impacted_files
+        second = ComparisonReport(self.comparison).impacted_files
+        assert [file.head_name for file in first] == [file.head_name for file in second]
+        assert first[0] is not second[0]
+        read_file.assert_called_once()
+
+        # a recomputed comparison is fetched again
+        self.comparison.save()
+        ComparisonReport(self.comparison).impacted_files
+        assert read_file.call_count == 2
+
     @patch("services.archive.ArchiveService.read_file")
     def test_impacted_files_filtered_by_indirect_changes(self, read_file):
         read_file.return_value = mock_data_from_archive
@@ -2,7 +2,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from django.conf import settings
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from shared.reports.resources import Report, ReportFile, ReportLine
 from shared.reports.types import ReportTotals
 from shared.torngit.exceptions import TorngitClientGeneralError
@@ -13,10 +13,12 @@ from core.tests.factories import CommitFactory
 from services.path import (
     Dir,
     File,
+    PathTree,
     PrefixedPath,
     ReportPaths,
     dashboard_commit_file_url,
     provider_path_exists,
+    report_path_tree,
 )
 from services.report import SerializableReport
 
@@ -275,6 +277,80 @@ class TestReportPathsNested(TestCase):
         ]
 
 
+class TestPathTree(TestCase):
+    def setUp(self):
+        files = {
+            "dir/file1.py": file_data1,
+            "src/File2.py": file_data2,
+            "dir/subdir/file3.py": file_data3,
+        }
+        self.report = SerializableReport(files=files)
+        self.tree = PathTree(self.report.files, self.report.get_file_totals)
+
+    def test_get(self):
+        assert self.tree.get("dir/file1.py") == File(
+            full_path="dir/file1.py", totals=totals1
+        )
+        assert self.tree.get("dir/subdir") == Dir(
+            full_path="dir/subdir",
+            children=[File(full_path="dir/subdir/file3.py", totals=totals3)],
+        )
+        assert self.tree.get("dir/sub") is None
+        assert self.tree.get(None) is self.tree.root
+
+    def test_rolled_up_totals(self):
+        assert self.tree.get("dir").lines == 20
+        assert self.tree.get("dir").hits == 11
+        assert self.tree.root.lines == 30
+        assert self.tree.root.hits == 19
+
+    def test_file_indexes(self):
+        assert self.tree.file_indexes() == [0, 1, 2]
+        assert self.tree.file_indexes("dir") == [0, 2]
+        assert self.tree.file_indexes("dir/file1.py") == [0]
+        assert self.tree.file_indexes("wrong") == []
+
+    def test_search(self):
+        assert self.tree.search("file") == [0, 1, 2]
+        assert self.tree.search("FILE2") == [1]
+        assert self.tree.search("r/f") == [0, 2]
+        assert self.tree.search("py\ndir") == []
+
+    def test_search_prefix(self):
+        # matches only the path relative to the prefix
+        assert self.tree.search("dir", prefix="dir") == [2]
+        assert self.tree.search("file", prefix="dir/subdir") == [2]
+        assert self.tree.search("src", prefix="dir") == []
+
+    def test_report_paths_with_tree(self):
+        report_paths = ReportPaths(self.report, path="dir", tree=self.tree)
+        assert report_paths.tree is self.tree
+        assert report_paths.single_directory() == [
+            File(full_path="dir/file1.py", totals=totals1),
+            Dir(
+                full_path="dir/subdir",
+                children=[File(full_path="dir/subdir/file3.py", totals=totals3)],
+            ),
+        ]
+
+    def test_report_paths_with_tree_filtered(self):
+        report_paths = ReportPaths(
+            self.report, path="dir", tree=self.tree, filter_paths=["dir/subdir/.*"]
+        )
+        assert report_paths.tree is not self.tree
+
+    @override_settings(REPORT_CACHE_ENABLED=True)
+    def test_report_path_tree_cached(self):
+        commit = CommitFactory()
+        tree = report_path_tree(commit, self.report)
+        assert tree.files == self.report.files
+        assert report_path_tree(commit, self.report) is tree
+
+    def test_report_path_tree_disabled(self):
+        commit = CommitFactory()
+        assert report_path_tree(commit, self.report) is None
+
+
 class MockedProviderAdapter:
     async def list_files(self, *args, **kwargs):
         return []
@@ -2,7 +2,7 @@ from decimal import Decimal
 from pathlib import Path
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from shared.reports.resources import Report, ReportFile, ReportLine
 from shared.storage.exceptions import FileNotInStorageError
 from shared.utils.sessions import Session
@@ -11,8 +11,15 @@ from core.tests.factories import CommitFactory, CommitWithReportFactory
 from reports.tests.factories import UploadFactory, UploadFlagMembershipFactory
 from services.report import (
     build_report,
+    build_report_file_from_commit,
     build_report_from_commit,
+    fetch_commit_ancestors,
+    fetch_flag_totals,
+    file_session_bitmaps,
     files_belonging_to_flags,
+    files_in_sessions,
+    report_file_exists,
+    sessions_bitmap,
 )
 
 current_file = Path(__file__)
@@ -140,6 +147,20 @@ class ReportServiceTest(TestCase):
             0,
         ]
 
+    @override_settings(REPORT_CACHE_ENABLED=True)
+    @patch("services.report_cache._chunks_cache", None)
+    @patch("services.archive.ArchiveService.read_chunks")
+    def test_build_report_from_commit_cached_chunks(self, read_chunks_mock):
+        f = open(current_file.parent / "samples" / "chunks.txt", "r")
+        read_chunks_mock.return_value = f.read()
+        commit = CommitWithReportFactory.create(message="aaaaa", commitid="abf6d4d")
+
+        res = build_report_from_commit(commit)
+        assert len(res._chunks) == 3
+        res = build_report_from_commit(commit)
+        assert len(res._chunks) == 3
+        assert read_chunks_mock.call_count == 1
+
     @patch("services.archive.ArchiveService.read_chunks")
     def test_build_report_from_commit_file_not_in_storage(self, read_chunks_mock):
         read_chunks_mock.side_effect = FileNotInStorageError()
@@ -261,6 +282,98 @@ class ReportServiceTest(TestCase):
             == "56e05fced214c44a37759efa2dfc25a65d8ae98d"
         )
 
+    @override_settings(REPORT_CHUNKS_INDEX_ENABLED=True)
+    @patch("services.archive.ArchiveService.read_chunks")
+    def test_build_report_file_from_commit(self, read_chunks_mock):
+        f = open(current_file.parent / "samples" / "chunks.txt", "r")
+        read_chunks_mock.return_value = f.read()
+        commit = CommitWithReportFactory.create(message="aaaaa", commitid="abf6d4d")
+
+        report_file = build_report_file_from_commit(commit, "tests/test_sample.py")
+        expected = build_report_from_commit(commit).get("tests/test_sample.py")
+        assert report_file.name == "tests/test_sample.py"
+        assert tuple(report_file.totals) == tuple(expected.totals)
+        assert list(report_file.lines) == list(expected.lines)
+
+    @override_settings(REPORT_CHUNKS_INDEX_ENABLED=True)
+    @patch("services.archive.ArchiveService.read_chunks")
+    def test_build_report_file_from_commit_missing_file(self, read_chunks_mock):
+        commit = CommitWithReportFactory.create(message="aaaaa", commitid="abf6d4d")
+
+        assert build_report_file_from_commit(commit, "missing.py") is None
+        read_chunks_mock.assert_not_called()
+
+    @patch("services.archive.ArchiveService.read_chunks")
+    def test_report_file_exists(self, read_chunks_mock):
+        commit = CommitWithReportFactory.create(message="aaaaa", commitid="abf6d4d")
+
+        assert report_file_exists(commit, "tests/test_sample.py") is True
+        assert report_file_exists(commit, "missing.py") is False
+        read_chunks_mock.assert_not_called()
+
+    @patch("services.archive.ArchiveService.read_chunks")
+    def test_fetch_flag_totals_single_upload(self, read_chunks_mock):
+        commit = CommitWithReportFactory.create(message="aaaaa", commitid="abf6d4d")
+
+        totals = fetch_flag_totals(commit, "unittests")
+        assert totals.coverage == Decimal("85.00")
+        assert totals.lines == 20
+        assert fetch_flag_totals(commit, "unknown") is None
+        read_chunks_mock.assert_not_called()
+
+    @patch("services.archive.ArchiveService.read_chunks")
+    def test_fetch_flag_totals_multiple_uploads(self, read_chunks_mock):
+        f = open(current_file.parent / "samples" / "chunks.txt", "r")
+        read_chunks_mock.return_value = f.read()
+        commit = CommitWithReportFactory.create(message="aaaaa", commitid="abf6d4d")
+        upload = commit.reports.first().sessions.get(order_number=0)
+        UploadFlagMembershipFactory(
+            report_session=upload,
+            flag=commit.repository.flags.get(flag_name="integrations"),
+        )
+
+        # both uploads carry the flag so their coverage needs to be merged
+        totals = fetch_flag_totals(commit, "integrations")
+        assert totals == commit.full_report.flags["integrations"].totals
+        read_chunks_mock.assert_called_with("abf6d4d")
+
+    def test_fetch_commit_ancestors(self):
+        commit1 = CommitFactory()
+        commit2 = CommitFactory(
+            repository=commit1.repository, parent_commit_id=commit1.commitid
+        )
+        commit3 = CommitFactory(
+            repository=commit1.repository, parent_commit_id=commit2.commitid
+        )
+        commit4 = CommitFactory(
+            repository=commit1.repository, parent_commit_id=commit3.commitid
+        )
+
+        with self.assertNumQueries(1):
+            ancestors = fetch_commit_ancestors(commit4, 20)
+        assert [commit.commitid for commit in ancestors] == [
+            commit3.commitid,
+            commit2.commitid,
+            commit1.commitid,
+        ]
+
+        ancestors = fetch_commit_ancestors(commit4, 2)
+        assert [commit.commitid for commit in ancestors] == [
+            commit3.commitid,
+            commit2.commitid,
+        ]
+
+        assert fetch_commit_ancestors(commit1, 20) == []
+
+    def test_fetch_commit_ancestors_broken_chain(self):
+        commit1 = CommitFactory(parent_commit_id="missing")
+        commit2 = CommitFactory(
+            repository=commit1.repository, parent_commit_id=commit1.commitid
+        )
+
+        ancestors = fetch_commit_ancestors(commit2, 20)
+        assert [commit.commitid for commit in ancestors] == [commit1.commitid]
+
     def test_build_report_from_commit_no_report(self):
         commit = CommitFactory()
         report = build_report_from_commit(commit)
@@ -381,3 +494,44 @@ class ReportServiceTest(TestCase):
         files = files_belonging_to_flags(commit_report=commit_report, flags=flags)
         assert len(files) == 0
         assert files == []
+
+    def test_sessions_bitmap(self):
+        assert sessions_bitmap([]) == 0
+        assert sessions_bitmap([0, 2, 2, None]) == 0b101
+
+    def test_file_session_bitmaps(self):
+        commit_report = flags_report()
+        bitmaps = file_session_bitmaps(commit_report)
+        assert bitmaps == {
+            "foo/file1.py": 0b001,
+            "bar/file2.py": 0b010,
+            "another/file3.py": 0b100,
+        }
+
+        file_d = ReportFile("new/file4.py")
+        file_d.append(1, ReportLine.create(coverage=1, sessions=[[0, 1], [1, 1]]))
+        commit_report.append(file_d)
+        assert file_session_bitmaps(commit_report)["new/file4.py"] == 0b011
+        assert files_in_sessions(commit_report, session_ids=[1]) == [
+            "bar/file2.py",
+            "new/file4.py",
+        ]
+
+    def test_file_session_bitmaps_only_requested_paths(self):
+        commit_report = flags_report()
+        with patch.object(commit_report, "get", wraps=commit_report.get) as get_file:
+            assert file_session_bitmaps(
+                commit_report, paths=["bar/file2.py", "missing.py"]
+            ) == {"bar/file2.py": 0b010}
+            assert get_file.call_count == 2
+
+            # reused by later lookups
+            assert file_session_bitmaps(commit_report, paths=["bar/file2.py"]) == {
+                "bar/file2.py": 0b010
+            }
+            assert get_file.call_count == 2
+
+        assert files_in_sessions(commit_report, session_ids=[1, 2]) == [
+            "bar/file2.py",
+            "another/file3.py",
+        ]
@@ -0,0 +1,103 @@
+import zlib
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
+
+from core.tests.factories import CommitFactory
+from services.report_cache import ChunksCache, SizeBoundedLRUCache
+
+
+class SizeBoundedLRUCacheTests(TestCase):
+    def test_get_and_set(self):
+        cache = SizeBoundedLRUCache(max_size=10)
+        assert cache.get("a") is None
+        cache.set("a", "12345")
+        assert cache.get("a") == "12345"
+        assert cache.size == 5
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = SizeBoundedLRUCache(max_size=10)
+        cache.set("a", "1234")
+        cache.set("b", "1234")
+        cache.get("a")
+        cache.set("c", "1234")
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.size == 8
+
+    def test_replacing_value_updates_size(self):
+        cache = SizeBoundedLRUCache(max_size=10)
+        cache.set("a", "1234")
+        cache.set("a", "12")
+        assert len(cache) == 1
+        assert cache.size == 2
+
+    def test_values_larger_than_max_size_are_not_stored(self):
+        cache = SizeBoundedLRUCache(max_size=10)
+        cache.set("a", "1234")
+        cache.set("b", "12345678901")
+        assert "a" in cache
+        assert "b" not in cache
+
+
+class ChunksCacheTests(TestCase):
+    def test_key(self):
+        commit = CommitFactory(
+            updatestamp=datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        )
+        key = ChunksCache.key(commit)
+        assert key.startswith(
+            f"report_chunks/{commit.repository_id}/{commit.commitid}/"
+        )
+
+        commit.updatestamp = datetime(2024, 1, 1, 12, 0, 1, tzinfo=timezone.utc)
+        assert ChunksCache.key(commit) != key
+
+    def test_key_without_updatestamp(self):
+        commit = CommitFactory.build(updatestamp=None)
+        assert ChunksCache.key(commit) is None
+
+    def test_get_or_fetch_local(self):
+        cache = ChunksCache(max_size=1000)
+        fetch = MagicMock(return_value="chunks")
+
+        assert cache.get_or_fetch("key", fetch) == "chunks"
+        assert cache.get_or_fetch("key", fetch) == "chunks"
+        assert fetch.call_count == 1
+
+    def test_get_or_fetch_without_key(self):
+        cache = ChunksCache(max_size=1000)
+        fetch = MagicMock(return_value="chunks")
+
+        assert cache.get_or_fetch(None, fetch) == "chunks"
+        assert cache.get_or_fetch(None, fetch) == "chunks"
+        assert fetch.call_count == 2
+        assert len(cache.local) == 0
+
+    @patch("services.report_cache.get_redis_connection")
+    def test_get_or_fetch_redis_hit(self, get_redis_connection):
+        redis = get_redis_connection.return_value
+        redis.get.return_value = zlib.compress(b"chunks")
+        cache = ChunksCache(max_size=1000, redis_ttl=60)
+        fetch = MagicMock()
+
+        assert cache.get_or_fetch("key", fetch) == "chunks"
+        fetch.assert_not_called()
+        redis.get.assert_called_once_with("key")
+        assert "key" in cache.local
+
+    @patch("services.report_cache.get_redis_connection")
+    def test_get_or_fetch_redis_miss(self, get_redis_connection):
+        redis = get_redis_connection.return_value
+        redis.get.return_value = None
+        cache = ChunksCache(max_size=1000, redis_ttl=60)
+        fetch = MagicMock(return_value="chunks")
+
+        assert cache.get_or_fetch("key", fetch) == "chunks"
+        fetch.assert_called_once()
+        redis.set.assert_called_once_with("key", zlib.compress(b"chunks"), ex=60)
@@ -1,8 +1,12 @@
 from unittest.mock import patch
 
+import fakeredis
 from django.contrib.auth.models import AnonymousUser
-from django.test import TransactionTestCase
-from shared.torngit.exceptions import TorngitObjectNotFoundError
+from django.test import TransactionTestCase, override_settings
+from shared.torngit.exceptions import (
+    TorngitClientError,
+    TorngitObjectNotFoundError,
+)
 
 import services.yaml as yaml
 from codecov_auth.tests.factories import OwnerFactory
@@ -32,3 +36,74 @@ class YamlServiceTest(TransactionTestCase):
         )
         config = yaml.final_commit_yaml(self.commit, None)
         assert config["codecov"]["require_ci_to_pass"] is True
+
+    @override_settings(COMMIT_YAML_CACHE_ENABLED=True)
+    @patch("services.yaml.fetch_current_yaml_from_provider_via_reference")
+    def test_commit_yaml_is_cached(self, mock_fetch_yaml):
+        mock_fetch_yaml.return_value = """
+        codecov:
+          notify:
+            require_ci_to_pass: no
+        """
+        with patch("services.yaml._commit_yaml_cache", None):
+            yaml.final_commit_yaml(self.commit, None)
+            config = yaml.final_commit_yaml(self.commit, self.org)
+
+        assert config["codecov"]["require_ci_to_pass"] is False
+        assert mock_fetch_yaml.call_count == 1
+
+    @override_settings(COMMIT_YAML_CACHE_ENABLED=True)
+    @patch("services.yaml.fetch_current_yaml_from_provider_via_reference")
+    def test_failed_fetches_are_not_cached(self, mock_fetch_yaml):
+        mock_fetch_yaml.side_effect = [
+            TorngitClientError(code=500, response_data=None, message="error"),
+            "codecov:\n  notify:\n    require_ci_to_pass: no\n",
+        ]
+        with patch("services.yaml._commit_yaml_cache", None):
+            config = yaml.final_commit_yaml(self.commit, None)
+            assert config["codecov"]["require_ci_to_pass"] is True
+
+            config = yaml.final_commit_yaml(self.commit, None)
+            assert config["codecov"]["require_ci_to_pass"] is False
+
+    @override_settings(COMMIT_YAML_CACHE_ENABLED=True)
+    @patch("services.yaml.fetch_current_yaml_from_provider_via_reference")
+    def test_missing_yaml_is_not_cached(self, mock_fetch_yaml):
+        mock_fetch_yaml.side_effect = [
+            None,
+            "codecov:\n  notify:\n    require_ci_to_pass: no\n",
+        ]
+        with patch("services.yaml._commit_yaml_cache", None):
+            config = yaml.final_commit_yaml(self.commit, None)
+            assert config["codecov"]["require_ci_to_pass"] is True
+
+            config = yaml.final_commit_yaml(self.commit, None)
+            assert config["codecov"]["require_ci_to_pass"] is False
+
+    @patch("services.yaml.fetch_current_yaml_from_provider_via_reference")
+    def test_commit_yaml_is_not_cached_by_default(self, mock_fetch_yaml):
+        mock_fetch_yaml.return_value = "codecov:\n  require_ci_to_pass: no\n"
+        with patch("services.yaml._commit_yaml_cache", None):
+            yaml.final_commit_yaml(self.commit, None)
+            yaml.final_commit_yaml(self.commit, None)
+
+        assert mock_fetch_yaml.call_count == 2
+
+    @override_settings(
+        COMMIT_YAML_CACHE_ENABLED=True, COMMIT_YAML_CACHE_REDIS_ENABLED=True
+    )
+    @patch("services.yaml.fetch_current_yaml_from_provider_via_reference")
+    def test_commit_yaml_is_shared_through_redis(self, mock_fetch_yaml):
+        mock_fetch_yaml.return_value = "codecov:\n  require_ci_to_pass: no\n"
+        redis = fakeredis.FakeStrictRedis()
+
+        with patch("services.yaml.get_redis_connection", return_value=redis):
+            with patch("services.yaml._commit_yaml_cache", None):
+                yaml.final_commit_yaml(self.commit, None)
+            # another API pod
+            with patch("services.yaml._commit_yaml_cache", None):
+                config = yaml.final_commit_yaml(self.commit, None)
+
+        assert config["codecov"]["require_ci_to_pass"] is False
+        assert mock_fetch_yaml.call_count == 1
+        assert redis.ttl(yaml.CommitYamlCache.key(self.commit)) > 0
@@ -1,8 +1,14 @@
 import enum
-from functools import lru_cache
-from typing import Dict, Optional
+import json
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
 
 from asgiref.sync import async_to_sync
+from django.conf import settings
+from redis.exceptions import RedisError
+from shared.metrics import metrics
 from shared.yaml import UserYaml, fetch_current_yaml_from_provider_via_reference
 from shared.yaml.user_yaml import UserYaml
 from shared.yaml.validation import validate_yaml
@@ -10,25 +16,135 @@ from yaml import safe_load
 
 from codecov_auth.models import Owner, get_config
 from core.models import Commit
+from services.redis_configuration import get_redis_connection
 from services.repo_providers import RepoProviderService
+from services.report_cache import SizeBoundedLRUCache
+
+log = logging.getLogger(__name__)
 
 
 class YamlStates(enum.Enum):
     DEFAULT = "default"
 
 
+class CommitYamlCache:
+    """
+    Two-tier cache of the YAML files fetched from the provider for commits: a
+    process-local LRU bounded by `max_size` bytes and an optional Redis tier
+    shared by all API pods.
+
+    The YAML file of a commit never changes so entries are keyed by commit only.
+    The owner and repository YAML are merged in by `final_commit_yaml` on every
+    call, so changes to them are picked up right away. Failed fetches and
+    commits without a YAML file aren't cached since a missing file may just be
+    the provider lagging behind a push.
+    """
+
+    redis_key_prefix = "commit_yaml"
+
+    def __init__(self, max_size: int, ttl: int, redis_enabled: bool = False):
+        # entries are `(expires_at, yaml_str)`
+        self.local = SizeBoundedLRUCache(max_size, sizeof=lambda entry: len(entry[1]))
+        self.ttl = ttl
+        self.redis_enabled = redis_enabled
+
+    @classmethod
+    def key(cls, commit: Commit) -> str:
+        return f"{cls.redis_key_prefix}/{commit.repository_id}/{commit.commitid}"
+
+    def get_or_fetch(
+        self, key: str, fetch: Callable[[], Optional[str]]
+    ) -> Optional[str]:
+        entry = self.local.get(key)
+        if entry is not None:
+            expires_at, yaml_str = entry
+            if expires_at > time.monotonic():
+                metrics.incr("services.yaml.commit_yaml_cache.local_hit")
+                return yaml_str
+            self.local.delete(key)
+
+        if self.redis_enabled:
+            data = self._redis_get(key)
+            if data is not None:
+                metrics.incr("services.yaml.commit_yaml_cache.redis_hit")
+                yaml_str = json.loads(data)
+                self._local_set(key, yaml_str)
+                return yaml_str
+
+        metrics.incr("services.yaml.commit_yaml_cache.miss")
+        yaml_str = fetch()
+        if yaml_str is None:
+            return None
+
+        self._local_set(key, yaml_str)
+        if self.redis_enabled:
+            self._redis_set(key, json.dumps(yaml_str))
+        return yaml_str
+
+    def _local_set(self, key: str, yaml_str: str) -> None:
+        self.local.set(key, (time.monotonic() + self.ttl, yaml_str))
+
+    def _redis_get(self, key: str) -> Optional[bytes]:
+        try:
+            return get_redis_connection().get(key)
+        except RedisError:
+            log.warning("Error fetching commit YAML from redis", exc_info=True)
+            return None
+
+    def _redis_set(self, key: str, data: str) -> None:
+        try:
+            get_redis_connection().set(key, data, ex=self.ttl)
+        except RedisError:
+            log.warning("Error storing commit YAML in redis", exc_info=True)
+
+
+_commit_yaml_cache = None
+_commit_yaml_cache_lock = threading.Lock()
+
+
+def get_commit_yaml_cache() -> Optional[CommitYamlCache]:
+    """
+    Returns the process-wide commit YAML cache, or `None` if it is disabled.
+    """
+    global _commit_yaml_cache
+
+    if not settings.COMMIT_YAML_CACHE_ENABLED:
+        return None
+
+    if _commit_yaml_cache is None:
+        with _commit_yaml_cache_lock:
+            if _commit_yaml_cache is None:
+                _commit_yaml_cache = CommitYamlCache(
+                    max_size=settings.COMMIT_YAML_CACHE_MAX_SIZE,
+                    ttl=settings.COMMIT_YAML_CACHE_TTL,
+                    redis_enabled=settings.COMMIT_YAML_CACHE_REDIS_ENABLED,
+                )
+    return _commit_yaml_cache
+
+
+def _fetch_commit_yaml_from_provider(commit: Commit, owner: Owner) -> Optional[str]:
+    repository_service = RepoProviderService().get_adapter(
+        owner=owner, repo=commit.repository
+    )
+    return async_to_sync(fetch_current_yaml_from_provider_via_reference)(
+        commit.commitid, repository_service
+    )
+
+
 def fetch_commit_yaml(commit: Commit, owner: Owner) -> Optional[Dict]:
     """
     Fetches the codecov.yaml file for a particular commit from the service provider.
     Service provider API request is made on behalf of the given `owner`.
     """
     try:
-        repository_service = RepoProviderService().get_adapter(
-            owner=owner, repo=commit.repository
-        )
-        yaml_str = async_to_sync(fetch_current_yaml_from_provider_via_reference)(
-            commit.commitid, repository_service
-        )
+        commit_yaml_cache = get_commit_yaml_cache()
+        if commit_yaml_cache is None:
+            yaml_str = _fetch_commit_yaml_from_provider(commit, owner)
+        else:
+            yaml_str = commit_yaml_cache.get_or_fetch(
+                commit_yaml_cache.key(commit),
+                lambda: _fetch_commit_yaml_from_provider(commit, owner),
+            )
         yaml_dict = safe_load(yaml_str)
         return validate_yaml(yaml_dict, show_secrets_for=None)
     except:
@@ -39,8 +155,6 @@ def fetch_commit_yaml(commit: Commit, owner: Owner) -> Optional[Dict]:
         return None
 
 
-@lru_cache()
-# TODO: make this use the Redis cache logic in 'shared' once it's there
 def final_commit_yaml(commit: Commit, owner: Owner) -> UserYaml:
     return UserYaml.get_final_yaml(
         owner_yaml=commit.repository.author.yaml,
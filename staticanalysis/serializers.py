@@ -31,48 +31,54 @@ class CommitFromShaSerializerField(serializers.Field):
         return commit
 
 
-def _dict_to_suite_filepath(
-    analysis_suite,
-    repository,
-    archive_service,
-    existing_file_snapshots_mapping,
-    file_dict,
-):
-    if file_dict["file_hash"] in existing_file_snapshots_mapping:
-        db_element = existing_file_snapshots_mapping[file_dict["file_hash"]]
-        was_created = False
-    else:
-        path = MinioEndpoints.static_analysis_single_file.get_path(
-            version="v4",
-            repo_hash=archive_service.storage_hash,
-            location=f"{file_dict['file_hash']}.json",
+def _get_or_create_snapshots(repository, archive_service, file_hashes):
+    """
+    Returns the snapshots of `file_hashes` by hash, creating the missing ones
+    with a single bulk insert.
+    """
+    snapshots = {
+        snapshot.file_hash: snapshot
+        for snapshot in StaticAnalysisSingleFileSnapshot.objects.filter(
+            repository=repository, file_hash__in=file_hashes
         )
-        # Using get or create in the case the object was already
-        # created somewhere else first, but also because get_or_create
-        # is internally get_or_create_or_get, so Django handles the conflicts
-        # that can arise on race conditions on the create step
-        # We might choose to change it if the number of extra GETs become too much
-        (
-            db_element,
-            was_created,
-        ) = StaticAnalysisSingleFileSnapshot.objects.get_or_create(
-            file_hash=file_dict["file_hash"],
-            repository=repository,
-            defaults=dict(
-                state_id=StaticAnalysisSingleFileSnapshotState.CREATED.db_id,
-                content_location=path,
-            ),
+    }
+    missing_hashes = [
+        file_hash
+        for file_hash in dict.fromkeys(file_hashes)
+        if file_hash not in snapshots
+    ]
+    if missing_hashes:
+        StaticAnalysisSingleFileSnapshot.objects.bulk_create(
+            [
+                StaticAnalysisSingleFileSnapshot(
+                    file_hash=file_hash,
+                    repository=repository,
+                    state_id=StaticAnalysisSingleFileSnapshotState.CREATED.db_id,
+                    content_location=MinioEndpoints.static_analysis_single_file.get_path(
+                        version="v4",
+                        repo_hash=archive_service.storage_hash,
+                        location=f"{file_hash}.json",
+                    ),
+                )
+                for file_hash in missing_hashes
+            ],
+            batch_size=1000,
+            # snapshots created concurrently by another upload are kept as is
+            ignore_conflicts=True,
+        )
+        # `ignore_conflicts` doesn't set the primary keys, so the inserted (or
+        # conflicting) rows are fetched back
+        snapshots.update(
+            (snapshot.file_hash, snapshot)
+            for snapshot in StaticAnalysisSingleFileSnapshot.objects.filter(
+                repository=repository, file_hash__in=missing_hashes
+            )
         )
-    if was_created:
         log.debug(
-            "Created new snapshot for repository",
-            extra=dict(repoid=repository.repoid, snapshot_id=db_element.id),
+            "Created new snapshots for repository",
+            extra=dict(repoid=repository.repoid, count=len(missing_hashes)),
         )
-    return StaticAnalysisSuiteFilepath(
-        filepath=file_dict["filepath"],
-        file_snapshot=db_element,
-        analysis_suite=analysis_suite,
-    )
+    return snapshots, len(missing_hashes)
 
 
 class StaticAnalysisSuiteFilepathField(serializers.ModelSerializer):
@@ -95,12 +101,15 @@ class StaticAnalysisSuiteFilepathField(serializers.ModelSerializer):
         ).name
 
     def get_raw_upload_location(self, obj):
+        location = obj.file_snapshot.content_location
+        # presigned in a batch by `FilepathListField`
+        raw_upload_locations = self.context.get("raw_upload_locations")
+        if raw_upload_locations is not None:
+            return raw_upload_locations[location]
         # TODO: This has a built-in ttl of 10 seconds.
         # We have to consider changing it in case customers are doing a few
         # thousand uploads on the first time
-        return self.context["archive_service"].create_presigned_put(
-            obj.file_snapshot.content_location
-        )
+        return self.context["archive_service"].create_presigned_put(location)
 
 
 class FilepathListField(serializers.ListField):
@@ -110,6 +119,15 @@ class FilepathListField(serializers.ListField):
         data = data.select_related(
             "file_snapshot",
         ).all()
+        locations = list(
+            dict.fromkeys(filepath.file_snapshot.content_location for filepath in data)
+        )
+        self.context["raw_upload_locations"] = dict(
+            zip(
+                locations,
+                self.context["archive_service"].create_presigned_puts(locations),
+            )
+        )
         return super().to_representation(data)
 
 
@@ -133,17 +151,14 @@ class StaticAnalysisSuiteSerializer(serializers.ModelSerializer):
         ttl = max(math.ceil(len(file_metadata_array) / 10) + 5, 10)
         self.context["archive_service"] = ArchiveService(repository, ttl=ttl)
         all_hashes = [val["file_hash"] for val in file_metadata_array]
-        existing_values = StaticAnalysisSingleFileSnapshot.objects.filter(
-            repository=repository, file_hash__in=all_hashes
+        snapshots, created_count = _get_or_create_snapshots(
+            repository, archive_service, all_hashes
         )
-        existing_values_mapping = {val.file_hash: val for val in existing_values}
         created_filepaths = [
-            _dict_to_suite_filepath(
-                obj,
-                repository,
-                archive_service,
-                existing_values_mapping,
-                file_dict,
+            StaticAnalysisSuiteFilepath(
+                filepath=file_dict["filepath"],
+                file_snapshot=snapshots[file_dict["file_hash"]],
+                analysis_suite=obj,
             )
             for file_dict in file_metadata_array
         ]
@@ -154,13 +169,10 @@ class StaticAnalysisSuiteSerializer(serializers.ModelSerializer):
                 created_ids=[f.id for f in created_filepaths], repoid=repository.repoid
             ),
         )
-        metrics.gauge(
-            "static_analysis.suite.files_created",
-            len(file_metadata_array) - len(existing_values_mapping),
-        )
+        metrics.gauge("static_analysis.suite.files_created", created_count)
         metrics.gauge("static_analysis.suite.total_files", len(file_metadata_array))
         metrics.gauge(
-            "static_analysis.suite.existing_files", len(existing_values_mapping)
+            "static_analysis.suite.existing_files", len(snapshots) - created_count
         )
         metrics.incr("static_analysis.suite.count")
         return obj
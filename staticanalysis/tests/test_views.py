@@ -13,8 +13,8 @@ from staticanalysis.tests.factories import StaticAnalysisSuiteFactory
 def test_simple_static_analysis_call_no_uploads_yet(db, mocker):
     mocked_task_service = mocker.patch.object(TaskService, "schedule_task")
     mocked_presigned_put = mocker.patch(
-        "services.archive.StorageService.create_presigned_put",
-        return_value="banana.txt",
+        "services.archive.StorageService.create_presigned_puts",
+        side_effect=lambda bucket, paths, expires: ["banana.txt"] * len(paths),
     )
     commit = CommitFactory.create(repository__active=True)
     token = RepositoryTokenFactory.create(
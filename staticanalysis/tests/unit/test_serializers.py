@@ -7,6 +7,7 @@ from rest_framework.exceptions import NotFound, ValidationError
 from core.tests.factories import CommitFactory, RepositoryFactory
 from services.archive import ArchiveService
 from staticanalysis.models import (
+    StaticAnalysisSingleFileSnapshot,
     StaticAnalysisSingleFileSnapshotState,
     StaticAnalysisSuite,
     StaticAnalysisSuiteFilepath,
@@ -18,6 +19,7 @@ from staticanalysis.serializers import (
 )
 from staticanalysis.tests.factories import (
     StaticAnalysisSingleFileSnapshotFactory,
+    StaticAnalysisSuiteFactory,
     StaticAnalysisSuiteFilepathFactory,
 )
 
@@ -329,3 +331,76 @@ class TestStaticAnalysisSuiteSerializer(object):
             fourth_filepath.file_snapshot.state_id
             == StaticAnalysisSingleFileSnapshotState.VALID.db_id
         )
+
+    def test_create_many_files_bulk(self, mocker, db, django_assert_max_num_queries):
+        repository = RepositoryFactory.create()
+        commit = CommitFactory.create(repository=repository)
+        existing_snapshot = StaticAnalysisSingleFileSnapshotFactory.create(
+            file_hash=uuid4(),
+            repository=repository,
+            state_id=StaticAnalysisSingleFileSnapshotState.VALID.db_id,
+            content_location="existing_snapshot",
+        )
+        file_hashes = [uuid4() for _ in range(50)]
+        validated_data = {
+            "commit": commit,
+            "filepaths": [
+                {"filepath": f"file_{i}.py", "file_hash": file_hash}
+                for i, file_hash in enumerate(file_hashes)
+            ]
+            + [
+                # same content as another file
+                {"filepath": "copy.py", "file_hash": file_hashes[0]},
+                {"filepath": "existing.py", "file_hash": existing_snapshot.file_hash},
+            ],
+        }
+        fake_request = mocker.MagicMock(
+            auth=mocker.MagicMock(
+                get_repositories=mocker.MagicMock(return_value=[repository])
+            )
+        )
+        serializer = StaticAnalysisSuiteSerializer(context={"request": fake_request})
+        # the number of queries doesn't depend on the number of files
+        with django_assert_max_num_queries(8):
+            res = serializer.create(validated_data)
+
+        assert res.filepaths.count() == 52
+        assert (
+            StaticAnalysisSingleFileSnapshot.objects.filter(
+                repository=repository
+            ).count()
+            == 51
+        )
+        filepaths = {fp.filepath: fp for fp in res.filepaths.all()}
+        assert (
+            filepaths["copy.py"].file_snapshot_id
+            == filepaths["file_0.py"].file_snapshot_id
+        )
+        assert filepaths["existing.py"].file_snapshot == existing_snapshot
+
+    def test_to_representation_presigns_in_batch(self, mocker, db):
+        suite = StaticAnalysisSuiteFactory.create()
+        snapshot = StaticAnalysisSingleFileSnapshotFactory.create(
+            content_location="some/location.json"
+        )
+        StaticAnalysisSuiteFilepathFactory.create(
+            analysis_suite=suite, file_snapshot=snapshot, filepath="a.py"
+        )
+        StaticAnalysisSuiteFilepathFactory.create(
+            analysis_suite=suite, file_snapshot=snapshot, filepath="b.py"
+        )
+        fake_archive_service = mocker.MagicMock(
+            create_presigned_puts=mocker.MagicMock(return_value=["some_url_stuff"])
+        )
+        serializer = StaticAnalysisSuiteSerializer(
+            context={"archive_service": fake_archive_service}
+        )
+        res = serializer.to_representation(suite)
+        assert [fp["raw_upload_location"] for fp in res["filepaths"]] == [
+            "some_url_stuff",
+            "some_url_stuff",
+        ]
+        fake_archive_service.create_presigned_puts.assert_called_once_with(
+            ["some/location.json"]
+        )
+        fake_archive_service.create_presigned_put.assert_not_called()
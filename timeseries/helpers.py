@@ -1,5 +1,9 @@
+import hashlib
+import json
+import logging
 import math
 from datetime import datetime, timedelta
+from decimal import Decimal
 from typing import Iterable, List, Optional
 
 from django.conf import settings
@@ -20,11 +24,13 @@ from django.db.models import (
 from django.db.models.fields.json import KeyTextTransform
 from django.db.models.functions import Cast
 from django.utils import timezone
+from redis.exceptions import RedisError
 
 import services.report as report_service
 from codecov_auth.models import Owner
 from core.models import Commit, Repository
 from reports.models import RepositoryFlag
+from services.redis_configuration import get_redis_connection
 from services.task import TaskService
 from timeseries.models import (
     Dataset,
@@ -34,6 +40,8 @@ from timeseries.models import (
     MeasurementSummary,
 )
 
+log = logging.getLogger(__name__)
+
 interval_deltas = {
     Interval.INTERVAL_1_DAY: timedelta(days=1),
     Interval.INTERVAL_7_DAY: timedelta(days=7),
@@ -144,6 +152,193 @@ def coverage_measurements(
         return aggregate_measurements(queryset).order_by("timestamp_bin")
 
 
+def cached_coverage_measurements(
+    interval: Interval,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    repos: Optional[List[Repository]] = None,
+    **filters,
+) -> List[dict]:
+    """
+    Same results as `coverage_measurements` but the older bins are cached in Redis.
+    Measurements are written by the worker once an upload has been processed, so
+    the bins overlapping the last `TIMESERIES_CACHE_RECENT_WINDOW` seconds (where
+    measurements of recent commits land) are queried every time.  Older bins only
+    change when older commits are processed and may be stale for up to
+    `TIMESERIES_CACHE_TTL` seconds.
+
+    Cached series are keyed by the bins they span (rather than the exact dates) and
+    the measurements version of every repo involved, see `invalidate_coverage_measurements`.
+    """
+    if start_date is not None and start_date.tzinfo is None:
+        start_date = start_date.replace(tzinfo=timezone.utc)
+    if end_date is not None and end_date.tzinfo is None:
+        end_date = end_date.replace(tzinfo=timezone.utc)
+
+    delta = interval_deltas[interval]
+    recent_bin = aligned_start_date(
+        interval,
+        timezone.now() - timedelta(seconds=settings.TIMESERIES_CACHE_RECENT_WINDOW),
+    )
+
+    # `coverage_measurements` selects the bins in [start_date, end_date] so the
+    # dates can be snapped to bin boundaries without changing the results
+    if start_date is not None:
+        aligned_start = aligned_start_date(interval, start_date)
+        start_date = (
+            aligned_start if aligned_start == start_date else aligned_start + delta
+        )
+    last_cached_bin = recent_bin - delta
+    if end_date is not None:
+        last_cached_bin = min(last_cached_bin, aligned_start_date(interval, end_date))
+
+    if start_date is not None and start_date > last_cached_bin:
+        # only recent bins were requested
+        return list(
+            coverage_measurements(
+                interval,
+                start_date=start_date,
+                end_date=end_date,
+                repos=repos,
+                **filters,
+            )
+        )
+
+    repo_ids = [repo.repoid for repo in repos] if repos else [filters.get("repo_id")]
+    key = _coverage_measurements_cache_key(
+        interval,
+        start_date,
+        last_cached_bin,
+        repos,
+        filters,
+        _measurements_versions(repo_ids),
+    )
+
+    measurements = _get_cached_measurements(key)
+    if measurements is None:
+        measurements = list(
+            coverage_measurements(
+                interval,
+                start_date=start_date,
+                end_date=last_cached_bin,
+                repos=repos,
+                **filters,
+            )
+        )
+        _set_cached_measurements(key, measurements)
+
+    if end_date is None or end_date >= recent_bin:
+        measurements = measurements + list(
+            coverage_measurements(
+                interval,
+                end_date=end_date,
+                repos=repos,
+                timestamp_bin__gte=recent_bin,
+                **filters,
+            )
+        )
+
+    return measurements
+
+
+def invalidate_coverage_measurements(repo_ids: Iterable[int]) -> None:
+    """
+    Bumps the measurements version of the given repos so that the cached series
+    that include them are recomputed.
+    """
+    if not settings.TIMESERIES_CACHE_ENABLED:
+        return
+
+    try:
+        pipeline = get_redis_connection().pipeline()
+        for repo_id in repo_ids:
+            pipeline.incr(_measurements_version_key(repo_id))
+        pipeline.execute()
+    except RedisError:
+        log.warning("Failed to invalidate cached measurements", exc_info=True)
+
+
+def _measurements_version_key(repo_id: int) -> str:
+    return f"timeseries_version/{repo_id}"
+
+
+def _measurements_versions(repo_ids: List[int]) -> List[Optional[bytes]]:
+    try:
+        return get_redis_connection().mget(
+            [_measurements_version_key(repo_id) for repo_id in repo_ids]
+        )
+    except RedisError:
+        log.warning("Failed to fetch measurements versions", exc_info=True)
+        return None
+
+
+def _coverage_measurements_cache_key(
+    interval: Interval,
+    start_date: Optional[datetime],
+    end_date: datetime,
+    repos: Optional[List[Repository]],
+    filters: dict,
+    versions: Optional[List[Optional[bytes]]],
+) -> Optional[str]:
+    if versions is None:
+        return None
+
+    parts = [
+        interval.value,
+        start_date.isoformat() if start_date else None,
+        end_date.isoformat(),
+        sorted((repo.repoid, repo.branch) for repo in repos) if repos else None,
+        sorted(filters.items()),
+        [int(version) if version else 0 for version in versions],
+    ]
+    digest = hashlib.sha1(json.dumps(parts).encode()).hexdigest()
+    return f"timeseries_coverage/{digest}"
+
+
+def _get_cached_measurements(key: Optional[str]) -> Optional[List[dict]]:
+    if key is None:
+        return None
+
+    try:
+        data = get_redis_connection().get(key)
+    except RedisError:
+        log.warning("Failed to fetch cached measurements", exc_info=True)
+        return None
+    if data is None:
+        return None
+
+    return [
+        {
+            "timestamp_bin": datetime.fromisoformat(timestamp_bin),
+            "min": min_value,
+            "max": max_value,
+            "avg": Decimal(avg) if avg is not None else None,
+        }
+        for timestamp_bin, min_value, max_value, avg in json.loads(data)
+    ]
+
+
+def _set_cached_measurements(key: Optional[str], measurements: List[dict]) -> None:
+    if key is None:
+        return
+
+    data = [
+        [
+            measurement["timestamp_bin"].isoformat(),
+            measurement["min"],
+            measurement["max"],
+            str(measurement["avg"]) if measurement["avg"] is not None else None,
+        ]
+        for measurement in measurements
+    ]
+    try:
+        get_redis_connection().setex(
+            key, settings.TIMESERIES_CACHE_TTL, json.dumps(data)
+        )
+    except RedisError:
+        log.warning("Failed to cache measurements", exc_info=True)
+
+
 def trigger_backfill(dataset: Dataset):
     """
     Triggers a backfill for the full timespan of the dataset's repo's commits.
@@ -161,6 +356,9 @@ def trigger_backfill(dataset: Dataset):
     )
 
     if oldest_commit and newest_commit:
+        # the backfill rewrites historical measurements
+        invalidate_coverage_measurements([dataset.repository_id])
+
         # dates to span the entire range of commits
         start_date = oldest_commit.timestamp.date()
         start_date = datetime.fromordinal(start_date.toordinal())
@@ -330,11 +528,15 @@ def repository_coverage_measurements_with_fallback(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     branch: str = None,
+    cached: bool = False,
 ):
     """
     Tries to return repository coverage measurements from Timescale.
     If those are not available then we trigger a backfill and return computed results
     directly from the primary database (much slower to query).
+
+    With `cached` (and the timeseries cache enabled) the Timescale results are
+    returned as a list through `cached_coverage_measurements` instead of a queryset.
     """
     dataset = None
     if settings.TIMESERIES_ENABLED:
@@ -345,7 +547,11 @@ def repository_coverage_measurements_with_fallback(
 
     if settings.TIMESERIES_ENABLED and dataset and dataset.is_backfilled():
         # timeseries data is ready
-        return coverage_measurements(
+        if cached and settings.TIMESERIES_CACHE_ENABLED:
+            measurements = cached_coverage_measurements
+        else:
+            measurements = coverage_measurements
+        return measurements(
             interval,
             start_date=start_date,
             end_date=end_date,
@@ -379,11 +585,15 @@ def owner_coverage_measurements_with_fallback(
     interval: Interval,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    cached: bool = False,
 ):
     """
     Tries to return owner coverage measurements from Timescale.
     If those are not available then we trigger a backfill and return computed results
     directly from the primary database (much slower to query).
+
+    With `cached` (and the timeseries cache enabled) the Timescale results are
+    returned as a list through `cached_coverage_measurements` instead of a queryset.
     """
     datasets = []
     if settings.TIMESERIES_ENABLED:
@@ -402,7 +612,11 @@ def owner_coverage_measurements_with_fallback(
 
     if settings.TIMESERIES_ENABLED and all_backfilled:
         # timeseries data is ready
-        return coverage_measurements(
+        if cached and settings.TIMESERIES_CACHE_ENABLED:
+            measurements = cached_coverage_measurements
+        else:
+            measurements = coverage_measurements
+        return measurements(
             interval,
             start_date=start_date,
             end_date=end_date,
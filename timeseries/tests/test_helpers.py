@@ -1,9 +1,10 @@
 from datetime import datetime, timezone
 from unittest.mock import call, patch
 
+import fakeredis
 import pytest
 from django.conf import settings
-from django.test import TransactionTestCase
+from django.test import TransactionTestCase, override_settings
 from django.utils import timezone
 from freezegun import freeze_time
 from freezegun.api import FakeDatetime
@@ -14,8 +15,10 @@ from codecov_auth.tests.factories import OwnerFactory
 from core.tests.factories import CommitFactory, RepositoryFactory
 from reports.tests.factories import RepositoryFlagFactory
 from timeseries.helpers import (
+    cached_coverage_measurements,
     coverage_measurements,
     fill_sparse_measurements,
+    invalidate_coverage_measurements,
     owner_coverage_measurements_with_fallback,
     refresh_measurement_summaries,
     repository_coverage_measurements_with_fallback,
@@ -147,6 +150,86 @@ class RepositoryCoverageMeasurementsTest(TransactionTestCase):
         ]
 
 
+@pytest.mark.skipif(
+    not settings.TIMESERIES_ENABLED, reason="requires timeseries data storage"
+)
+@freeze_time("2022-01-02T12:00:00")
+@override_settings(TIMESERIES_CACHE_ENABLED=True)
+class CachedCoverageMeasurementsTest(TransactionTestCase):
+    databases = {"default", "timeseries"}
+
+    def setUp(self):
+        self.repo = RepositoryFactory()
+
+        redis_patcher = patch("timeseries.helpers.get_redis_connection")
+        get_redis_connection = redis_patcher.start()
+        get_redis_connection.return_value = fakeredis.FakeStrictRedis()
+        self.addCleanup(redis_patcher.stop)
+
+        self._measurement(datetime(2021, 12, 31, 1, 0, 0), 70.0, "commit1")
+        self._measurement(datetime(2022, 1, 1, 1, 0, 0), 80.0, "commit2")
+        self._measurement(datetime(2022, 1, 2, 1, 0, 0), 90.0, "commit3")
+
+    def _measurement(self, timestamp, value, commit_sha):
+        MeasurementFactory(
+            name=MeasurementName.COVERAGE.value,
+            owner_id=self.repo.author_id,
+            repo_id=self.repo.pk,
+            measurable_id=str(self.repo.pk),
+            timestamp=timestamp,
+            value=value,
+            branch="master",
+            commit_sha=commit_sha,
+        )
+
+    def _measurements(self):
+        return cached_coverage_measurements(
+            Interval.INTERVAL_1_DAY,
+            start_date=datetime(2021, 12, 30, 6, 0, 0, tzinfo=timezone.utc),
+            end_date=timezone.now(),
+            repo_id=self.repo.pk,
+            measurable_id=str(self.repo.pk),
+            branch=self.repo.branch,
+        )
+
+    def test_same_results_as_coverage_measurements(self):
+        expected = list(
+            coverage_measurements(
+                Interval.INTERVAL_1_DAY,
+                start_date=datetime(2021, 12, 30, 6, 0, 0, tzinfo=timezone.utc),
+                end_date=timezone.now(),
+                repo_id=self.repo.pk,
+                measurable_id=str(self.repo.pk),
+                branch=self.repo.branch,
+            )
+        )
+        assert self._measurements() == expected
+        # from cache
+        assert self._measurements() == expected
+
+    def test_recomputes_recent_bins(self):
+        self._measurements()
+
+        self._measurement(datetime(2021, 12, 31, 2, 0, 0), 60.0, "commit4")
+        self._measurement(datetime(2022, 1, 1, 2, 0, 0), 75.0, "commit5")
+        self._measurement(datetime(2022, 1, 2, 2, 0, 0), 100.0, "commit6")
+
+        assert [(m["min"], m["max"]) for m in self._measurements()] == [
+            # older bin is served from the cache
+            (70.0, 70.0),
+            # bins within the last day are always recomputed
+            (75.0, 80.0),
+            (90.0, 100.0),
+        ]
+
+        invalidate_coverage_measurements([self.repo.pk])
+        assert [(m["min"], m["max"]) for m in self._measurements()] == [
+            (60.0, 70.0),
+            (75.0, 80.0),
+            (90.0, 100.0),
+        ]
+
+
 @pytest.mark.skipif(
     not settings.TIMESERIES_ENABLED, reason="requires timeseries data storage"
 )
@@ -7,7 +7,6 @@ import jwt
 from asgiref.sync import async_to_sync
 from cerberus import Validator
 from django.conf import settings
-from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Q
 from django.utils import timezone
 from jwt import PyJWKClient, PyJWTError
@@ -17,6 +16,10 @@ from shared.reports.enums import UploadType
 from shared.torngit.exceptions import TorngitClientError, TorngitObjectNotFoundError
 from shared.upload.utils import query_monthly_coverage_measurements
 
+from codecov_auth.authentication.token_cache import (
+    repository_by_slug,
+    repository_by_upload_token,
+)
 from codecov_auth.models import (
     GITHUB_APP_INSTALLATION_DEFAULT_NAME,
     SERVICE_GITHUB,
@@ -256,9 +259,8 @@ def determine_repo_for_upload(upload_params):
 
     if token and not using_global_token:
         if is_uuid(token):
-            try:
-                repository = Repository.objects.get(upload_token=token)
-            except ObjectDoesNotExist:
+            repository = repository_by_upload_token(token)
+            if repository is None:
                 raise NotFound(
                     f"Could not find a repository associated with upload token {token}"
                 )
@@ -274,13 +276,10 @@ def determine_repo_for_upload(upload_params):
             git_service = service
         else:
             git_service = TokenlessUploadHandler(service, upload_params).verify_upload()
-        try:
-            repository = Repository.objects.get(
-                author__service=git_service,
-                name=upload_params.get("repo"),
-                author__username=upload_params.get("owner"),
-            )
-        except ObjectDoesNotExist:
+        repository = repository_by_slug(
+            git_service, upload_params.get("owner"), upload_params.get("repo")
+        )
+        if repository is None:
             raise NotFound("Could not find a repository, try using repo upload token")
     else:
         raise ValidationError(
@@ -538,19 +537,25 @@ def check_commit_upload_constraints(commit: Commit):
                     raise Throttled(detail=message)
 
 
-def validate_upload(upload_params, repository, redis):
-    """
-    Make sure the upload can proceed and, if so, activate the repository if needed.
-    """
+# increments a counter without creating it
+INCR_IF_EXISTS_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 1 then
+    return redis.call("incr", KEYS[1])
+end
+return nil
+"""
 
-    validate_activated_repo(repository)
-    # Make sure repo hasn't moved
-    if not repository.name:
-        raise ValidationError(
-            "This repository has moved or was deleted. Please login to Codecov to retrieve a new upload token."
-        )
 
-    # Check if there are already too many sessions associated with this commit
+def _upload_count_key(repository, commitid):
+    return f"upload_count/{repository.repoid}/{commitid}"
+
+
+def _validate_upload_count(upload_params, repository, redis, current_upload_limit):
+    """
+    Make sure there aren't already too many sessions associated with this commit
+    and seed the upload counter of the commit with the current count.
+    """
+    new_session_count = 0
     try:
         commit = Commit.objects.get(
             commitid=upload_params.get("commit"), repository=repository
@@ -561,7 +566,6 @@ def validate_upload(upload_params, repository, redis):
             report__commit=commit,
         ).count()
         session_count = (commit.totals.get("s") if commit.totals else 0) or 0
-        current_upload_limit = get_config("setup", "max_sessions") or 150
         if new_session_count > current_upload_limit:
             if session_count <= current_upload_limit:
                 log.info(
@@ -597,6 +601,33 @@ def validate_upload(upload_params, repository, redis):
     except Commit.DoesNotExist:
         pass
 
+    redis.setex(
+        _upload_count_key(repository, upload_params.get("commit")),
+        get_config("setup", "cache", "upload_count", default=3600),
+        new_session_count,
+    )
+
+
+def validate_upload(upload_params, repository, redis):
+    """
+    Make sure the upload can proceed and, if so, activate the repository if needed.
+    """
+
+    validate_activated_repo(repository)
+    # Make sure repo hasn't moved
+    if not repository.name:
+        raise ValidationError(
+            "This repository has moved or was deleted. Please login to Codecov to retrieve a new upload token."
+        )
+
+    # Check if there are already too many sessions associated with this commit
+    current_upload_limit = get_config("setup", "max_sessions") or 150
+    upload_count = redis.get(_upload_count_key(repository, upload_params.get("commit")))
+    if upload_count is None or int(upload_count) > current_upload_limit:
+        # the maintained counter is only a fast path: it's (re)seeded from the
+        # database and uploads are only rejected based on the database count
+        _validate_upload_count(upload_params, repository, redis, current_upload_limit)
+
     # Check if this repository is blacklisted and not allowed to upload
     if redis.sismember("flags.disable_tasks", repository.repoid):
         raise ValidationError(
@@ -716,32 +747,55 @@ def dispatch_upload_task(
     ):
         countdown = 4
 
-    redis.rpush(repo_queue_key, dumps(task_arguments))
-    redis.expire(
-        repo_queue_key, cache_uploads_eta if cache_uploads_eta is not True else 86400
-    )
-
     if report_type == CommitReport.ReportType.COVERAGE:
         latest_upload_key = (
             f"latest_upload/{repository.repoid}/{task_arguments.get('commit')}"
         )
     else:
         latest_upload_key = f"latest_upload/{repository.repoid}/{task_arguments.get('commit')}/{report_type}"
-    redis.setex(
+
+    commitid = task_arguments.get("commit")
+    countdown = max(countdown, int(get_config("setup", "upload_processing_delay") or 0))
+    # Upload tasks process every queued upload of the commit, so a task that was
+    # dispatched recently and hasn't started yet (it's delayed by `countdown`)
+    # will also pick up this upload. Off unless a window is configured, and never
+    # longer than the delay so the pending task can't have started.
+    coalesce_window = min(
+        get_config("setup", "upload_dispatch_window", default=0), countdown
+    )
+
+    # all the redis work for this upload in a single round trip
+    pipeline = redis.pipeline()
+    pipeline.rpush(repo_queue_key, dumps(task_arguments))
+    pipeline.expire(
+        repo_queue_key, cache_uploads_eta if cache_uploads_eta is not True else 86400
+    )
+    pipeline.setex(
         latest_upload_key,
         3600,
         timezone.now().timestamp(),
     )
-    commitid = task_arguments.get("commit")
+    # counts the uploads of every report type, like `_validate_upload_count`.
+    # The counter is only ever seeded from the database by `validate_upload`.
+    pipeline.eval(INCR_IF_EXISTS_SCRIPT, 1, _upload_count_key(repository, commitid))
+    if coalesce_window > 0:
+        dispatch_key = f"upload_dispatch/{repository.repoid}/{commitid}/{report_type}/{task_arguments.get('report_code')}"
+        pipeline.set(dispatch_key, 1, ex=coalesce_window, nx=True)
+    results = pipeline.execute()
+
+    if coalesce_window > 0 and not results[-1]:
+        log.info(
+            "Upload task already dispatched for commit",
+            extra=dict(repoid=repository.repoid, commit=commitid),
+        )
+        return
 
     TaskService().upload(
         repoid=repository.repoid,
         commitid=commitid,
         report_type=str(report_type),
         report_code=task_arguments.get("report_code"),
-        countdown=max(
-            countdown, int(get_config("setup", "upload_processing_delay") or 0)
-        ),
+        countdown=countdown,
     )
 
 
@@ -240,7 +240,10 @@ def test_check_commit_constraints_settings_enabled(db, settings, mocker):
 def test_validate_upload_too_many_uploads_for_commit(
     db, totals_column_count, rows_count, should_raise, mocker
 ):
-    redis = mocker.MagicMock(sismember=mocker.MagicMock(return_value=False))
+    redis = mocker.MagicMock(
+        sismember=mocker.MagicMock(return_value=False),
+        get=mocker.MagicMock(return_value=None),
+    )
     owner = OwnerFactory.create(plan="users-free")
     repo = RepositoryFactory.create(author=owner)
     commit = CommitFactory.create(totals={"s": totals_column_count}, repository=repo)
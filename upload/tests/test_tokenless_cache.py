@@ -0,0 +1,153 @@
+import json
+
+import pytest
+import requests
+from django.test import override_settings
+from rest_framework.exceptions import NotFound
+
+from upload.tokenless.cache import _cache_key
+from upload.tokenless.tokenless import TokenlessUploadHandler
+
+commit = "c739768fcac68144a3a6d82305b9c4106934d31a"
+
+
+@pytest.fixture
+def verification_cache(mock_redis):
+    with override_settings(TOKENLESS_VERIFICATION_CACHE_ENABLED=True):
+        yield mock_redis
+
+
+def circleci_params():
+    return {"build": "12.34", "owner": "owner", "repo": "repo", "commit": commit}
+
+
+def test_verification_is_cached(verification_cache, mocker):
+    mock_get = mocker.patch.object(requests, "get")
+    mock_get.return_value.json.return_value = {
+        "vcs_revision": commit,
+        "vcs_type": "github",
+    }
+
+    for _ in range(3):
+        res = TokenlessUploadHandler("circleci", circleci_params()).verify_upload()
+        assert res == "github"
+
+    assert mock_get.call_count == 1
+
+
+def test_failed_verification_is_cached(verification_cache, mocker):
+    mock_get = mocker.patch.object(requests, "get")
+    mock_get.return_value.json.return_value = {
+        "vcs_revision": "other",
+        "vcs_type": "github",
+    }
+
+    for _ in range(2):
+        with pytest.raises(NotFound) as e:
+            TokenlessUploadHandler("circleci", circleci_params()).verify_upload()
+        assert e.value.detail == (
+            "Commit sha does not match Circle build. Please upload with the Codecov repository upload token to resolve issue."
+        )
+
+    assert mock_get.call_count == 1
+
+
+def test_verifications_are_keyed_by_build(verification_cache, mocker):
+    mock_get = mocker.patch.object(requests, "get")
+    mock_get.return_value.json.return_value = {
+        "vcs_revision": commit,
+        "vcs_type": "github",
+    }
+
+    TokenlessUploadHandler("circleci", circleci_params()).verify_upload()
+    TokenlessUploadHandler(
+        "circleci", {**circleci_params(), "build": "13.1"}
+    ).verify_upload()
+
+    assert mock_get.call_count == 2
+
+
+def test_unexpected_errors_are_not_cached(verification_cache, mocker):
+    mock_get = mocker.patch.object(requests, "get")
+    mock_get.return_value.json.side_effect = [
+        ValueError("not json"),
+        {"vcs_revision": commit, "vcs_type": "github"},
+    ]
+
+    with pytest.raises(ValueError):
+        TokenlessUploadHandler("circleci", circleci_params()).verify_upload()
+    res = TokenlessUploadHandler("circleci", circleci_params()).verify_upload()
+
+    assert res == "github"
+    assert mock_get.call_count == 2
+    assert not verification_cache.exists(
+        _cache_key("circleci", circleci_params()) + "/lock"
+    )
+
+
+def test_concurrent_upload_waits_for_verification(verification_cache, mocker):
+    mock_get = mocker.patch.object(requests, "get")
+    key = _cache_key("circleci", circleci_params())
+    # another upload of the build is talking to CircleCI
+    verification_cache.set(f"{key}/lock", 1)
+
+    def finish_verification(_):
+        verification_cache.set(key, json.dumps(dict(service="github", build="12.34")))
+
+    mocker.patch("upload.tokenless.cache.time.sleep", side_effect=finish_verification)
+
+    res = TokenlessUploadHandler("circleci", circleci_params()).verify_upload()
+
+    assert res == "github"
+    assert not mock_get.called
+
+
+def test_cached_verification_normalizes_build(verification_cache, mocker):
+    mock_get = mocker.patch.object(requests, "get")
+    mock_get.return_value.json.return_value = {
+        "finishTime": "NOW",
+        "buildNumber": "20190725+8",
+        "status": "inProgress",
+        "sourceVersion": commit,
+        "repository": {"type": "GitHub"},
+    }
+
+    def params():
+        return {
+            "project": "project123",
+            "job": 732059764,
+            "server_uri": "https://",
+            "commit": commit,
+            "build": "20190725+8",
+        }
+
+    first, second = params(), params()
+    TokenlessUploadHandler("azure_pipelines", first).verify_upload()
+    TokenlessUploadHandler("azure_pipelines", second).verify_upload()
+
+    assert mock_get.call_count == 1
+    assert first["build"] == second["build"] == "20190725 8"
+
+
+def test_waiting_upload_takes_over_failed_verification(verification_cache, mocker):
+    mock_get = mocker.patch.object(requests, "get")
+    mock_get.return_value.json.return_value = {
+        "vcs_revision": commit,
+        "vcs_type": "github",
+    }
+    key = _cache_key("circleci", circleci_params())
+    verification_cache.set(f"{key}/lock", 1)
+
+    def holder_fails(_):
+        # the upload holding the lock failed with an uncached error
+        verification_cache.delete(f"{key}/lock")
+
+    sleep = mocker.patch("upload.tokenless.cache.time.sleep", side_effect=holder_fails)
+
+    res = TokenlessUploadHandler("circleci", circleci_params()).verify_upload()
+
+    assert res == "github"
+    assert sleep.call_count == 1
+    assert mock_get.call_count == 1
+    assert verification_cache.get(key) is not None
+    assert not verification_cache.exists(f"{key}/lock")
@@ -27,8 +27,10 @@ from simplejson import JSONDecodeError
 from codecov_auth.models import Owner
 from codecov_auth.tests.factories import OwnerFactory
 from core.models import Commit, Repository
+from reports.models import CommitReport
 from reports.tests.factories import CommitReportFactory, UploadFactory
 from upload.helpers import (
+    INCR_IF_EXISTS_SCRIPT,
     determine_repo_for_upload,
     determine_upload_branch_to_use,
     determine_upload_commit_to_use,
@@ -54,12 +56,19 @@ def mock_get_config_global_upload_tokens(*args):
         return "bitbucketserveruploadtoken"
 
 
+def mock_get_config_upload_dispatch_window(*args, default=None):
+    if args == ("setup", "upload_dispatch_window"):
+        return 2
+    return default
+
+
 class MockRedis:
     def __init__(self, blacklisted=False, *args, **kwargs):
         self.blacklisted = blacklisted
         self.expected_task_key = kwargs.get("expected_task_key")
         self.expected_task_arguments = kwargs.get("expected_task_arguments")
         self.expected_expire_time = kwargs.get("expected_expire_time")
+        self.values = {}
 
     def rpush(self, key, value):
         assert key == self.expected_task_key
@@ -73,14 +82,48 @@ class MockRedis:
         return self.blacklisted
 
     def get(self, key):
-        return 10
+        return self.values.get(key)
+
+    def setex(self, redis_key, expire_time, value):
+        self.values[redis_key] = value
+
+    def set(self, redis_key, value, ex=None, nx=False):
+        if nx and redis_key in self.values:
+            return None
+        self.values[redis_key] = value
+        return True
+
+    def incr(self, redis_key):
+        self.values[redis_key] = int(self.values.get(redis_key, 0)) + 1
+        return self.values[redis_key]
+
+    def eval(self, script, numkeys, *keys_and_args):
+        assert script == INCR_IF_EXISTS_SCRIPT
+        key = keys_and_args[0]
+        if key in self.values:
+            return self.incr(key)
+        return None
+
+    def pipeline(self):
+        return MockRedisPipeline(self)
+
+
+class MockRedisPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.results = []
+
+    def __getattr__(self, name):
+        command = getattr(self.redis, name)
 
-    def setex(self, redis_key, expire_time, report):
-        return
+        def queue(*args, **kwargs):
+            self.results.append(command(*args, **kwargs))
 
-    def set(self, redis_key, value, **kwargs):
-        # This is only used when setting the cache key for the number of uploads. Will need to be refactored if we use it for something else.
-        assert self.get(redis_key) + 1 == value
+        return queue
+
+    def execute(self):
+        results, self.results = self.results, []
+        return results
 
 
 class UploadHandlerHelpersTest(TestCase):
@@ -905,6 +948,109 @@ class UploadHandlerHelpersTest(TestCase):
             report_type="coverage",
         )
 
+    @patch("services.task.TaskService.upload")
+    def test_dispatch_upload_task_does_not_coalesce_by_default(self, upload):
+        repo = G(Repository)
+        task_arguments = {
+            "commit": "commit123",
+            "version": "v4",
+            "report_code": "local_report",
+        }
+
+        redis = MockRedis(
+            expected_task_key=f"uploads/{repo.repoid}/commit123",
+            expected_task_arguments=task_arguments,
+            expected_expire_time=86400,
+        )
+
+        dispatch_upload_task(task_arguments, repo, redis)
+        dispatch_upload_task(task_arguments, repo, redis)
+        assert upload.call_count == 2
+
+    @patch("upload.helpers.get_config")
+    @patch("services.task.TaskService.upload")
+    def test_dispatch_upload_task_coalesces_pending_task(self, upload, get_config):
+        get_config.side_effect = mock_get_config_upload_dispatch_window
+        repo = G(Repository)
+        task_arguments = {
+            "commit": "commit123",
+            "version": "v4",
+            "report_code": "local_report",
+        }
+
+        redis = MockRedis(
+            expected_task_key=f"uploads/{repo.repoid}/commit123",
+            expected_task_arguments=task_arguments,
+            expected_expire_time=86400,
+        )
+
+        redis.setex(f"upload_count/{repo.repoid}/commit123", 3600, 5)
+
+        dispatch_upload_task(task_arguments, repo, redis)
+        dispatch_upload_task(task_arguments, repo, redis)
+        # the pending task picks up both queued uploads
+        upload.assert_called_once()
+        assert redis.get(f"upload_count/{repo.repoid}/commit123") == 7
+
+    @patch("services.task.TaskService.upload")
+    def test_dispatch_upload_task_counts_all_report_types(self, upload):
+        repo = G(Repository)
+        task_arguments = {"commit": "commit123", "report_code": None}
+
+        redis = MockRedis(
+            expected_task_key=f"uploads/{repo.repoid}/commit123/bundle_analysis",
+            expected_task_arguments=task_arguments,
+            expected_expire_time=86400,
+        )
+
+        redis.setex(f"upload_count/{repo.repoid}/commit123", 3600, 5)
+
+        dispatch_upload_task(
+            task_arguments,
+            repo,
+            redis,
+            report_type=CommitReport.ReportType.BUNDLE_ANALYSIS,
+        )
+        # `_validate_upload_count` counts the uploads of every report type
+        assert redis.get(f"upload_count/{repo.repoid}/commit123") == 6
+        assert upload.call_args.kwargs["countdown"] == 4
+
+    @patch("services.task.TaskService.upload")
+    def test_dispatch_upload_task_does_not_create_upload_counter(self, upload):
+        repo = G(Repository)
+        task_arguments = {"commit": "commit123", "report_code": None}
+
+        redis = MockRedis(
+            expected_task_key=f"uploads/{repo.repoid}/commit123",
+            expected_task_arguments=task_arguments,
+            expected_expire_time=86400,
+        )
+
+        dispatch_upload_task(task_arguments, repo, redis)
+        # only `validate_upload` seeds the counter, from the database
+        assert redis.get(f"upload_count/{repo.repoid}/commit123") is None
+        # legacy uploads keep their countdown
+        assert upload.call_args.kwargs["countdown"] == 4
+
+    def test_validate_upload_uses_upload_counter(self):
+        redis = MockRedis()
+        owner = G(Owner, plan="users-free")
+        repo = G(Repository, author=owner)
+        commit = G(Commit, totals={"s": 151}, repository=repo)
+        report = CommitReportFactory.create(commit=commit)
+        for i in range(151):
+            UploadFactory.create(report=report)
+
+        # the uploads aren't counted again while the counter is under the limit
+        redis.setex(f"upload_count/{repo.repoid}/{commit.commitid}", 3600, 10)
+        validate_upload({"commit": commit.commitid}, repo, redis)
+
+        # the database count is authoritative when the counter is over the limit
+        redis.setex(f"upload_count/{repo.repoid}/{commit.commitid}", 3600, 151)
+        with self.assertRaises(ValidationError) as err:
+            validate_upload({"commit": commit.commitid}, repo, redis)
+        assert err.exception.detail[0] == "Too many uploads to this commit."
+
 
 class UploadHandlerRouteTest(APITestCase):
     @pytest.fixture(scope="function", autouse=True)
@@ -0,0 +1,114 @@
+import json
+import logging
+import time
+from typing import Callable
+
+from django.conf import settings
+from redis.exceptions import RedisError
+from rest_framework.exceptions import APIException, NotFound, Throttled
+from shared.metrics import metrics
+
+from services.redis_configuration import get_redis_connection
+
+log = logging.getLogger(__name__)
+
+# verification errors that are cached and raised again for the other uploads
+# of the same build
+cached_exceptions = {
+    "NotFound": NotFound,
+    "Throttled": Throttled,
+}
+
+
+def _cache_key(ci_type: str, upload_params: dict) -> str:
+    parts = [
+        ci_type,
+        upload_params.get("owner"),
+        upload_params.get("repo"),
+        upload_params.get("build"),
+        upload_params.get("job"),
+        upload_params.get("commit"),
+        # azure builds are looked up on the server given by the upload
+        upload_params.get("project"),
+        upload_params.get("server_uri"),
+    ]
+    return "tokenless_verification/" + "/".join(
+        "" if part is None else str(part) for part in parts
+    )
+
+
+def _encode(service: str, upload_params: dict) -> str:
+    # some verifiers normalize the build number of the upload
+    return json.dumps(dict(service=service, build=upload_params.get("build")))
+
+
+def _encode_error(error: APIException) -> str:
+    return json.dumps(dict(error=type(error).__name__, detail=str(error.detail)))
+
+
+def _decode(data: bytes, upload_params: dict) -> str:
+    result = json.loads(data)
+    if "error" in result:
+        raise cached_exceptions[result["error"]](detail=result["detail"])
+    if upload_params.get("build") is not None:
+        upload_params["build"] = result["build"]
+    return result["service"]
+
+
+def cached_verification(
+    ci_type: str, upload_params: dict, verify: Callable[[], str]
+) -> str:
+    """
+    Verifies a tokenless upload with the CI provider at most once per
+    (ci type, owner, repo, build, job, commit) within the cache TTL.
+
+    Matrix builds send many uploads for the same build at once, so while one
+    request is talking to the provider the others wait for its result instead
+    of making their own call. Failed verifications are cached as well.
+    """
+    if not settings.TOKENLESS_VERIFICATION_CACHE_ENABLED:
+        return verify()
+
+    key = _cache_key(ci_type, upload_params)
+    lock_key = f"{key}/lock"
+    lock_timeout = settings.TOKENLESS_VERIFICATION_CACHE_LOCK_TIMEOUT
+    try:
+        redis = get_redis_connection()
+        data = redis.get(key)
+        locked = data is None and redis.set(lock_key, 1, ex=lock_timeout, nx=True)
+        # another upload of this build is being verified, if it fails without a
+        # result the lock is released and one of the waiters takes it over
+        deadline = time.monotonic() + lock_timeout
+        while data is None and not locked and time.monotonic() < deadline:
+            time.sleep(0.1)
+            data = redis.get(key)
+            if data is None:
+                locked = redis.set(lock_key, 1, ex=lock_timeout, nx=True)
+    except RedisError:
+        log.warning("Unable to use tokenless verification cache", exc_info=True)
+        return verify()
+
+    if data is not None:
+        metrics.incr("upload.tokenless_verification_cache.hit")
+        return _decode(data, upload_params)
+
+    metrics.incr("upload.tokenless_verification_cache.miss")
+    result = None
+    try:
+        service = verify()
+        result = _encode(service, upload_params)
+        return service
+    except tuple(cached_exceptions.values()) as e:
+        result = _encode_error(e)
+        raise
+    finally:
+        # unexpected errors aren't cached so that the next upload tries again
+        try:
+            pipeline = redis.pipeline()
+            if result is not None:
+                pipeline.setex(key, settings.TOKENLESS_VERIFICATION_CACHE_TTL, result)
+            if locked:
+                pipeline.delete(lock_key)
+            pipeline.execute()
+        except RedisError:
+            log.warning("Unable to store tokenless verification", exc_info=True)
@@ -11,6 +11,7 @@ from rest_framework.exceptions import NotFound
 
 from upload.tokenless.appveyor import TokenlessAppveyorHandler
 from upload.tokenless.azure import TokenlessAzureHandler
+from upload.tokenless.cache import cached_verification
 from upload.tokenless.circleci import TokenlessCircleciHandler
 from upload.tokenless.cirrus import TokenlessCirrusHandler
 from upload.tokenless.github_actions import TokenlessGithubActionsHandler
@@ -45,7 +46,10 @@ class TokenlessUploadHandler(object):
             ),
         )
         try:
-            return self.verifier(self.upload_params).verify()
+            verifier = self.verifier(self.upload_params)
+            return cached_verification(
+                self.ci_type, self.upload_params, verifier.verify
+            )
         except TypeError as e:
             raise NotFound(
                 "Your CI provider is not compatible with tokenless uploads, please upload using your repository token to resolve this."
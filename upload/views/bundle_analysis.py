@@ -20,6 +20,7 @@ from codecov_auth.models import Owner, Service
 from core.models import Commit
 from reports.models import CommitReport
 from services.archive import ArchiveService
+from services.bundle_analysis import prefetch_parent_report
 from services.redis_configuration import get_redis_connection
 from upload.helpers import dispatch_upload_task, generate_upload_sentry_metrics_tags
 from upload.views.base import ShelterMixin
@@ -132,6 +133,9 @@ class BundleAnalysisView(APIView, ShelterMixin):
             get_redis_connection(),
             report_type=CommitReport.ReportType.BUNDLE_ANALYSIS,
         )
+        # the new report will be compared against its parent's
+        prefetch_parent_report(commit)
+
         sentry_metrics.incr(
             "upload",
             tags=generate_upload_sentry_metrics_tags(
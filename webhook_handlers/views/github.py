@@ -14,6 +14,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from shared.metrics import metrics
 
+from codecov_auth.authentication.token_cache import invalidate_token_lookups
 from codecov_auth.models import (
     GITHUB_APP_INSTALLATION_DEFAULT_NAME,
     GithubAppInstallation,
@@ -500,6 +501,8 @@ class GithubWebhookHandler(APIView):
             owner.integration_id = None
             owner.save()
             owner.repository_set.all().update(using_integration=False, bot=None)
+            # the update doesn't send the repositories' post_save signals
+            invalidate_token_lookups(owner)
             # Deprecated flow - END
             log.info(
                 "Owner deleted app integration",